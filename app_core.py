@@ -0,0 +1,695 @@
+# Plan Financier Familial - État de session, adaptateurs métier et mutations
+# Partagé par app.py et les modules de app_pages (app.py s'exécute comme
+# __main__ et ne peut pas être importé par les pages). Les calculs vivent dans
+# finance_core; ici on leur passe les données et le filtre de la session.
+# Les données lues sont l'instantané partagé par toutes les sessions (plan_partage);
+# les mutations passent par la surcouche de la session puis sont publiées.
+# Aucune dépendance lourde: plotly et xlsxwriter sont importés là où ils servent.
+
+from contextlib import contextmanager
+from datetime import datetime, date
+import copy
+import os
+import atexit
+import tempfile
+
+import streamlit as st
+import numpy as np
+
+from sqlite_storage import SQLiteStorage
+from plan_partage import PlanPartage, Surcouche
+from json_backup import ecrire_sauvegarde
+from rerun_timing import chronometre
+import journal as jr
+import finance_core as fc
+from finance_core import filter_projects
+
+# ============================================================================
+# DONNÉES ET LOGIQUE METIER
+# ============================================================================
+
+@st.cache_resource
+def get_storage():
+    """Moteur SQLite optionnel, partagé par toutes les sessions (PLAN_FINANCIER_DB)"""
+    chemin = os.environ.get('PLAN_FINANCIER_DB')
+    if not chemin:
+        return None
+    return SQLiteStorage(chemin)
+
+@st.cache_resource
+def get_journal():
+    """Journal des mutations optionnel (dossier PLAN_FINANCIER_JOURNAL), partagé par toutes les sessions"""
+    dossier = os.environ.get('PLAN_FINANCIER_JOURNAL')
+    if not dossier:
+        return None
+    journal = jr.Journal(dossier, cle_revenu=get_revenu_id)
+    atexit.register(journal.fermer)
+    return journal
+
+def journaliser(type_evenement, donnees):
+    """Ajoute une mutation au journal (écriture groupée en arrière-plan)"""
+    journal = get_journal()
+    if journal is not None:
+        journal.enregistrer(type_evenement, donnees)
+
+def charger_donnees_initiales():
+    """(projets, revenus, admin_config) au démarrage: journal, sinon SQLite, sinon démonstration"""
+    storage = get_storage()
+    journal = get_journal()
+    projets = revenus = admin_config = None
+
+    # Journal: dernier snapshot + rejeu de la fin du journal (prioritaire sur SQLite)
+    if journal is not None and not journal.est_vide():
+        projets, revenus, admin_config = journal.etat()
+
+    # Données persistées: les données de démonstration ne sont insérées qu'une fois
+    if storage is not None:
+        if projets is None and storage.compter('projets') > 0:
+            projets = storage.charger_projets()
+        if revenus is None and storage.compter('revenus_variables') > 0:
+            revenus = storage.charger_revenus()
+
+    if projets is None:
+        projets = [
+            {
+                'id': 1,
+                'nom': 'Titre foncier Mejeuh',
+                'type': 'Actif générateur',
+                'montant_total': 2815000,
+                'budget_alloue_mensuel': 200000,
+                'montant_utilise_reel': 50000,
+                'cash_flow_mensuel': 0,
+                'statut': 'En cours',
+                'echeance': date(2025, 6, 30),
+                'roi_attendu': 12,
+                'priorite': 'Haute',
+                'description': 'Acquisition terrain pour location future',
+                'source_financement': 'Salaire William',
+                'responsable': 'Alix',
+                'date_creation': datetime(2025, 1, 15),
+                'date_modification': datetime(2025, 2, 10),
+                'suivi_mensuel': [
+                    {'mois': '2025-01', 'prevu': 200000, 'reel': 50000}
+                ]
+            },
+            {
+                'id': 2,
+                'nom': 'Voyage enfants Suisse',
+                'type': 'Passif',
+                'montant_total': 8189592,
+                'budget_alloue_mensuel': 680000,
+                'montant_utilise_reel': 0,
+                'cash_flow_mensuel': -680000,
+                'statut': 'Planifié',
+                'echeance': date(2025, 8, 15),
+                'roi_attendu': 0,
+                'priorite': 'Moyenne',
+                'description': 'Voyage familial cohésion',
+                'source_financement': 'Salaire William',
+                'responsable': 'William',
+                'date_creation': datetime(2025, 1, 20),
+                'date_modification': datetime(2025, 1, 20),
+                'suivi_mensuel': []
+            },
+            {
+                'id': 3,
+                'nom': 'Scolarité enfants',
+                'type': 'Investissement formation',
+                'montant_total': 6500000,
+                'budget_alloue_mensuel': 542000,
+                'montant_utilise_reel': 1084000,
+                'cash_flow_mensuel': -542000,
+                'statut': 'En cours',
+                'echeance': date(2025, 12, 31),
+                'roi_attendu': 25,
+                'priorite': 'Critique',
+                'description': 'Éducation Uriel, Naelle, Nell-Henri',
+                'source_financement': 'Revenus IIBA',
+                'responsable': 'Alix',
+                'date_creation': datetime(2024, 12, 1),
+                'date_modification': datetime(2025, 2, 15),
+                'suivi_mensuel': [
+                    {'mois': '2025-01', 'prevu': 542000, 'reel': 542000},
+                    {'mois': '2025-02', 'prevu': 542000, 'reel': 542000}
+                ]
+            },
+            {
+                'id': 4,
+                'nom': 'Projet IIBA',
+                'type': 'Actif générateur',
+                'montant_total': 2786480,
+                'budget_alloue_mensuel': 100000,
+                'montant_utilise_reel': 150000,
+                'cash_flow_mensuel': 232000,
+                'statut': 'Développement',
+                'echeance': date(2025, 3, 30),
+                'roi_attendu': 18,
+                'priorite': 'Critique',
+                'description': 'Business génération revenus passifs',
+                'source_financement': 'Épargne',
+                'responsable': 'William',
+                'date_creation': datetime(2024, 11, 10),
+                'date_modification': datetime(2025, 2, 8),
+                'suivi_mensuel': [
+                    {'mois': '2025-01', 'prevu': 100000, 'reel': 75000},
+                    {'mois': '2025-02', 'prevu': 100000, 'reel': 75000}
+                ]
+            }
+        ]
+        if storage is not None:
+            storage.enregistrer_projets(projets)
+
+    if revenus is None:
+        revenus = [
+            {
+                'id': 1,
+                'nom': 'Salaire William',
+                'montant_mensuel': 800000,
+                'type': 'Salaire',
+                'regulier': True,
+                'responsable': 'William',
+                'date_creation': datetime(2024, 12, 1),
+                'date_modification': datetime(2025, 1, 1)
+            },
+            {
+                'id': 2,
+                'nom': 'Revenus IIBA',
+                'montant_mensuel': 232000,
+                'type': 'Business',
+                'regulier': False,
+                'responsable': 'William',
+                'date_creation': datetime(2025, 1, 15),
+                'date_modification': datetime(2025, 2, 1)
+            },
+            {
+                'id': 3,
+                'nom': 'Épargne',
+                'montant_mensuel': 50000,
+                'type': 'Épargne',
+                'regulier': True,
+                'responsable': 'Alix',
+                'date_creation': datetime(2024, 12, 1),
+                'date_modification': datetime(2024, 12, 1)
+            }
+        ]
+        if storage is not None:
+            storage.enregistrer_revenus(revenus)
+
+    # Configuration Admin
+    if admin_config is None:
+        admin_config = {
+            'kpis_config': {
+                'objectif_cash_flow': 500000,
+                'objectif_ratio_actifs': 40,
+                'objectif_revenus_passifs': 30,
+                'objectif_fonds_urgence': 6
+            },
+            'listes_config': {
+                'types_projet': ['Actif générateur', 'Passif', 'Investissement formation'],
+                'statuts_projet': ['Planifié', 'En cours', 'Développement', 'Réalisé', 'Suspendu'],
+                'priorites': ['Critique', 'Haute', 'Moyenne', 'Faible'],
+                'types_revenu': ['Salaire', 'Business', 'Loyer', 'Investissement', 'Autre'],
+                'responsables': ['Alix', 'William', 'Famille']
+            },
+            'mentors_conseils': {
+                'Kiyosaki': {
+                    'Actif générateur': 'Excellent ! Cet actif génère des revenus passifs et vous rapproche du quadrant I (Investisseur).',
+                    'Passif': 'Ce passif retire de l argent de votre poche. Est-il vraiment nécessaire ?',
+                    'Investissement formation': 'L éducation est un actif qui génère des revenus futurs plus élevés.'
+                },
+                'Buffett': {
+                    'Actif générateur': 'Assurez-vous de comprendre parfaitement ce business et son potentiel long terme.',
+                    'Passif': 'Quel est le coût d opportunité ? Cet argent pourrait-il être mieux investi ?',
+                    'Investissement formation': 'Le meilleur investissement est en vous-même et votre famille.'
+                },
+                'Ramsey': {
+                    'Actif générateur': 'Si ce projet ne vous endette pas excessivement, c est excellent pour votre indépendance.',
+                    'Passif': 'Vérifiez que cet investissement respecte votre budget 50/30/20.',
+                    'Investissement formation': 'L éducation est toujours rentable à long terme.'
+                }
+            }
+        }
+
+    # Premier démarrage avec journal: état initial en snapshot
+    if journal is not None and journal.est_vide():
+        journal.enregistrer(jr.REMPLACEMENT, {'projets': projets, 'revenus': revenus, 'admin_config': admin_config})
+        journal.ecrire_snapshot()
+
+    return projets, revenus, admin_config
+
+@st.cache_resource
+def get_plan():
+    """Instantané du plan et caches d'agrégats / figures, partagés par toutes les sessions"""
+    return PlanPartage(*charger_donnees_initiales(), cle_revenu=get_revenu_id)
+
+def attacher_instantane(instantane):
+    """La session lit cet instantané; sa configuration Admin en est une copie privée"""
+    st.session_state.instantane = instantane
+    st.session_state.projets = instantane.projets
+    st.session_state.revenus_variables = instantane.revenus
+    # Copie resynchronisée seulement quand une configuration a été publiée
+    if st.session_state.get('config_base') is not instantane.admin_config:
+        st.session_state.admin_config = copy.deepcopy(instantane.admin_config)
+        st.session_state.config_base = instantane.admin_config
+
+@chronometre
+def initialize_session_state():
+    """Rattache la session au dernier instantané partagé et initialise ses filtres"""
+    attacher_instantane(get_plan().instantane())
+
+    # Filtre global mois/année avec option "Tout"
+    if 'filter_month' not in st.session_state:
+        st.session_state.filter_month = "Tout"
+
+    if 'filter_year' not in st.session_state:
+        st.session_state.filter_year = "Tout"
+
+def safe_get(dict_obj, key, default='N/A'):
+    """Récupère une valeur de dictionnaire de manière sécurisée"""
+    return dict_obj.get(key, default)
+
+@chronometre
+def filter_data_by_period(data_list, date_field):
+    """Filtre les données selon la période sélectionnée"""
+    return fc.filter_data_by_period(
+        data_list, date_field, st.session_state.filter_year, st.session_state.filter_month
+    )
+
+
+def version_donnees():
+    """Version courante des données (change à chaque mutation des projets ou revenus)"""
+    return (st.session_state.projets.version, st.session_state.revenus_variables.version)
+
+def memoiser(nom, calcul, par_periode=True):
+    """Mémoïse un agrégat par (version des données, filtre mois/année)"""
+    if par_periode:
+        filtre = (st.session_state.filter_month, st.session_state.filter_year)
+    else:
+        filtre = ("Tout", "Tout")
+    return get_plan().cache_aggregats.obtenir(nom, version_donnees(), filtre, calcul)
+
+def taille_figure(fig):
+    """Taille de la spécification JSON d'une figure (budget du cache)"""
+    import plotly.io as pio
+    return len(pio.to_json(fig, validate=False))
+
+def figure_memoisee(graphique, construire, par_periode=True):
+    """Figure Plotly mémoïsée par (graphique, version des données, filtre), servie telle quelle si rien n'a changé"""
+    if par_periode:
+        filtre = (st.session_state.filter_month, st.session_state.filter_year)
+    else:
+        filtre = ("Tout", "Tout")
+    return get_plan().cache_figures.obtenir(graphique, version_donnees(), filtre, construire, mesurer=taille_figure)
+
+@chronometre
+def calculer_kpis():
+    """Calcule les KPIs en temps réel avec filtrage par période (lecture O(1) du moteur incrémental)"""
+    return memoiser('kpis', lambda: fc.construire_kpis(
+        st.session_state.instantane.kpis.totaux(st.session_state.filter_year, st.session_state.filter_month)
+    ))
+
+def calculer_kpis_complet():
+    """Recalcul complet (vectorisé) des KPIs, référence pour le moteur incrémental"""
+    return fc.calculer_kpis(
+        st.session_state.projets, st.session_state.revenus_variables,
+        st.session_state.filter_year, st.session_state.filter_month
+    )
+
+def verifier_coherence_kpis(tolerance=1e-6):
+    """Compare le moteur incrémental au recalcul complet; reconstruit le moteur en cas d'écart"""
+    incremental = calculer_kpis()
+    complet = calculer_kpis_complet()
+
+    ecarts = {}
+    for cle, valeur in complet.items():
+        valeur_inc = incremental[cle]
+        if isinstance(valeur, str):
+            if valeur != valeur_inc:
+                ecarts[cle] = (valeur_inc, valeur)
+        elif abs(valeur - valeur_inc) > tolerance * max(1.0, abs(valeur)):
+            ecarts[cle] = (valeur_inc, valeur)
+
+    if ecarts:
+        attacher_instantane(get_plan().reconstruire_kpis())
+    return ecarts
+
+def projection_cash_flow():
+    """Éventail Monte Carlo du cash flow cumulé jusqu'en 2030 (plan complet, mémoïsé par version des données)"""
+    debut = date.today().replace(day=1)
+    return memoiser(('projection_cash_flow', debut), lambda: fc.projection_cash_flow(
+        st.session_state.projets, st.session_state.revenus_variables, debut=debut
+    ), par_periode=False)
+
+def prevision_revenus(fin, nb_mois=12):
+    """Revenus de la période, sources x mois sur les nb_mois finissant à fin: historique ou prévision (mémoïsé)"""
+    def calcul():
+        revenus = filter_data_by_period(st.session_state.revenus_variables, 'date_creation')
+        dernier = np.datetime64(fin, 'M')
+        return fc.prevision_revenus(revenus, np.arange(dernier - nb_mois + 1, dernier + 1))
+
+    return memoiser(('prevision_revenus', fin, nb_mois), calcul)
+
+def objectif_2030():
+    """Grille du solveur Vision 2030 sur le plan complet (mémoïsée par version des données)"""
+    aujourd_hui = date.today().replace(day=1)
+    return memoiser(('objectif_2030', aujourd_hui), lambda: fc.grille_objectif_2030(
+        st.session_state.projets, st.session_state.revenus_variables, aujourd_hui
+    ), par_periode=False)
+
+def base_scenarios():
+    """Plan de base des scénarios what-if pour la période (mémoïsé par version des données)"""
+    debut = date.today().replace(day=1)
+    return memoiser(('base_scenarios', debut), lambda: fc.preparer_base(
+        st.session_state.projets, st.session_state.revenus_variables,
+        st.session_state.filter_year, st.session_state.filter_month, debut=debut
+    ))
+
+@st.cache_resource
+def get_pool_scenarios():
+    """Pool de processus des balayages de scénarios, démarré une fois par serveur (forkserver)"""
+    return fc.creer_pool()
+
+def evaluer_scenarios(variantes):
+    """Résultats des variantes what-if (mémoïsés par version des données, filtre et liste des variantes)"""
+    cle = tuple(
+        (v['nom'], tuple((m['action'], m['cible'], m['valeur']) for m in v['modifications'])) for v in variantes
+    )
+    return memoiser(('scenarios', cle), lambda: fc.evaluer_scenarios(
+        base_scenarios(), variantes, obtenir_pool=get_pool_scenarios
+    ))
+
+def optimiser_allocations():
+    """Versements mensuels optimisés par projet sur l'horizon (plan complet, mémoïsé par version des données)"""
+    debut = date.today().replace(day=1)
+    priorites = tuple(st.session_state.admin_config['listes_config']['priorites'])
+    return memoiser(('allocations', debut, priorites), lambda: fc.optimiser_allocations(
+        st.session_state.projets, st.session_state.revenus_variables, debut=debut, priorites=priorites
+    ), par_periode=False)
+
+def verifier_allocations():
+    """Budgets alloués comparés à la capacité de chaque source de revenus (mémoïsé)"""
+    return memoiser('verification_allocations', lambda: fc.verifier_allocations(
+        st.session_state.projets, st.session_state.revenus_variables
+    ), par_periode=False)
+
+def format_currency(amount):
+    """Formate un montant en FCFA"""
+    return f"{amount:,.0f} FCFA".replace(",", " ")
+
+def categoriser_projets():
+    """Lignes du store par catégorie Kanban pour la période"""
+    def calcul():
+        return fc.categoriser_projets(
+            st.session_state.projets, st.session_state.filter_year, st.session_state.filter_month
+        )
+
+    # La catégorie dépend aussi de la date du jour
+    return memoiser(('kanban', date.today()), calcul)
+
+def get_sources_financement():
+    """Retourne la liste des sources de financement disponibles"""
+    return fc.get_sources_financement(st.session_state.revenus_variables)
+
+def rechercher_projets(filter_type, filter_status, filter_priority, sort_by):
+    """Projets de la période filtrés et triés (requête SQL indexée si le moteur est actif)"""
+    storage = get_storage()
+    if storage is not None:
+        ids = storage.rechercher_projets(
+            st.session_state.filter_year, st.session_state.filter_month,
+            filter_type, filter_status, filter_priority, sort_by
+        )
+        return st.session_state.projets.par_ids(ids)
+
+    projets_base = filter_data_by_period(st.session_state.projets, 'date_creation')
+    return filter_projects(projets_base, filter_type, filter_status, filter_priority, sort_by)
+
+
+# ============================================================================
+# MUTATIONS (surcouche de session + persistance, puis publication)
+# ============================================================================
+
+def surcouche():
+    """Surcouche copie-à-l'écriture de la session, créée à la première modification"""
+    if st.session_state.get('surcouche') is None:
+        st.session_state.surcouche = Surcouche(st.session_state.instantane, cle_revenu=get_revenu_id)
+    return st.session_state.surcouche
+
+def publier():
+    """Publie la surcouche comme nouvel instantané partagé (différé jusqu'à la fin d'un lot)"""
+    if st.session_state.get('mutations_en_lot') or st.session_state.get('surcouche') is None:
+        return
+    modifications, st.session_state.surcouche = st.session_state.surcouche, None
+    if not modifications.est_vide():
+        attacher_instantane(get_plan().publier(modifications))
+
+@contextmanager
+def lot_de_mutations():
+    """Regroupe plusieurs mutations en une seule publication (imports)"""
+    st.session_state.mutations_en_lot = st.session_state.get('mutations_en_lot', 0) + 1
+    try:
+        yield
+    finally:
+        st.session_state.mutations_en_lot -= 1
+        publier()
+
+def ajouter_projet(projet):
+    """Ajoute un projet à la session et au stockage persistant"""
+    surcouche().ajouter_projet(projet)
+    journaliser(jr.PROJET, projet)
+    storage = get_storage()
+    if storage is not None:
+        storage.enregistrer_projet(projet)
+    publier()
+
+def modifier_projet(projet_id, champs):
+    """Met à jour les champs d'un projet existant"""
+    projet = surcouche().projet(projet_id)
+    if projet is None:
+        return None
+    projet.update(champs)
+    journaliser(jr.PROJET, projet)
+    storage = get_storage()
+    if storage is not None:
+        storage.enregistrer_projet(projet)
+    publier()
+    return projet
+
+def supprimer_projet(projet_id):
+    """Supprime un projet (et son suivi mensuel)"""
+    surcouche().supprimer_projet(projet_id)
+    journaliser(jr.PROJET_SUPPRIME, projet_id)
+    storage = get_storage()
+    if storage is not None:
+        storage.supprimer_projet(projet_id)
+    publier()
+
+def enregistrer_suivi(projet_id, mois, prevu, reel):
+    """Ajoute ou met à jour l'entrée de suivi d'un mois et recalcule le montant utilisé"""
+    return fusionner_suivi(projet_id, {mois: {'prevu': prevu, 'reel': reel}})
+
+def fusionner_suivi(projet_id, entrees):
+    """Fusionne des entrées de suivi {mois: {'prevu': .., 'reel': ..}} dans un projet
+
+    Les mois existants sont mis à jour, les nouveaux mois sont ajoutés (prévu par
+    défaut: budget alloué mensuel). Le montant utilisé réel est recalculé une fois.
+    """
+    projet = surcouche().projet(projet_id)
+    if projet is None:
+        return None
+
+    if 'suivi_mensuel' not in projet:
+        projet['suivi_mensuel'] = []
+
+    suivi_par_mois = {s['mois']: s for s in projet['suivi_mensuel']}
+    for mois, valeurs in entrees.items():
+        if mois in suivi_par_mois:
+            # Mettre à jour
+            suivi_par_mois[mois].update(valeurs)
+        else:
+            # Ajouter nouveau
+            suivi = {'mois': mois, 'prevu': projet['budget_alloue_mensuel'], 'reel': 0}
+            suivi.update(valeurs)
+            projet['suivi_mensuel'].append(suivi)
+            suivi_par_mois[mois] = suivi
+
+    # Mettre à jour le montant utilisé réel et date modification
+    projet.update({
+        'montant_utilise_reel': sum(s['reel'] for s in projet['suivi_mensuel']),
+        'date_modification': datetime.now()
+    })
+    journaliser(jr.PROJET, projet)
+
+    storage = get_storage()
+    if storage is not None:
+        storage.enregistrer_suivis(
+            projet_id,
+            [(mois, suivi_par_mois[mois]['prevu'], suivi_par_mois[mois]['reel']) for mois in entrees],
+            projet['montant_utilise_reel'],
+            projet['date_modification']
+        )
+    publier()
+    return projet
+
+def enregistrer_config():
+    """Journalise et publie la configuration Admin après modification"""
+    surcouche().admin_config = st.session_state.admin_config
+    journaliser(jr.CONFIG, st.session_state.admin_config)
+    publier()
+
+def get_revenu_id(revenu):
+    """Identifiant d'un revenu (repli sur le nom pour les anciennes données)"""
+    return safe_get(revenu, 'id', f"rev_{revenu['nom'].replace(' ', '_')}")
+
+def ajouter_revenu(revenu):
+    """Ajoute un revenu variable à la session et au stockage persistant"""
+    surcouche().ajouter_revenu(revenu)
+    journaliser(jr.REVENU, revenu)
+    storage = get_storage()
+    if storage is not None:
+        storage.enregistrer_revenu(revenu)
+    publier()
+
+def modifier_revenu(id_revenu, champs):
+    """Met à jour les champs d'un revenu existant"""
+    revenu = surcouche().revenu(id_revenu)
+    if revenu is None:
+        return None
+    revenu.update(champs)
+    journaliser(jr.REVENU, revenu)
+    storage = get_storage()
+    if storage is not None:
+        storage.enregistrer_revenu(revenu)
+    publier()
+    return revenu
+
+def supprimer_revenu(id_revenu):
+    """Supprime un revenu variable"""
+    if surcouche().revenu(id_revenu) is None:
+        return
+    surcouche().supprimer_revenu(id_revenu)
+    journaliser(jr.REVENU_SUPPRIME, id_revenu)
+    storage = get_storage()
+    if storage is not None:
+        storage.supprimer_revenu(id_revenu)
+    publier()
+
+def remplacer_donnees(projets=None, revenus=None, admin_config=None):
+    """Remplace en masse projets, revenus et/ou configuration (import), puis reconstruit les agrégats"""
+    storage = get_storage()
+    if storage is not None:
+        if projets is not None:
+            storage.remplacer_projets(projets)
+        if revenus is not None:
+            storage.remplacer_revenus(revenus)
+    if admin_config is not None:
+        st.session_state.admin_config.update(admin_config)
+
+    journaliser(jr.REMPLACEMENT, {
+        'projets': projets,
+        'revenus': revenus,
+        'admin_config': None if admin_config is None else st.session_state.admin_config
+    })
+
+    # Les modifications non publiées sont remplacées elles aussi
+    st.session_state.surcouche = None
+    attacher_instantane(get_plan().remplacer(
+        projets, revenus, None if admin_config is None else st.session_state.admin_config
+    ))
+
+def appliquer_import_transactions(resultat):
+    """Reporte les agrégats d'un import de transactions dans le suivi des projets et les revenus"""
+    # Une seule publication de l'instantané pour tout l'import
+    with lot_de_mutations():
+        projets_par_nom = {p['nom']: p for p in st.session_state.projets}
+        projets_maj = 0
+        projets_inconnus = []
+
+        # Dépenses -> suivi mensuel (montant réel du mois, ré-import idempotent)
+        for nom_projet, lignes in resultat['depenses'].groupby('projet', sort=False):
+            projet = projets_par_nom.get(nom_projet)
+            if projet is None:
+                projets_inconnus.append(nom_projet)
+                continue
+            fusionner_suivi(projet['id'], {
+                mois: {'reel': float(montant)} for mois, montant in zip(lignes['mois'], lignes['montant'])
+            })
+            projets_maj += 1
+
+        # Revenus -> revenus variables (montant mensuel moyen + historique)
+        revenus_par_nom = {r['nom']: r for r in st.session_state.revenus_variables}
+        types_revenu = st.session_state.admin_config['listes_config']['types_revenu']
+        revenus_crees = 0
+        revenus_maj = 0
+        # Identifiants attribués d'avance: les ajouts du lot ne sont publiés qu'à la fin
+        existing_ids = [safe_get(r, 'id', 0) for r in st.session_state.revenus_variables]
+        nouvel_id = max([id for id in existing_ids if isinstance(id, int)], default=0)
+
+        for source, lignes in resultat['revenus'].groupby('source', sort=False):
+            montants = lignes['montant'].to_numpy()
+            historique = [{'mois': m, 'montant': float(v)} for m, v in zip(lignes['mois'], montants)]
+            moyenne = float(montants.mean())
+
+            revenu = revenus_par_nom.get(source)
+            if revenu is not None:
+                historique_existant = {h['mois']: h for h in revenu.get('historique_mensuel', [])}
+                historique_existant.update({h['mois']: h for h in historique})
+                modifier_revenu(get_revenu_id(revenu), {
+                    'montant_mensuel': moyenne,
+                    'historique_mensuel': sorted(historique_existant.values(), key=lambda h: h['mois']),
+                    'date_modification': datetime.now()
+                })
+                revenus_maj += 1
+            else:
+                categorie = resultat['categories_revenus'].get(source, 'Autre')
+                ecart_relatif = float(montants.std() / moyenne) if moyenne > 0 else 0
+                nouvel_id += 1
+                ajouter_revenu({
+                    'id': nouvel_id,
+                    'nom': source,
+                    'montant_mensuel': moyenne,
+                    'type': categorie if categorie in types_revenu else 'Autre',
+                    'regulier': len(montants) >= 2 and ecart_relatif < 0.1,
+                    'responsable': 'Famille',
+                    'date_creation': datetime.strptime(historique[0]['mois'], '%Y-%m'),
+                    'date_modification': datetime.now(),
+                    'historique_mensuel': historique
+                })
+                revenus_crees += 1
+
+        return {
+            'projets_maj': projets_maj,
+            'projets_inconnus': projets_inconnus,
+            'revenus_crees': revenus_crees,
+            'revenus_maj': revenus_maj
+        }
+
+def sauvegarder_json(chemin=None, compact=False, compresser=False):
+    """Écrit la sauvegarde JSON (en flux, sans modifier la session) dans un fichier temporaire par défaut"""
+    if chemin is None:
+        descripteur, chemin = tempfile.mkstemp(
+            prefix="sauvegarde_plan_financier_", suffix=".json.gz" if compresser else ".json"
+        )
+        os.close(descripteur)
+    return ecrire_sauvegarde(
+        chemin,
+        st.session_state.projets,
+        st.session_state.revenus_variables,
+        st.session_state.admin_config,
+        compact=compact,
+        compresser=compresser
+    )
+
+
+@chronometre
+def export_to_excel(chemin=None):
+    """Exporte toutes les données vers un fichier Excel (écriture en flux, fichier temporaire par défaut)"""
+    if chemin is None:
+        descripteur, chemin = tempfile.mkstemp(prefix="plan_financier_", suffix=".xlsx")
+        os.close(descripteur)
+    return fc.export_to_excel(
+        chemin,
+        st.session_state.projets,
+        st.session_state.revenus_variables,
+        st.session_state.admin_config,
+        kpis=calculer_kpis()
+    )
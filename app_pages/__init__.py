@@ -0,0 +1,37 @@
+# Plan Financier Familial - Registre des pages
+# Chaque page vit dans son propre module, importé à sa première visite puis
+# conservé dans sys.modules: plotly et pandas ne sont chargés qu'avec les pages
+# qui les utilisent.
+
+import importlib
+
+from rerun_timing import CHRONO
+
+# Libellé de navigation -> (module de app_pages, fonction d'affichage)
+PAGES = {
+    "📊 Dashboard Principal": ('dashboard', 'show_dashboard'),
+    "📋 Vue Kanban Projets": ('kanban', 'show_kanban_view'),
+    "💼 Gestion Projets": ('projets', 'show_project_management'),
+    "💰 Revenus Variables": ('revenus', 'show_revenue_management'),
+    "🎯 Conseils 3 Mentors": ('mentors', 'show_mentor_advice'),
+    "📈 Analytics & KPIs": ('analytics', 'show_analytics'),
+    "🧪 Scénarios What-If": ('scenarios', 'show_scenarios'),
+    "🚀 Progression Familiale": ('progression', 'show_progression'),
+    "👨‍👩‍👧‍👦 Éducation Enfants": ('education', 'show_children_education'),
+    "🔮 Vision 2030": ('vision_2030', 'show_vision_2030'),
+    "⚙️ Administration": ('admin', 'show_admin'),
+}
+
+
+def charger_page(libelle):
+    """Fonction d'affichage de la page (module importé à la première demande)"""
+    module, fonction = PAGES[libelle]
+    return getattr(importlib.import_module(f"{__name__}.{module}"), fonction)
+
+
+def afficher_page(libelle):
+    """Affiche la page; sa durée est relevée sous le nom de sa fonction show_*"""
+    CHRONO.definir_page(libelle)
+    page = charger_page(libelle)
+    with CHRONO.mesurer(page.__name__):
+        page()
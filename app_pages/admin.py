@@ -0,0 +1,610 @@
+# Plan Financier Familial - Page Administration
+# KPIs, listes, mentors, export / import et statistiques. pandas et plotly sont
+# chargés avec la page (statistiques, activité, performances); les lecteurs Excel
+# et CSV (excel_import avec openpyxl, transactions_import) ne sont importés qu'au
+# moment de l'import.
+
+from datetime import datetime
+import os
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from json_backup import lire_sauvegarde
+from rerun_timing import CHRONO
+from app_core import (
+    get_journal, get_plan, safe_get, memoiser, figure_memoisee, verifier_coherence_kpis,
+    format_currency, enregistrer_config, remplacer_donnees,
+    appliquer_import_transactions, sauvegarder_json, export_to_excel,
+)
+
+def show_admin():
+    """Page Administration complète"""
+    st.title("⚙️ Administration du Système")
+    st.markdown("Configuration avancée des paramètres, listes et conseils des mentors")
+
+    # Navigation admin
+    admin_tabs = st.tabs([
+        "🎯 KPIs & Objectifs", 
+        "📋 Listes & Vocabulaire", 
+        "🧠 Conseils Mentors",
+        "📊 Export/Import Données",
+        "📈 Statistiques Système",
+        "⏱️ Performance"
+    ])
+
+    with admin_tabs[0]:
+        show_admin_kpis()
+
+    with admin_tabs[1]:
+        show_admin_listes()
+
+    with admin_tabs[2]:
+        show_admin_mentors()
+
+    with admin_tabs[3]:
+        show_admin_export_import()
+
+    with admin_tabs[4]:
+        show_admin_stats()
+
+    with admin_tabs[5]:
+        show_admin_performance()
+
+def show_admin_kpis():
+    """Configuration des KPIs et objectifs"""
+    st.subheader("🎯 Configuration des KPIs et Objectifs")
+
+    with st.form("admin_kpis_form"):
+        st.markdown("### 💰 Objectifs Financiers")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            objectif_cash_flow = st.number_input(
+                "Objectif Cash Flow Mensuel (FCFA)",
+                value=st.session_state.admin_config['kpis_config']['objectif_cash_flow'],
+                step=100000
+            )
+
+            objectif_ratio_actifs = st.number_input(
+                "Objectif Ratio Actifs/Total (%)",
+                value=st.session_state.admin_config['kpis_config']['objectif_ratio_actifs'],
+                min_value=0,
+                max_value=100
+            )
+
+        with col2:
+            objectif_revenus_passifs = st.number_input(
+                "Objectif Revenus Passifs (%)",
+                value=st.session_state.admin_config['kpis_config']['objectif_revenus_passifs'],
+                min_value=0,
+                max_value=100
+            )
+
+            objectif_fonds_urgence = st.number_input(
+                "Objectif Fonds d'Urgence (mois)",
+                value=st.session_state.admin_config['kpis_config']['objectif_fonds_urgence'],
+                min_value=0,
+                max_value=12
+            )
+
+        if st.form_submit_button("💾 Sauvegarder KPIs", type="primary"):
+            st.session_state.admin_config['kpis_config'].update({
+                'objectif_cash_flow': objectif_cash_flow,
+                'objectif_ratio_actifs': objectif_ratio_actifs,
+                'objectif_revenus_passifs': objectif_revenus_passifs,
+                'objectif_fonds_urgence': objectif_fonds_urgence
+            })
+            enregistrer_config()
+            st.success("✅ Configuration KPIs sauvegardée!")
+            st.rerun()
+
+def show_admin_listes():
+    """Configuration des listes et vocabulaire"""
+    st.subheader("📋 Configuration des Listes et Vocabulaire")
+
+    # Types de projet
+    with st.expander("🏗️ Types de Projets", expanded=False):
+        with st.form("admin_types_form"):
+            types_actuels = st.session_state.admin_config['listes_config']['types_projet']
+
+            st.write("**Types actuels:**")
+            for i, type_p in enumerate(types_actuels):
+                st.write(f"• {type_p}")
+
+            nouveau_type = st.text_input("Ajouter un nouveau type")
+            type_a_supprimer = st.selectbox("Supprimer un type", ["Aucun"] + types_actuels)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.form_submit_button("➕ Ajouter"):
+                    if nouveau_type and nouveau_type not in types_actuels:
+                        st.session_state.admin_config['listes_config']['types_projet'].append(nouveau_type)
+                        enregistrer_config()
+                        st.success(f"Type '{nouveau_type}' ajouté!")
+                        st.rerun()
+
+            with col2:
+                if st.form_submit_button("🗑️ Supprimer"):
+                    if type_a_supprimer != "Aucun":
+                        st.session_state.admin_config['listes_config']['types_projet'].remove(type_a_supprimer)
+                        enregistrer_config()
+                        st.success(f"Type '{type_a_supprimer}' supprimé!")
+                        st.rerun()
+
+    # Statuts de projet
+    with st.expander("📊 Statuts de Projets", expanded=False):
+        with st.form("admin_statuts_form"):
+            statuts_actuels = st.session_state.admin_config['listes_config']['statuts_projet']
+
+            st.write("**Statuts actuels:**")
+            for statut in statuts_actuels:
+                st.write(f"• {statut}")
+
+            nouveau_statut = st.text_input("Ajouter un nouveau statut")
+            statut_a_supprimer = st.selectbox("Supprimer un statut", ["Aucun"] + statuts_actuels)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.form_submit_button("➕ Ajouter"):
+                    if nouveau_statut and nouveau_statut not in statuts_actuels:
+                        st.session_state.admin_config['listes_config']['statuts_projet'].append(nouveau_statut)
+                        enregistrer_config()
+                        st.success(f"Statut '{nouveau_statut}' ajouté!")
+                        st.rerun()
+
+            with col2:
+                if st.form_submit_button("🗑️ Supprimer"):
+                    if statut_a_supprimer != "Aucun":
+                        st.session_state.admin_config['listes_config']['statuts_projet'].remove(statut_a_supprimer)
+                        enregistrer_config()
+                        st.success(f"Statut '{statut_a_supprimer}' supprimé!")
+                        st.rerun()
+
+    # Responsables
+    with st.expander("👤 Responsables", expanded=False):
+        with st.form("admin_responsables_form"):
+            responsables_actuels = st.session_state.admin_config['listes_config']['responsables']
+
+            st.write("**Responsables actuels:**")
+            for resp in responsables_actuels:
+                st.write(f"• {resp}")
+
+            nouveau_responsable = st.text_input("Ajouter un nouveau responsable")
+            responsable_a_supprimer = st.selectbox("Supprimer un responsable", ["Aucun"] + responsables_actuels)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.form_submit_button("➕ Ajouter"):
+                    if nouveau_responsable and nouveau_responsable not in responsables_actuels:
+                        st.session_state.admin_config['listes_config']['responsables'].append(nouveau_responsable)
+                        enregistrer_config()
+                        st.success(f"Responsable '{nouveau_responsable}' ajouté!")
+                        st.rerun()
+
+            with col2:
+                if st.form_submit_button("🗑️ Supprimer"):
+                    if responsable_a_supprimer != "Aucun":
+                        st.session_state.admin_config['listes_config']['responsables'].remove(responsable_a_supprimer)
+                        enregistrer_config()
+                        st.success(f"Responsable '{responsable_a_supprimer}' supprimé!")
+                        st.rerun()
+
+def show_admin_mentors():
+    """Configuration des conseils des mentors"""
+    st.subheader("🧠 Configuration des Conseils des Mentors")
+
+    mentors = ["Kiyosaki", "Buffett", "Ramsey"]
+    types_projet = st.session_state.admin_config['listes_config']['types_projet']
+
+    for mentor in mentors:
+        with st.expander(f"🎯 {mentor}", expanded=False):
+            st.markdown(f"### Conseils de {mentor}")
+
+            with st.form(f"admin_mentor_{mentor}_form"):
+                conseils_actuels = st.session_state.admin_config['mentors_conseils'][mentor]
+
+                for type_projet in types_projet:
+                    conseil_actuel = conseils_actuels.get(type_projet, "")
+                    nouveau_conseil = st.text_area(
+                        f"Conseil pour '{type_projet}'",
+                        value=conseil_actuel,
+                        height=100,
+                        key=f"{mentor}_{type_projet}"
+                    )
+
+                    # Mise à jour immédiate
+                    st.session_state.admin_config['mentors_conseils'][mentor][type_projet] = nouveau_conseil
+
+                if st.form_submit_button(f"💾 Sauvegarder conseils {mentor}", type="primary"):
+                    enregistrer_config()
+                    st.success(f"✅ Conseils de {mentor} sauvegardés!")
+                    st.rerun()
+
+def show_admin_export_import():
+    """Export/Import des données"""
+    st.subheader("📊 Export/Import des Données")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 📤 Exporter les Données")
+
+        if st.button("📊 Générer Export Excel", type="primary"):
+            try:
+                with st.spinner("Écriture du classeur..."):
+                    chemin = export_to_excel()
+
+                # Un seul fichier temporaire conservé par session
+                ancien = st.session_state.get('export_excel')
+                if ancien and os.path.exists(ancien['chemin']):
+                    os.remove(ancien['chemin'])
+
+                # Nom du fichier avec timestamp
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+                st.session_state.export_excel = {
+                    'chemin': chemin,
+                    'nom': f"Plan_Financier_Familial_{timestamp}.xlsx"
+                }
+
+                st.success("✅ Export Excel généré avec succès!")
+
+            except Exception as e:
+                st.error(f"❌ Erreur lors de l'export: {str(e)}")
+
+        export = st.session_state.get('export_excel')
+        if export and os.path.exists(export['chemin']):
+            with open(export['chemin'], 'rb') as fichier:
+                st.download_button(
+                    label="💾 Télécharger Excel",
+                    data=fichier,
+                    file_name=export['nom'],
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    type="primary"
+                )
+
+        # Statistiques export
+        st.markdown("### 📈 Contenu de l'Export")
+        st.write(f"• **{len(st.session_state.projets)}** projets")
+        st.write(f"• **{len(st.session_state.revenus_variables)}** revenus")
+        st.write("• **Configuration** complète")
+        st.write("• **KPIs** calculés")
+        st.write("• **Suivi mensuel** détaillé")
+
+    with col2:
+        st.markdown("### 📥 Importer des Données")
+
+        st.info("""
+        **🔄 Import d'un export Excel**
+
+        Les onglets Projets, Revenus, Configuration et Suivi_Mensuel
+        d'un fichier généré par l'export remplacent les données actuelles.
+        """)
+
+        uploaded_file = st.file_uploader(
+            "Choisir un fichier Excel",
+            type=['xlsx'],
+            help="Fichier produit par « Générer Export Excel »"
+        )
+
+        if uploaded_file and st.button("📥 Importer le classeur", type="primary"):
+            try:
+                with st.spinner("Lecture du classeur..."):
+                    from excel_import import lire_classeur
+                    donnees = lire_classeur(uploaded_file)
+                remplacer_donnees(donnees['projets'], donnees['revenus'], donnees['admin_config'])
+
+                st.success(
+                    f"✅ Import terminé: {len(st.session_state.projets)} projets, "
+                    f"{len(st.session_state.revenus_variables)} revenus, "
+                    f"{donnees['entrees_suivi']} entrées de suivi"
+                )
+                if donnees['admin_config'] is None:
+                    st.warning("⚠️ Onglet Configuration absent: configuration actuelle conservée")
+            except Exception as e:
+                st.error(f"❌ Erreur lors de l'import: {str(e)}")
+
+    # Import transactions bancaires / mobile money
+    st.markdown("### 🏦 Import Transactions (CSV)")
+    st.caption("Colonnes attendues: Date, Nature, Categorie, Montant, Source, Projet. "
+               "Les dépenses alimentent le suivi mensuel des projets, les revenus les revenus variables.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fichier_transactions = st.file_uploader("Choisir un export CSV", type=['csv'], key="import_transactions_csv")
+    with col2:
+        chemin_transactions = st.text_input(
+            "Ou chemin d'un fichier sur le serveur",
+            help="Pour les gros exports (plusieurs millions de lignes), lus directement sur disque"
+        )
+
+    source = fichier_transactions if fichier_transactions is not None else chemin_transactions.strip()
+    if st.button("📥 Importer les transactions", disabled=not source):
+        if isinstance(source, str) and not os.path.isfile(source):
+            st.error(f"❌ Fichier introuvable: {source}")
+        else:
+            from transactions_import import agreger_transactions
+            barre = st.progress(0.0, text="Lecture des transactions...")
+            try:
+                resultat = agreger_transactions(
+                    source,
+                    progression=lambda fraction, lignes: barre.progress(
+                        fraction, text=f"Lecture des transactions... {lignes:,} lignes"
+                    )
+                )
+                bilan = appliquer_import_transactions(resultat)
+                barre.progress(1.0, text=f"✅ {resultat['lignes']:,} lignes traitées")
+
+                st.success(
+                    f"✅ Import terminé: {bilan['projets_maj']} projet(s) mis à jour, "
+                    f"{bilan['revenus_maj']} revenu(s) mis à jour, {bilan['revenus_crees']} revenu(s) créé(s)"
+                )
+                if resultat['lignes_ignorees']:
+                    st.warning(f"⚠️ {resultat['lignes_ignorees']:,} ligne(s) ignorée(s) (date ou montant invalide)")
+                if bilan['projets_inconnus']:
+                    st.warning("⚠️ Projets inconnus (dépenses non rattachées): " + ", ".join(bilan['projets_inconnus']))
+            except Exception as e:
+                st.error(f"❌ Erreur lors de l'import: {str(e)}")
+
+    # Sauvegarde JSON
+    st.markdown("### 💾 Sauvegarde Configuration")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        compact = st.checkbox("Format compact", help="Sans indentation, fichier plus petit")
+        compresser = st.checkbox("Compresser (gzip)")
+
+        if st.button("📋 Générer Sauvegarde JSON"):
+            try:
+                with st.spinner("Écriture de la sauvegarde..."):
+                    chemin = sauvegarder_json(compact=compact, compresser=compresser)
+
+                # Un seul fichier temporaire conservé par session
+                ancienne = st.session_state.get('sauvegarde_json')
+                if ancienne and os.path.exists(ancienne['chemin']):
+                    os.remove(ancienne['chemin'])
+
+                extension = ".json.gz" if compresser else ".json"
+                st.session_state.sauvegarde_json = {
+                    'chemin': chemin,
+                    'nom': f"sauvegarde_plan_financier_{datetime.now().strftime('%Y%m%d_%H%M')}{extension}",
+                    'mime': "application/gzip" if compresser else "application/json"
+                }
+            except Exception as e:
+                st.error(f"❌ Erreur lors de la sauvegarde: {str(e)}")
+
+        sauvegarde = st.session_state.get('sauvegarde_json')
+        if sauvegarde and os.path.exists(sauvegarde['chemin']):
+            with open(sauvegarde['chemin'], 'rb') as fichier:
+                st.download_button(
+                    label="💾 Télécharger Sauvegarde JSON",
+                    data=fichier,
+                    file_name=sauvegarde['nom'],
+                    mime=sauvegarde['mime']
+                )
+
+    with col2:
+        fichier_sauvegarde = st.file_uploader("Restaurer une sauvegarde", type=['json', 'gz'])
+
+        if fichier_sauvegarde and st.button("♻️ Restaurer", type="primary"):
+            try:
+                with st.spinner("Restauration..."):
+                    donnees = lire_sauvegarde(fichier_sauvegarde)
+                remplacer_donnees(donnees['projets'], donnees['revenus'], donnees['admin_config'])
+                st.success(
+                    f"✅ Sauvegarde du {donnees['timestamp'] or 'N/A'} restaurée: "
+                    f"{len(st.session_state.projets)} projets, {len(st.session_state.revenus_variables)} revenus"
+                )
+            except Exception as e:
+                st.error(f"❌ Erreur lors de la restauration: {str(e)}")
+
+def compter_statistiques():
+    """Comptages globaux de la page Statistiques Système"""
+    type_counts = {}
+    resp_counts = {}
+    total_suivi = 0
+    total_budget = 0
+
+    for projet in st.session_state.projets:
+        type_p = projet['type']
+        type_counts[type_p] = type_counts.get(type_p, 0) + 1
+        resp = safe_get(projet, 'responsable', 'Non défini')
+        resp_counts[resp] = resp_counts.get(resp, 0) + 1
+        total_suivi += len(projet.get('suivi_mensuel', []))
+        total_budget += projet['montant_total']
+
+    return {
+        'total_projets': len(st.session_state.projets),
+        'total_revenus': len(st.session_state.revenus_variables),
+        'total_suivi': total_suivi,
+        'total_budget': total_budget,
+        'type_counts': type_counts,
+        'resp_counts': resp_counts
+    }
+
+def show_admin_stats():
+    """Statistiques système"""
+    st.subheader("📈 Statistiques du Système")
+
+    # Comptages mémoïsés (indépendants du filtre global)
+    stats = memoiser('admin_stats', compter_statistiques, par_periode=False)
+
+    # Statistiques générales
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("📊 Total Projets", stats['total_projets'])
+
+    with col2:
+        st.metric("💰 Total Revenus", stats['total_revenus'])
+
+    with col3:
+        st.metric("📋 Entrées Suivi", stats['total_suivi'])
+
+    with col4:
+        st.metric("💸 Budget Total", format_currency(stats['total_budget']))
+
+    # Graphiques statistiques
+    st.markdown("### 📊 Répartitions")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Répartition par type
+        type_counts = stats['type_counts']
+
+        if type_counts:
+            fig = figure_memoisee('admin_types', lambda: px.pie(
+                values=list(type_counts.values()),
+                names=list(type_counts.keys()),
+                title="Répartition des Projets par Type"
+            ), par_periode=False)
+            st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Répartition par responsable
+        resp_counts = stats['resp_counts']
+
+        if resp_counts:
+            fig = figure_memoisee('admin_responsables', lambda: px.bar(
+                x=list(resp_counts.keys()),
+                y=list(resp_counts.values()),
+                title="Nombre de Projets par Responsable",
+                labels={'x': 'Responsable', 'y': 'Nombre de projets'}
+            ), par_periode=False)
+            st.plotly_chart(fig, use_container_width=True)
+
+    # Cohérence du moteur KPI incrémental
+    st.markdown("### 🔍 Cohérence des KPIs")
+
+    plan = get_plan()
+    instantane = plan.instantane()
+    st.caption(
+        f"🗂️ Instantané partagé: génération {instantane.generation} "
+        f"(publiée le {datetime.fromtimestamp(instantane.horodatage).strftime('%d/%m/%Y %H:%M:%S')})"
+    )
+    for libelle, cache in (("Cache agrégats", plan.cache_aggregats),
+                           ("Cache figures", plan.cache_figures)):
+        st.caption(
+            f"🗄️ {libelle} (toutes sessions): {len(cache)} entrées, {cache.octets / 1024:.0f} Ko "
+            f"(hits: {cache.hits}, misses: {cache.misses})"
+        )
+
+    if st.button("🔍 Vérifier cohérence KPIs"):
+        ecarts = verifier_coherence_kpis()
+        if ecarts:
+            st.warning(f"⚠️ {len(ecarts)} écart(s) détecté(s), moteur KPI reconstruit.")
+            st.dataframe(
+                pd.DataFrame(
+                    [{'KPI': cle, 'Incrémental': inc, 'Recalcul complet': ref} for cle, (inc, ref) in ecarts.items()]
+                ),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.success("✅ Moteur incrémental cohérent avec le recalcul complet.")
+
+    journal = get_journal()
+    if journal is not None:
+        st.markdown("### 📜 Journal des Mutations")
+        stats = journal.statistiques()
+        st.caption(
+            f"Séquence {stats['seq']} (écrite: {stats['seq_ecrite']}, en attente: {stats['en_attente']}) • "
+            f"dernier snapshot: {stats['seq_snapshot']} • {stats['segments']} segment(s) • "
+            f"{stats['evenements_rejoues']} événement(s) rejoué(s) au démarrage"
+        )
+        if stats['derniere_erreur']:
+            st.warning(f"⚠️ Dernière erreur d'écriture du journal: {stats['derniere_erreur']}")
+        if st.button("📸 Écrire un snapshot"):
+            st.success(f"✅ Snapshot écrit à la séquence {journal.ecrire_snapshot()}")
+
+    # Historique des modifications
+    st.markdown("### 📅 Activité Récente")
+
+    # Combine projets et revenus avec leurs dates de modification
+    activites = []
+
+    for projet in st.session_state.projets:
+        date_modif = safe_get(projet, 'date_modification', datetime.now())
+        if isinstance(date_modif, str):
+            date_modif = datetime.fromisoformat(date_modif)
+        activites.append({
+            'type': 'Projet',
+            'nom': projet['nom'],
+            'date': date_modif,
+            'responsable': safe_get(projet, 'responsable', 'Non défini')
+        })
+
+    for revenu in st.session_state.revenus_variables:
+        date_modif = safe_get(revenu, 'date_modification', datetime.now())
+        if isinstance(date_modif, str):
+            date_modif = datetime.fromisoformat(date_modif)
+        activites.append({
+            'type': 'Revenu',
+            'nom': revenu['nom'],
+            'date': date_modif,
+            'responsable': safe_get(revenu, 'responsable', 'Non défini')
+        })
+
+    # Trier par date de modification (plus récent d'abord)
+    activites.sort(key=lambda x: x['date'], reverse=True)
+
+    # Afficher les 10 plus récentes
+    if activites:
+        df_activites = pd.DataFrame(activites[:10])
+        df_activites['date'] = df_activites['date'].dt.strftime('%d/%m/%Y %H:%M')
+        st.dataframe(df_activites, use_container_width=True, hide_index=True)
+    else:
+        st.info("Aucune activité récente")
+
+def tableau_latences(resumes, libelle, budget_ms=None):
+    """DataFrame p50 / p95 / max (ms) trié par p95 décroissant"""
+    lignes = []
+    for nom, resume in resumes.items():
+        ligne = {libelle: nom, 'Reruns': resume['reruns']}
+        if 'appels_par_rerun' in resume:
+            ligne['Appels / rerun'] = round(resume['appels_par_rerun'], 1)
+        ligne.update({
+            'p50 (ms)': round(resume['p50_ms'], 1),
+            'p95 (ms)': round(resume['p95_ms'], 1),
+            'Max (ms)': round(resume['max_ms'], 1),
+        })
+        if budget_ms is not None:
+            ligne['Budget'] = "✅" if resume['p95_ms'] <= budget_ms else "❌"
+        lignes.append(ligne)
+    return pd.DataFrame(lignes).sort_values('p95 (ms)', ascending=False)
+
+def show_admin_performance():
+    """Latences des reruns (tampon circulaire partagé par les sessions)"""
+    st.subheader("⏱️ Performance des Reruns")
+
+    stats = CHRONO.statistiques()
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        budget_ms = st.number_input("Budget de latence par rerun (ms, p95)", min_value=50, max_value=10000,
+                                    value=500, step=50, key="budget_latence_ms")
+    with col2:
+        st.metric("Reruns relevés", stats['reruns'])
+
+    if not stats['reruns']:
+        st.info("Aucun rerun relevé pour l'instant")
+        return
+
+    st.markdown("### 📄 Par page (rerun complet)")
+    hors_budget = [page for page, resume in stats['pages'].items() if resume['p95_ms'] > budget_ms]
+    if hors_budget:
+        st.warning(f"⚠️ Hors budget (p95 > {budget_ms} ms): {', '.join(hors_budget)}")
+    st.dataframe(tableau_latences(stats['pages'], 'Page', budget_ms), use_container_width=True, hide_index=True)
+
+    st.markdown("### 🔧 Par fonction (durée cumulée par rerun)")
+    st.dataframe(tableau_latences(stats['fonctions'], 'Fonction'), use_container_width=True, hide_index=True)
+
+    if st.button("🗑️ Réinitialiser les relevés"):
+        CHRONO.vider()
+        st.rerun()
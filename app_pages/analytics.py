@@ -0,0 +1,121 @@
+# Plan Financier Familial - Page Analytics & KPIs
+
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from app_core import (
+    safe_get, filter_data_by_period, memoiser, figure_memoisee, format_currency,
+)
+
+def show_analytics():
+    """Page Analytics & KPIs Avancés avec filtrage complet"""
+    st.title("📈 Analytics & KPIs Avancés")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Agrégats de la période (mémoïsés par version des données et filtre)
+    analytics = memoiser('analytics', agreger_analytics)
+
+    # KPIs détaillés pour la période sélectionnée
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("💰 Total Investissement", format_currency(analytics['total_investissement']))
+
+    with col2:
+        st.metric("💸 Utilisé Réel", format_currency(analytics['total_utilise']))
+
+    with col3:
+        total_investissement = analytics['total_investissement']
+        utilisation_pct = (analytics['total_utilise'] / total_investissement * 100) if total_investissement > 0 else 0
+        st.metric("📊 Taux Utilisation", f"{utilisation_pct:.1f}%")
+
+    # Graphique détaillé par projet pour la période
+    st.subheader("📊 Performance des Projets par Période")
+
+    df_projets = analytics['df_projets']
+    if df_projets is not None:
+        fig = figure_memoisee('analytics_investissements', lambda: px.scatter(
+            df_projets, 
+            x='Budget Total', 
+            y='Cash Flow',
+            size='Progression %',
+            color='Type',
+            hover_name='Nom',
+            hover_data=['Responsable', 'ROI %'],
+            title="Analyse Investissements",
+            labels={'Budget Total': 'Budget Total (FCFA)', 'Cash Flow': 'Cash Flow Mensuel (FCFA)'}
+        ))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Table détaillée
+        st.subheader("📋 Détail par Projet")
+        st.dataframe(df_projets, use_container_width=True, hide_index=True)
+
+        # Analyse par responsable
+        st.subheader("📊 Répartition par Responsable")
+
+        if analytics['df_resp'] is not None:
+            st.dataframe(analytics['df_resp'], use_container_width=True)
+    else:
+        st.info("Aucune donnée pour la période sélectionnée.")
+
+def agreger_analytics():
+    """Agrégats de la page Analytics pour la période sélectionnée"""
+    projets_filtered = filter_data_by_period(st.session_state.projets, 'date_creation')
+
+    analytics = {
+        'total_investissement': sum(p['montant_total'] for p in projets_filtered),
+        'total_utilise': sum(p['montant_utilise_reel'] for p in projets_filtered),
+        'df_projets': None,
+        'df_resp': None
+    }
+
+    if not projets_filtered:
+        return analytics
+
+    analytics['df_projets'] = pd.DataFrame([
+        {
+            'Nom': p['nom'],
+            'Type': p['type'],
+            'Responsable': safe_get(p, 'responsable', 'Non défini'),
+            'Budget Total': p['montant_total'],
+            'Utilisé': p['montant_utilise_reel'],
+            'Progression %': (p['montant_utilise_reel'] / p['montant_total'] * 100) if p['montant_total'] > 0 else 0,
+            'Cash Flow': p['cash_flow_mensuel'],
+            'ROI %': p['roi_attendu']
+        }
+        for p in projets_filtered
+    ])
+
+    # Analyse par responsable
+    responsable_stats = {}
+    for projet in projets_filtered:
+        resp = safe_get(projet, 'responsable', 'Non défini')
+        if resp not in responsable_stats:
+            responsable_stats[resp] = {'projets': 0, 'budget_total': 0, 'cash_flow': 0}
+        responsable_stats[resp]['projets'] += 1
+        responsable_stats[resp]['budget_total'] += projet['montant_total']
+        responsable_stats[resp]['cash_flow'] += projet['cash_flow_mensuel']
+
+    if responsable_stats:
+        df_resp = pd.DataFrame(responsable_stats).T
+        df_resp.index.name = 'Responsable'
+        analytics['df_resp'] = df_resp
+
+    return analytics
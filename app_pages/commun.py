@@ -0,0 +1,63 @@
+# Plan Financier Familial - Éléments partagés entre pages
+# Panneaux par carte (ouverts / fermés) et conseils par projet, utilisés par
+# les vues Kanban, Gestion Projets et Conseils.
+
+import streamlit as st
+
+def panneau_ouvert(panneau, projet_id):
+    """Panneau ('kanban', 'details', 'suivi', 'conseils') ouvert pour ce projet ?"""
+    return projet_id in st.session_state.get(f"panneaux_{panneau}", ())
+
+def ouvrir_panneau(panneau, projet_id):
+    st.session_state.setdefault(f"panneaux_{panneau}", set()).add(projet_id)
+
+def fermer_panneau(panneau, projet_id):
+    st.session_state.get(f"panneaux_{panneau}", set()).discard(projet_id)
+
+def show_project_advice(projet):
+    """Affiche les conseils des 3 mentors pour un projet avec configuration dynamique"""
+    with st.expander(f"🎯 Conseils des 3 Mentors: {projet['nom']}", expanded=True):
+
+        col1, col2, col3 = st.columns(3)
+
+        mentors_config = st.session_state.admin_config['mentors_conseils']
+
+        with col1:
+            st.markdown("#### 🏢 Robert Kiyosaki")
+            st.markdown("*Père Riche, Père Pauvre*")
+
+            conseil = mentors_config['Kiyosaki'].get(projet['type'], 'Conseil non configuré')
+            if projet['type'] == 'Actif générateur':
+                st.success(f"✅ {conseil}")
+            elif projet['type'] == 'Passif':
+                st.warning(f"⚠️ {conseil}")
+            else:
+                st.info(f"📚 {conseil}")
+
+        with col2:
+            st.markdown("#### 💎 Warren Buffett")
+            st.markdown("*L'Oracle d'Omaha*")
+
+            conseil = mentors_config['Buffett'].get(projet['type'], 'Conseil non configuré')
+            if projet['type'] == 'Actif générateur':
+                st.success(f"🔍 {conseil}")
+            elif projet['type'] == 'Passif':
+                st.warning(f"🤔 {conseil}")
+            else:
+                st.info(f"🎯 {conseil}")
+
+        with col3:
+            st.markdown("#### 💪 Dave Ramsey")
+            st.markdown("*Total Money Makeover*")
+
+            conseil = mentors_config['Ramsey'].get(projet['type'], 'Conseil non configuré')
+            if projet['type'] == 'Actif générateur':
+                st.success(f"💰 {conseil}")
+            elif projet['type'] == 'Passif':
+                st.warning(f"🚨 {conseil}")
+            else:
+                st.info(f"✅ {conseil}")
+
+        # Bouton fermer
+        st.button("❌ Fermer Conseils", key=f"close_advice_{projet['id']}",
+                  on_click=fermer_panneau, args=('conseils', projet['id']))
@@ -0,0 +1,111 @@
+# Plan Financier Familial - Page Dashboard Principal
+
+from datetime import datetime
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from app_core import figure_memoisee, calculer_kpis, format_currency, projection_cash_flow
+
+def figure_eventail_cash_flow(projection):
+    """Bandes P10-P90 et médiane du cash flow cumulé simulé"""
+    mois = projection['mois'].astype('datetime64[D]')
+    p10, p50, p90 = (projection['quantiles'][q] for q in (10, 50, 90))
+
+    fig = go.Figure([
+        go.Scatter(x=mois, y=p90, mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'),
+        go.Scatter(x=mois, y=p10, mode='lines', line=dict(width=0), fill='tonexty',
+                   fillcolor='rgba(31, 184, 205, 0.25)', name='P10 - P90'),
+        go.Scatter(x=mois, y=p50, mode='lines', line=dict(color='#1FB8CD', width=3), name='Médiane (P50)'),
+    ])
+    fig.update_layout(
+        title=f"Cash Flow Cumulé jusqu'en 2030 (FCFA, {projection['nb_trajectoires']:,} trajectoires)".replace(",", " "),
+        hovermode='x unified'
+    )
+    fig.add_hline(y=0, line_dash="dash", annotation_text="Équilibre")
+    return fig
+
+def show_dashboard():
+    """Page Dashboard Principal avec filtrage"""
+    st.title("📊 Dashboard Principal")
+
+    # Affichage période active
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # KPIs avec données filtrées
+    kpis = calculer_kpis()
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        delta_color = "normal" if kpis['cash_flow_mensuel'] >= 0 else "inverse"
+        st.metric(
+            "💸 Cash Flow Mensuel", 
+            format_currency(kpis['cash_flow_mensuel']), 
+            delta=f"Objectif: {format_currency(st.session_state.admin_config['kpis_config']['objectif_cash_flow'])}",
+            delta_color=delta_color
+        )
+
+    with col2:
+        st.metric(
+            "⚖️ Ratio Actifs/Passifs", 
+            f"{kpis['ratio_actifs_passifs']:.1f}%", 
+            delta=f"Objectif: >{st.session_state.admin_config['kpis_config']['objectif_ratio_actifs']}%"
+        )
+
+    with col3:
+        st.metric(
+            "💰 Revenus Passifs", 
+            f"{kpis['revenus_passifs_pct']:.1f}%", 
+            delta=f"Objectif: {st.session_state.admin_config['kpis_config']['objectif_revenus_passifs']}%"
+        )
+
+    with col4:
+        st.metric(
+            "🎯 Phase", 
+            kpis['phase_actuelle'],
+            delta=f"Baby Step {kpis['baby_step_actuel']}/7"
+        )
+
+    # Graphiques avec données filtrées
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📈 Évolution Cash Flow")
+
+        # Projection du plan complet, indépendante du filtre de période
+        projection = projection_cash_flow()
+        fig = figure_memoisee(
+            ('dashboard_cash_flow', str(projection['mois'][0])),
+            lambda: figure_eventail_cash_flow(projection),
+            par_periode=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"Probabilité de finir 2030 en déficit cumulé: {projection['probabilite_deficit']:.0%}")
+
+    with col2:
+        st.subheader("🥧 Répartition Investissements")
+
+        if kpis['total_actifs'] + kpis['total_passifs'] + kpis['total_formation'] > 0:
+            fig = figure_memoisee('dashboard_repartition', lambda: px.pie(
+                values=[kpis['total_actifs'], kpis['total_passifs'], kpis['total_formation']],
+                names=['Actifs Générateurs', 'Passifs', 'Formation'],
+                color_discrete_map={
+                    'Actifs Générateurs': '#1FB8CD',
+                    'Passifs': '#B4413C', 
+                    'Formation': '#FFC185'
+                }
+            ))
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,131 @@
+# Plan Financier Familial - Page Éducation Enfants
+
+from datetime import datetime
+
+import streamlit as st
+
+def show_children_education():
+    """Page Éducation Financière des Enfants avec adaptation à la période"""
+    st.title("👨‍👩‍👧‍👦 Éducation Financière des Enfants")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Adaptation des âges selon l'année filtrée
+    annee_base = 2025
+    if st.session_state.filter_year != "Tout":
+        diff_annee = st.session_state.filter_year - annee_base
+    else:
+        diff_annee = 0
+
+    enfants = [
+        {
+            'nom': 'Uriel',
+            'age': 14 + diff_annee,
+            'emoji': '👦',
+            'niveau': 'Adolescent - Concepts avancés',
+            'objectifs_mois': [
+                f'Analyser un projet familial',
+                'Créer son budget mensuel personnel',
+                'Comprendre les quadrants E-S-B-I'
+            ],
+            'activites': [
+                'Participation à la révision mensuelle des KPIs',
+                'Analyse d un investissement familial',
+                'Création d un mini-business plan'
+            ]
+        },
+        {
+            'nom': 'Naelle', 
+            'age': 7 + diff_annee,
+            'emoji': '👧',
+            'niveau': 'Enfant - Concepts fondamentaux',
+            'objectifs_mois': [
+                'Épargner 500 FCFA ce mois',
+                'Différencier 3 "actifs" et 3 "passifs"',
+                'Comprendre les "projets" des parents'
+            ],
+            'activites': [
+                'Jeu de tri "Actif ou Passif?"',
+                'Tirelire mensuelle avec objectif visuel',
+                'Histoire du "Petit Cochon Financier"'
+            ]
+        },
+        {
+            'nom': 'Nell-Henri',
+            'age': 5 + diff_annee,
+            'emoji': '👶',
+            'niveau': 'Petit enfant - Concepts simples',
+            'objectifs_mois': [
+                'Reconnaître pièces et billets FCFA',
+                'Comprendre "garder" vs "dépenser"',
+                'Aider à compter l argent'
+            ],
+            'activites': [
+                'Jeu "Marchande" avec vraie monnaie',
+                'Comptine "Les Sous qui Dorment"',
+                'Dessin "Ma Tirelire Magique"'
+            ]
+        }
+    ]
+
+    # Affichage des enfants avec planning personnalisé
+    for enfant in enfants:
+        with st.container():
+            st.markdown(f"## {enfant['emoji']} {enfant['nom']} ({enfant['age']} ans)")
+            st.markdown(f"**Niveau:** {enfant['niveau']}")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown(f"### 🎯 Objectifs")
+                for objectif in enfant['objectifs_mois']:
+                    st.write(f"• {objectif}")
+
+            with col2:
+                st.markdown(f"### 🎮 Activités")
+                for activite in enfant['activites']:
+                    st.write(f"• {activite}")
+
+            # Suivi progression selon période
+            if st.session_state.filter_month != "Tout":
+                progress_value = min((st.session_state.filter_month / 12) * 100, 100)
+                st.progress(progress_value / 100)
+                st.markdown(f"**Progression annuelle:** {progress_value:.0f}%")
+
+            st.markdown("---")
+
+    # Planning familial
+    st.subheader("👨‍👩‍👧‍👦 Planning Familial")
+
+    if st.session_state.filter_month != "Tout":
+        planning_mensuel = {
+            1: "Nouvelle année financière - Objectifs famille",
+            2: "Mois de l épargne - Challenge tirelires",
+            3: "Trimestre bilan - Réunion famille",
+            4: "Mois des projets - Planification ensemble",
+            5: "Préparation été - Budget vacances",
+            6: "Bilan mi-année - Célébration réussites",
+            7: "Vacances éducatives - Jeux financiers",
+            8: "Préparation rentrée - Budget scolaire",
+            9: "Rentrée - Nouveaux objectifs",
+            10: "Mois Halloween - Épargne bonbons",
+            11: "Préparation fêtes - Budget cadeaux",
+            12: "Bilan annuel - Récompenses famille"
+        }
+
+        activite_mois = planning_mensuel.get(st.session_state.filter_month, "Développement continu")
+        st.success(f"**🎯 Activité principale ce mois :** {activite_mois}")
+    else:
+        st.info("Sélectionnez un mois spécifique pour voir l'activité recommandée.")
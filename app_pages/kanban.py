@@ -0,0 +1,220 @@
+# Plan Financier Familial - Page Vue Kanban Projets
+
+from datetime import datetime, date
+
+import streamlit as st
+
+from app_core import safe_get, format_currency, categoriser_projets
+from app_pages.commun import panneau_ouvert, ouvrir_panneau, fermer_panneau
+
+KANBAN_CARTES_PAR_PAGE = 10
+
+def show_kanban_view():
+    """Vue Kanban des projets avec catégorisation avancée et filtrage"""
+    st.title("📋 Vue Kanban - Gestion Visuelle des Projets")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Catégorisation des projets filtrés (comptes sur toute la période)
+    lignes_par_categorie = categoriser_projets()
+    categories = {
+        'en-retard': {'lignes': lignes_par_categorie['en-retard'], 'titre': '🔴 En Retard', 'couleur': '#ff4444'},
+        'a-risque': {'lignes': lignes_par_categorie['a-risque'], 'titre': '🟡 À Risque', 'couleur': '#ff8800'},
+        'en-cours': {'lignes': lignes_par_categorie['en-cours'], 'titre': '🔵 En Cours', 'couleur': '#007bff'},
+        'en-avance': {'lignes': lignes_par_categorie['en-avance'], 'titre': '🟢 En Avance', 'couleur': '#00aa00'},
+        'bloque': {'lignes': lignes_par_categorie['bloque'], 'titre': '⚫ Bloqué', 'couleur': '#666666'}
+    }
+
+    # Pagination par colonne (réinitialisée quand le filtre change)
+    filtre = (st.session_state.filter_month, st.session_state.filter_year)
+    if st.session_state.get('kanban_pagination', {}).get('filtre') != filtre:
+        st.session_state.kanban_pagination = {'filtre': filtre, 'visibles': {}}
+    visibles = st.session_state.kanban_pagination['visibles']
+
+    cartes_detaillees = st.toggle("Cartes détaillées", value=False, help="Déplier toutes les cartes affichées")
+
+    # Affichage en colonnes
+    colonnes = st.columns(len(categories))
+    store = st.session_state.projets
+
+    for i, (cat_key, cat_data) in enumerate(categories.items()):
+        with colonnes[i]:
+            lignes = cat_data['lignes']
+            st.markdown(f"### {cat_data['titre']} ({len(lignes)})")
+
+            if len(lignes):
+                nb_visibles = visibles.get(cat_key, KANBAN_CARTES_PAR_PAGE)
+                # Seules les cartes visibles sont construites
+                for ligne in lignes[:nb_visibles]:
+                    show_kanban_carte(store[int(ligne)], cat_data['couleur'], cat_key, cartes_detaillees)
+
+                restants = len(lignes) - nb_visibles
+                if restants > 0:
+                    if st.button(f"⬇️ Voir plus ({restants} restants)", key=f"kanban_plus_{cat_key}"):
+                        visibles[cat_key] = nb_visibles + KANBAN_CARTES_PAR_PAGE
+                        st.rerun()
+            else:
+                st.info("Aucun projet dans cette catégorie")
+
+    # Statistiques avec données filtrées
+    st.markdown("---")
+    st.subheader("📊 Statistiques Projet")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    total_projets = sum(len(cat_data['lignes']) for cat_data in categories.values())
+
+    with col1:
+        st.metric("Total Projets", total_projets)
+
+    with col2:
+        en_retard = len(categories['en-retard']['lignes'])
+        st.metric("En Retard", en_retard, delta=f"{(en_retard/total_projets*100):.0f}%" if total_projets > 0 else "0%")
+
+    with col3:
+        a_risque = len(categories['a-risque']['lignes'])
+        st.metric("À Risque", a_risque, delta=f"{(a_risque/total_projets*100):.0f}%" if total_projets > 0 else "0%")
+
+    with col4:
+        en_avance = len(categories['en-avance']['lignes'])
+        st.metric("En Avance", en_avance, delta=f"{(en_avance/total_projets*100):.0f}%" if total_projets > 0 else "0%")
+
+@st.fragment
+def show_kanban_carte(projet, couleur, categorie, detaillee=False):
+    """Carte Kanban isolée: déplier, replier et détails ne relancent que cette carte"""
+    if detaillee or panneau_ouvert('kanban', projet['id']):
+        show_kanban_card(projet, couleur, categorie)
+    else:
+        show_kanban_card_resume(projet, categorie)
+
+def show_kanban_card_resume(projet, categorie):
+    """Carte Kanban repliée: une ligne de résumé et un bouton pour la déplier"""
+    progression = (projet['montant_utilise_reel'] / projet['montant_total']) * 100 if projet['montant_total'] > 0 else 0
+    type_colors = {
+        'Actif générateur': '🟢',
+        'Passif': '🔴',
+        'Investissement formation': '🔵'
+    }
+    st.markdown(
+        f"{type_colors.get(projet['type'], '⚪')} **{projet['nom']}**  \n"
+        f"📊 {progression:.0f}% • 📅 {projet['echeance'].strftime('%d/%m/%Y')} • 💰 {format_currency(projet['montant_total'])}"
+    )
+    st.button("▸ Déplier", key=f"kanban_ouvrir_{projet['id']}", on_click=ouvrir_panneau, args=('kanban', projet['id']))
+
+def show_kanban_card(projet, couleur, categorie):
+    """Affiche une carte Kanban pour un projet avec gestion sécurisée des champs"""
+    progression = (projet['montant_utilise_reel'] / projet['montant_total']) * 100 if projet['montant_total'] > 0 else 0
+
+    # Calcul jours restants
+    jours_restants = (projet['echeance'] - date.today()).days
+
+    # CSS class pour la catégorie
+    with st.container():
+        # En-tête carte
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"**{projet['nom']}**")
+
+        with col2:
+            # Type badge
+            type_colors = {
+                'Actif générateur': '🟢',
+                'Passif': '🔴',
+                'Investissement formation': '🔵'
+            }
+            st.markdown(f"{type_colors.get(projet['type'], '⚪')} {projet['type'][:8]}...")
+
+        # Infos projet
+        st.markdown(f"💰 **Budget:** {format_currency(projet['montant_total'])}")
+        st.markdown(f"💸 **Utilisé:** {format_currency(projet['montant_utilise_reel'])}")
+        st.markdown(f"📅 **Échéance:** {projet['echeance'].strftime('%d/%m/%Y')}")
+        st.markdown(f"⏰ **Jours restants:** {jours_restants}")
+        st.markdown(f"👤 **Responsable:** {safe_get(projet, 'responsable', 'Non défini')}")
+
+        # Barre de progression
+        st.progress(progression / 100)
+        st.markdown(f"📊 **Progression:** {progression:.1f}%")
+
+        # Source financement (gestion sécurisée)
+        source_financement = safe_get(projet, 'source_financement', 'Non défini')
+        st.markdown(f"🏦 **Financement:** {source_financement}")
+
+        # Actions
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("✏️ Modifier", key=f"kanban_edit_{projet['id']}"):
+                st.session_state.edit_project_id = projet['id']
+                st.session_state.current_page = "💼 Gestion Projets"
+                st.rerun()
+
+        with col2:
+            st.button("📊 Détails", key=f"kanban_details_{projet['id']}",
+                      on_click=ouvrir_panneau, args=('details', projet['id']))
+
+        if panneau_ouvert('kanban', projet['id']):
+            st.button("▾ Replier", key=f"kanban_replier_{projet['id']}",
+                      on_click=fermer_panneau, args=('kanban', projet['id']))
+
+        st.markdown("---")
+
+        # Modal détails
+        if panneau_ouvert('details', projet['id']):
+            show_project_details_modal(projet)
+
+def show_project_details_modal(projet):
+    """Affiche les détails d'un projet dans un expander"""
+    with st.expander(f"📊 Détails: {projet['nom']}", expanded=True):
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### 💰 Informations Financières")
+            st.write(f"**Budget Total:** {format_currency(projet['montant_total'])}")
+            st.write(f"**Budget Mensuel:** {format_currency(projet['budget_alloue_mensuel'])}")
+            st.write(f"**Utilisé Réel:** {format_currency(projet['montant_utilise_reel'])}")
+            st.write(f"**Cash Flow/Mois:** {format_currency(projet['cash_flow_mensuel'])}")
+            st.write(f"**ROI Attendu:** {projet['roi_attendu']}%")
+
+        with col2:
+            st.markdown("### 📋 Informations Projet")
+            st.write(f"**Statut:** {projet['statut']}")
+            st.write(f"**Priorité:** {safe_get(projet, 'priorite', 'Non définie')}")
+            st.write(f"**Échéance:** {projet['echeance'].strftime('%d/%m/%Y')}")
+            st.write(f"**Responsable:** {safe_get(projet, 'responsable', 'Non défini')}")
+            st.write(f"**Source Financement:** {safe_get(projet, 'source_financement', 'Non définie')}")
+
+        # Dates de gestion
+        st.markdown("### 📅 Gestion")
+        col1, col2 = st.columns(2)
+        with col1:
+            date_creation = safe_get(projet, 'date_creation', datetime.now())
+            if isinstance(date_creation, str):
+                date_creation = datetime.strptime(date_creation, '%Y-%m-%d %H:%M:%S')
+            st.write(f"**Créé le:** {date_creation.strftime('%d/%m/%Y %H:%M')}")
+
+        with col2:
+            date_modification = safe_get(projet, 'date_modification', datetime.now())
+            if isinstance(date_modification, str):
+                date_modification = datetime.strptime(date_modification, '%Y-%m-%d %H:%M:%S')
+            st.write(f"**Modifié le:** {date_modification.strftime('%d/%m/%Y %H:%M')}")
+
+        st.markdown("### 📝 Description")
+        st.write(projet['description'])
+
+        # Bouton fermer
+        st.button("❌ Fermer", key=f"close_details_{projet['id']}",
+                  on_click=fermer_panneau, args=('details', projet['id']))
@@ -0,0 +1,39 @@
+# Plan Financier Familial - Page Conseils 3 Mentors
+
+from datetime import datetime
+
+import streamlit as st
+
+from app_core import filter_data_by_period
+from app_pages.commun import show_project_advice
+
+def show_mentor_advice():
+    """Page Conseils des 3 Mentors avec filtrage des projets"""
+    st.title("🎯 Conseil des 3 Mentors Financiers")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Sélection d'un projet avec filtrage
+    projets_filtered = filter_data_by_period(st.session_state.projets, 'date_creation')
+    project_names = [p['nom'] for p in projets_filtered]
+
+    if project_names:
+        selected_project_name = st.selectbox("Choisir un projet pour conseil détaillé", project_names)
+
+        if selected_project_name:
+            project = next(p for p in projets_filtered if p['nom'] == selected_project_name)
+            show_project_advice(project)
+    else:
+        st.info("Aucun projet disponible pour la période sélectionnée. Ajoutez des projets ou modifiez le filtre.")
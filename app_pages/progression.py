@@ -0,0 +1,100 @@
+# Plan Financier Familial - Page Progression Familiale
+
+from datetime import datetime, date
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from app_core import calculer_kpis
+
+def show_progression():
+    """Page Progression Familiale avec filtrage"""
+    st.title("🚀 Progression Familiale vers l'Indépendance")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Baby Steps Dave Ramsey avec progression par période
+    st.subheader("👶 Baby Steps Dave Ramsey - Progression")
+
+    baby_steps = [
+        ("Fonds d'urgence starter 665k FCFA", 1, "💰"),
+        ("Éliminer toutes dettes (sauf immobilier)", 2, "🚫"),  
+        ("Fonds d'urgence complet 3-6 mois", 3, "🏦"),
+        ("Investir 15% revenus pour retraite", 4, "📈"),
+        ("Épargne université enfants", 5, "🎓"),
+        ("Rembourser hypothèque anticipé", 6, "🏠"),
+        ("Construire richesse et donner", 7, "💎")
+    ]
+
+    kpis = calculer_kpis()
+    current_step = kpis['baby_step_actuel']
+
+    for step_desc, step_num, emoji in baby_steps:
+        if step_num < current_step:
+            st.success(f"✅ {emoji} **Étape {step_num}:** {step_desc}")
+        elif step_num == current_step:
+            st.warning(f"🔄 {emoji} **Étape {step_num} (ACTUELLE):** {step_desc}")
+        else:
+            st.info(f"⏳ {emoji} **Étape {step_num}:** {step_desc}")
+
+    # Graphique progression temporelle basé sur période filtrée
+    st.subheader("📈 Évolution par Période")
+
+    # Simulation progression sur 24 mois
+    if st.session_state.filter_year != "Tout" and st.session_state.filter_month != "Tout":
+        start_date = date(st.session_state.filter_year, st.session_state.filter_month, 1)
+    else:
+        start_date = date.today().replace(day=1)
+
+    mois_futurs = pd.date_range(start=start_date, periods=24, freq='MS')
+
+    progression_simulation = []
+    for i, mois in enumerate(mois_futurs):
+        progression_simulation.append({
+            'Mois': mois,
+            'Revenus Passifs %': min(kpis['revenus_passifs_pct'] + (i * 1.2), 50),  # Progression graduelle
+            'Cash Flow': kpis['cash_flow_mensuel'] + (i * 120000),  # Amélioration graduelle
+            'Baby Step': min(current_step + (i // 6), 7)  # Progression par étapes
+        })
+
+    df_progression = pd.DataFrame(progression_simulation)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = px.line(
+            df_progression, 
+            x='Mois', 
+            y='Revenus Passifs %',
+            title="Projection Revenus Passifs"
+        )
+        fig.add_hline(y=st.session_state.admin_config['kpis_config']['objectif_revenus_passifs'], 
+                      line_dash="dash", 
+                      annotation_text=f"Objectif {st.session_state.admin_config['kpis_config']['objectif_revenus_passifs']}%")
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = px.line(
+            df_progression, 
+            x='Mois', 
+            y='Cash Flow',
+            title="Projection Cash Flow"
+        )
+        fig.add_hline(y=0, line_dash="dash", annotation_text="Équilibre")
+        fig.add_hline(y=st.session_state.admin_config['kpis_config']['objectif_cash_flow'], 
+                      line_dash="dot", 
+                      annotation_text="Objectif")
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,633 @@
+# Plan Financier Familial - Page Gestion Projets
+# Vue cartes ou tableau, suivi mensuel et formulaires d'ajout / modification.
+
+from datetime import datetime, date
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+
+from app_core import (
+    safe_get, format_currency, get_sources_financement, rechercher_projets,
+    ajouter_projet, modifier_projet, supprimer_projet, enregistrer_suivi,
+    optimiser_allocations, verifier_allocations, figure_memoisee,
+)
+from app_pages.commun import panneau_ouvert, ouvrir_panneau, fermer_panneau, show_project_advice
+
+def show_project_management():
+    """Page Gestion Projets CRUD complète avec filtrage"""
+    st.title("💼 Gestion des Projets")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    # Actions principales
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        if st.button("➕ Nouveau Projet", type="primary"):
+            st.session_state.show_add_form = True
+
+    # Gestion des modals
+    if st.session_state.get('show_add_form', False):
+        show_add_project_form()
+
+    if st.session_state.get('edit_project_id'):
+        show_edit_project_form()
+
+    # Filtres
+    st.subheader("🔍 Filtres")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        filter_type = st.selectbox(
+            "Type", 
+            ["Tous"] + st.session_state.admin_config['listes_config']['types_projet']
+        )
+
+    with col2:
+        filter_status = st.selectbox(
+            "Statut",
+            ["Tous"] + st.session_state.admin_config['listes_config']['statuts_projet']
+        )
+
+    with col3:
+        filter_priority = st.selectbox(
+            "Priorité",
+            ["Toutes"] + st.session_state.admin_config['listes_config']['priorites']
+        )
+
+    with col4:
+        sort_by = st.selectbox(
+            "Trier par",
+            ["Nom", "Montant", "Échéance", "ROI", "Type", "Date création"]
+        )
+
+    # Application des filtres avec filtrage par période
+    projets_filtered = rechercher_projets(filter_type, filter_status, filter_priority, sort_by)
+
+    # Affichage des projets
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.subheader(f"📋 Projets ({len(projets_filtered)})")
+    with col2:
+        mode_affichage = st.radio(
+            "Affichage",
+            ["🗂️ Cartes", "📊 Tableau"],
+            index=1 if len(st.session_state.projets) > 20 else 0,
+            horizontal=True,
+            key="mode_affichage_projets"
+        )
+
+    if not projets_filtered:
+        st.info("Aucun projet ne correspond aux filtres sélectionnés.")
+    elif mode_affichage == "📊 Tableau":
+        show_projects_table(projets_filtered)
+    else:
+        for projet in projets_filtered:
+            show_project_card_native(projet)
+
+    # Allocation des revenus entre projets (calculée à la demande)
+    st.markdown("---")
+    show_allocations(projets_filtered)
+
+def tableau_allocations(allocation, projets):
+    """DataFrame des versements optimisés des projets affichés (dans l'ordre donné) qui restent à financer"""
+    store = st.session_state.projets
+    lignes_affichees = store.lignes_de(projets)
+    positions = np.searchsorted(allocation['lignes'], lignes_affichees)
+    trouves = positions < len(allocation['lignes'])
+    trouves[trouves] = allocation['lignes'][positions[trouves]] == lignes_affichees[trouves]
+    positions = positions[trouves]
+    lignes = allocation['lignes'][positions]
+
+    versements = allocation['versements'][positions]
+    nb_versements = np.count_nonzero(versements > 0, axis=1)
+    fins = allocation['fins'][positions]
+    statuts = np.where(allocation['a_temps'][positions], "✅ À temps",
+                       np.where(fins >= 0, "⚠️ En retard", "❌ Non financé"))
+
+    return pd.DataFrame({
+        'Projet': [p['nom'] for p, trouve in zip(projets, trouves) if trouve],
+        'Priorité': store.libelles('priorite', lignes),
+        'Source': [p.get('source_financement') for p, trouve in zip(projets, trouves) if trouve],
+        'Échéance': store.colonne('echeance')[lignes],
+        'Reste à Financer': allocation['besoins'][positions],
+        'Budget Alloué/Mois': store.colonne('budget_alloue_mensuel')[lignes],
+        'Versement ce Mois': versements[:, 0],
+        'Versement Moyen/Mois': np.divide(versements.sum(axis=1), nb_versements,
+                                          out=np.zeros(len(lignes)), where=nb_versements > 0),
+        'Financé en': np.where(fins >= 0, allocation['mois'][np.maximum(fins, 0)].astype(str), "—"),
+        'Statut': statuts,
+    })
+
+def figure_utilisation_sources(allocation):
+    """Revenus utilisés par mois face à la capacité totale des sources"""
+    df = pd.DataFrame({
+        'Mois': allocation['mois'].astype('datetime64[ns]'),
+        'Utilisé': allocation['utilisation'].sum(axis=0),
+    })
+    fig = px.area(df, x='Mois', y='Utilisé', title="Utilisation des revenus par les projets")
+    fig.add_hline(y=float(allocation['capacites'].sum()), line_dash="dash", annotation_text="Capacité totale")
+    return fig
+
+def show_allocations(projets):
+    """Répartition des revenus entre projets: capacité des sources, versements optimisés, échéances tenues"""
+    st.subheader("🧮 Allocation Mensuelle des Revenus")
+
+    verification = verifier_allocations()
+    sur_engagees = [v for v in verification if v['ecart'] < 0]
+    if sur_engagees:
+        st.warning(f"⚠️ {len(sur_engagees)} source(s) sur-engagée(s): les budgets alloués dépassent les revenus attendus")
+    else:
+        st.success("✅ Les budgets alloués tiennent dans les revenus attendus de chaque source")
+
+    with st.expander("💰 Capacité des sources"):
+        st.dataframe(
+            pd.DataFrame([{
+                'Source': v['source'],
+                'Revenus Attendus/Mois': v['capacite'],
+                'Budgets Alloués/Mois': v['engage'],
+                'Écart': v['ecart'],
+            } for v in verification]),
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'Revenus Attendus/Mois': st.column_config.NumberColumn(format="%d FCFA"),
+                'Budgets Alloués/Mois': st.column_config.NumberColumn(format="%d FCFA"),
+                'Écart': st.column_config.NumberColumn(format="%d FCFA"),
+            }
+        )
+
+    if not st.toggle("Optimiser les versements mensuels (60 mois)", key="optimiser_allocations"):
+        st.caption("Répartit les revenus de chaque source entre les projets selon priorité et échéance.")
+        return
+
+    allocation = optimiser_allocations()
+    a_temps = allocation['a_temps']
+    fins = allocation['fins']
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Projets à Financer", len(allocation['lignes']))
+    col2.metric("Financés à Temps", int(a_temps.sum()))
+    col3.metric("En Retard", int(np.count_nonzero(~a_temps & (fins >= 0))))
+    col4.metric("Non Financés (60 mois)", int(np.count_nonzero(fins < 0)))
+
+    tableau = tableau_allocations(allocation, projets)
+    if tableau.empty:
+        st.info("Aucun projet affiché ne reste à financer.")
+    else:
+        st.dataframe(
+            tableau,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'Échéance': st.column_config.DateColumn(format="DD/MM/YYYY"),
+                'Reste à Financer': st.column_config.NumberColumn(format="%d FCFA"),
+                'Budget Alloué/Mois': st.column_config.NumberColumn(format="%d FCFA"),
+                'Versement ce Mois': st.column_config.NumberColumn(format="%d FCFA"),
+                'Versement Moyen/Mois': st.column_config.NumberColumn(format="%d FCFA"),
+            }
+        )
+
+    fig = figure_memoisee(('allocations_utilisation', str(allocation['mois'][0])),
+                          lambda: figure_utilisation_sources(allocation), par_periode=False)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        "Par priorité puis échéance, chaque projet est financé par sa source au plus tard avant l'échéance, "
+        "puis par la capacité restante des autres sources; les projets qui ne peuvent être à temps sont "
+        "financés au plus tôt sur ce qui reste."
+    )
+
+def tableau_projets(projets):
+    """DataFrame des projets (dans l'ordre donné) construit à partir des colonnes du store"""
+    store = st.session_state.projets
+    lignes = store.lignes_de(projets)
+    montant_total = store.colonne('montant_total')[lignes]
+    utilise = store.colonne('montant_utilise_reel')[lignes]
+
+    return pd.DataFrame({
+        'Projet': [p['nom'] for p in projets],
+        'Type': store.libelles('type', lignes),
+        'Statut': store.libelles('statut', lignes),
+        'Priorité': store.libelles('priorite', lignes),
+        'Responsable': store.libelles('responsable', lignes),
+        'Budget Total': montant_total,
+        'Utilisé': utilise,
+        'Progression': np.divide(utilise * 100, montant_total, out=np.zeros(len(lignes)), where=montant_total > 0),
+        'Cash Flow/Mois': store.colonne('cash_flow_mensuel')[lignes],
+        'ROI %': store.colonne('roi_attendu')[lignes],
+        'Échéance': store.colonne('echeance')[lignes],
+    })
+
+def show_projects_table(projets):
+    """Mode tableau: une seule grille, la sélection d'une ligne ouvre le formulaire de modification"""
+    evenement = st.dataframe(
+        tableau_projets(projets),
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="table_projets",
+        column_config={
+            'Budget Total': st.column_config.NumberColumn(format="%d FCFA"),
+            'Utilisé': st.column_config.NumberColumn(format="%d FCFA"),
+            'Cash Flow/Mois': st.column_config.NumberColumn(format="%d FCFA"),
+            'Progression': st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+            'ROI %': st.column_config.NumberColumn(format="%.1f"),
+            'Échéance': st.column_config.DateColumn(format="DD/MM/YYYY"),
+        }
+    )
+    st.caption("Sélectionnez une ligne pour modifier le projet.")
+
+    # N'ouvrir le formulaire qu'une fois par nouvelle sélection
+    selection = evenement.selection.rows
+    if selection and selection != st.session_state.get('table_projets_selection'):
+        st.session_state.table_projets_selection = selection
+        st.session_state.edit_project_id = projets[selection[0]]['id']
+        st.rerun()
+    elif not selection:
+        st.session_state.table_projets_selection = []
+
+@st.fragment
+def show_project_card_native(projet):
+    """Affiche une carte projet avec composants Streamlit natifs (fragment: Suivi/Conseils ne relancent que la carte)"""
+
+    # Calculs
+    delta_budget = projet['montant_total'] - projet['montant_utilise_reel']
+    progress = (projet['montant_utilise_reel'] / projet['montant_total']) * 100 if projet['montant_total'] > 0 else 0
+
+    # Container principal
+    with st.container():
+        # En-tête avec nom et type
+        col1, col2, col3 = st.columns([2, 1, 1])
+
+        with col1:
+            st.subheader(f"🎯 {projet['nom']}")
+            st.caption(f"👤 {safe_get(projet, 'responsable', 'Non défini')}")
+
+        with col2:
+            # Badge type
+            type_colors = {
+                'Actif générateur': '🟢',
+                'Passif': '🔴',
+                'Investissement formation': '🔵'
+            }
+            st.markdown(f"{type_colors.get(projet['type'], '⚪')} **{projet['type']}**")
+
+        with col3:
+            # Badge statut
+            status_colors = {
+                'Planifié': '🔵',
+                'En cours': '🟡', 
+                'Développement': '🟠',
+                'Réalisé': '🟢',
+                'Suspendu': '🔴'
+            }
+            st.markdown(f"{status_colors.get(projet['statut'], '⚪')} {projet['statut']}")
+
+        # Métriques financières
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("💰 Budget Total", format_currency(projet['montant_total']))
+
+        with col2:
+            st.metric("💸 Utilisé", format_currency(projet['montant_utilise_reel']))
+
+        with col3:
+            st.metric("📊 Delta", format_currency(delta_budget))
+
+        with col4:
+            cash_flow_color = "normal" if projet['cash_flow_mensuel'] >= 0 else "inverse"
+            st.metric(
+                "💵 Cash Flow/Mois", 
+                format_currency(projet['cash_flow_mensuel']),
+                delta_color=cash_flow_color
+            )
+
+        # Barre de progression
+        st.write(f"**Progression: {progress:.1f}%**")
+        st.progress(progress / 100)
+
+        # Description
+        st.write(f"**Description:** {projet['description']}")
+
+        # Infos supplémentaires
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.write(f"📅 **Échéance:** {projet['echeance'].strftime('%d/%m/%Y')}")
+
+        with col2:
+            st.write(f"📊 **ROI:** {projet['roi_attendu']}%")
+
+        with col3:
+            # Gestion sécurisée du financement
+            source_financement = safe_get(projet, 'source_financement', 'Non défini')
+            st.write(f"🏦 **Financement:** {source_financement}")
+
+        # Dates de gestion
+        col1, col2 = st.columns(2)
+        with col1:
+            date_creation = safe_get(projet, 'date_creation', datetime.now())
+            if isinstance(date_creation, str):
+                date_creation = datetime.strptime(date_creation, '%Y-%m-%d %H:%M:%S')
+            st.caption(f"📅 Créé: {date_creation.strftime('%d/%m/%Y %H:%M')}")
+
+        with col2:
+            date_modification = safe_get(projet, 'date_modification', datetime.now())
+            if isinstance(date_modification, str):
+                date_modification = datetime.strptime(date_modification, '%Y-%m-%d %H:%M:%S')
+            st.caption(f"🔄 Modifié: {date_modification.strftime('%d/%m/%Y %H:%M')}")
+
+        # Actions
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            if st.button("✏️ Modifier", key=f"edit_{projet['id']}"):
+                st.session_state.edit_project_id = projet['id']
+                st.rerun()
+
+        with col2:
+            if st.button("🗑️ Supprimer", key=f"delete_{projet['id']}"):
+                if st.session_state.get(f"confirm_delete_{projet['id']}", False):
+                    # Suppression confirmée
+                    supprimer_projet(projet['id'])
+                    st.success(f"Projet '{projet['nom']}' supprimé.")
+                    if f"confirm_delete_{projet['id']}" in st.session_state:
+                        del st.session_state[f"confirm_delete_{projet['id']}"]
+                    st.rerun()
+                else:
+                    # Demande de confirmation
+                    st.session_state[f"confirm_delete_{projet['id']}"] = True
+                    st.warning("Cliquez à nouveau pour confirmer la suppression.")
+
+        with col3:
+            st.button("📊 Suivi", key=f"suivi_{projet['id']}",
+                      on_click=ouvrir_panneau, args=('suivi', projet['id']))
+
+        with col4:
+            st.button("🎯 Conseils", key=f"advice_{projet['id']}",
+                      on_click=ouvrir_panneau, args=('conseils', projet['id']))
+
+    # Affichage conditionnel du suivi
+    if panneau_ouvert('suivi', projet['id']):
+        show_project_tracking(projet)
+
+    # Affichage conditionnel des conseils
+    if panneau_ouvert('conseils', projet['id']):
+        show_project_advice(projet)
+
+    st.markdown("---")
+
+def show_project_tracking(projet):
+    """Affiche le suivi mensuel d'un projet"""
+    with st.expander(f"📊 Suivi Mensuel: {projet['nom']}", expanded=True):
+
+        # Filtre par mois/année sélectionnée
+        filtered_suivi = []
+        if st.session_state.filter_year != "Tout" and st.session_state.filter_month != "Tout":
+            target_month = f"{st.session_state.filter_year}-{st.session_state.filter_month:02d}"
+
+            if projet['suivi_mensuel']:
+                filtered_suivi = [s for s in projet['suivi_mensuel'] if s['mois'].startswith(target_month[:7])]
+        else:
+            filtered_suivi = projet.get('suivi_mensuel', [])
+
+        if filtered_suivi:
+            df_suivi = pd.DataFrame(filtered_suivi)
+            df_suivi['écart'] = df_suivi['reel'] - df_suivi['prevu']
+            df_suivi['% écart'] = (df_suivi['écart'] / df_suivi['prevu'] * 100).round(1)
+
+            st.dataframe(df_suivi, use_container_width=True)
+
+            # Graphique évolution
+            fig = px.bar(
+                df_suivi,
+                x='mois',
+                y=['prevu', 'reel'],
+                title=f"Prévisionnel vs Réel",
+                barmode='group'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Aucun suivi pour la période sélectionnée.")
+
+        # Ajouter une entrée de suivi
+        if st.session_state.filter_year != "Tout" and st.session_state.filter_month != "Tout":
+            st.subheader(f"➕ Ajouter Suivi pour {datetime(st.session_state.filter_year, st.session_state.filter_month, 1).strftime('%B %Y')}")
+
+            with st.form(f"suivi_form_{projet['id']}"):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    montant_prevu = st.number_input("Montant Prévu (FCFA)", min_value=0, step=10000, value=projet['budget_alloue_mensuel'])
+
+                with col2:
+                    montant_reel = st.number_input("Montant Réel (FCFA)", min_value=0, step=10000)
+
+                if st.form_submit_button("💾 Ajouter Suivi"):
+                    mois_cible = f"{st.session_state.filter_year}-{st.session_state.filter_month:02d}"
+                    enregistrer_suivi(projet['id'], mois_cible, montant_prevu, montant_reel)
+
+                    st.success(f"Suivi ajouté pour {datetime(st.session_state.filter_year, st.session_state.filter_month, 1).strftime('%B %Y')}!")
+                    st.rerun()
+        else:
+            st.info("Sélectionnez un mois et une année spécifiques pour ajouter un suivi.")
+
+        # Bouton fermer
+        st.button("❌ Fermer Suivi", key=f"close_suivi_{projet['id']}",
+                  on_click=fermer_panneau, args=('suivi', projet['id']))
+
+def show_add_project_form():
+    """Formulaire d'ajout de projet avec dates et responsable"""
+    with st.expander("➕ Nouveau Projet", expanded=True):
+        with st.form("add_project_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                nom = st.text_input("Nom du projet*", placeholder="ex: Groupe électrogène meublés")
+                type_projet = st.selectbox(
+                    "Type selon Kiyosaki*",
+                    st.session_state.admin_config['listes_config']['types_projet'],
+                    help="Actif = génère revenus, Passif = coûte de l'argent, Formation = capital humain"
+                )
+
+                # ✅ CORRECTION: Suppression des références à 'projet' inexistant
+                montant_total = st.number_input("Budget total nécessaire (FCFA)*", min_value=0, step=10000)
+                roi_attendu = st.number_input("ROI attendu (%)", min_value=0.0, max_value=100.0, step=0.1)
+                priorite = st.selectbox("Priorité", st.session_state.admin_config['listes_config']['priorites'])
+                responsable = st.selectbox("Responsable*", st.session_state.admin_config['listes_config']['responsables'])
+
+            with col2:
+                statut = st.selectbox(
+                    "Statut",
+                    st.session_state.admin_config['listes_config']['statuts_projet']
+                )
+
+                echeance = st.date_input("Échéance prévue", min_value=date.today())
+                budget_mensuel = st.number_input("Budget alloué/mois (FCFA)", min_value=0, step=10000)
+                cash_flow_mensuel = st.number_input(
+                    "Cash flow mensuel estimé (FCFA)",
+                    help="Positif pour revenus, négatif pour dépenses",
+                    step=10000
+                )
+
+                source_financement = st.selectbox(
+                    "Source de financement",
+                    get_sources_financement()
+                )
+
+            description = st.text_area("Description détaillée", height=100)
+
+            # ✅ CORRECTION: Boutons submit dans le formulaire
+            col1, col2 = st.columns(2)
+            with col1:
+                submitted = st.form_submit_button("✅ Créer Projet", type="primary")
+            with col2:
+                cancelled = st.form_submit_button("❌ Annuler")
+
+            # ✅ CORRECTION: Traitement après soumission
+            if submitted:
+                if nom and type_projet and montant_total > 0 and responsable:
+                    # Créer nouveau projet
+                    new_id = max([p['id'] for p in st.session_state.projets]) + 1 if st.session_state.projets else 1
+                    nouveau_projet = {
+                        'id': new_id,
+                        'nom': nom,
+                        'type': type_projet,
+                        'montant_total': montant_total,
+                        'budget_alloue_mensuel': budget_mensuel,
+                        'montant_utilise_reel': 0,
+                        'cash_flow_mensuel': cash_flow_mensuel,
+                        'statut': statut,
+                        'echeance': echeance,
+                        'roi_attendu': roi_attendu,
+                        'priorite': priorite,
+                        'description': description,
+                        'source_financement': source_financement,
+                        'responsable': responsable,
+                        'date_creation': datetime.now(),
+                        'date_modification': datetime.now(),
+                        'suivi_mensuel': []
+                    }
+
+                    ajouter_projet(nouveau_projet)
+                    st.session_state.show_add_form = False
+                    st.success(f"✅ Projet '{nom}' créé avec succès !")
+                    st.rerun()
+                else:
+                    st.error("⚠️ Veuillez remplir tous les champs obligatoires.")
+                    
+            elif cancelled:
+                st.session_state.show_add_form = False
+                st.rerun()
+
+def show_edit_project_form():
+    """Formulaire de modification de projet avec dates"""
+    project_id = st.session_state.edit_project_id
+    projet = next((p for p in st.session_state.projets if p['id'] == project_id), None)
+
+    if not projet:
+        st.error("Projet introuvable")
+        st.session_state.edit_project_id = None
+        return
+
+    with st.expander(f"✏️ Modifier: {projet['nom']}", expanded=True):
+        with st.form("edit_project_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                nom = st.text_input("Nom du projet*", value=projet['nom'])
+                type_projet = st.selectbox(
+                    "Type selon Kiyosaki*",
+                    st.session_state.admin_config['listes_config']['types_projet'],
+                    index=st.session_state.admin_config['listes_config']['types_projet'].index(projet['type'])
+                )
+
+                montant_total = st.number_input("Budget total nécessaire (FCFA)*", value=int(projet['montant_total']), step=10000)
+                
+                # ✅ CORRECTION: Sécurisation des types numériques
+                roi_value = safe_get(projet, 'roi_attendu', 0.0)
+                if roi_value is None or roi_value == 'N/A':
+                    roi_value = 0.0
+                roi_attendu = st.number_input("ROI attendu (%)", value=float(roi_value), min_value=0.0, max_value=100.0, step=0.1)
+
+                priorite = st.selectbox(
+                    "Priorité",
+                    st.session_state.admin_config['listes_config']['priorites'],
+                    index=st.session_state.admin_config['listes_config']['priorites'].index(safe_get(projet, 'priorite', 'Moyenne'))
+                )
+
+                responsable = st.selectbox(
+                    "Responsable*",
+                    st.session_state.admin_config['listes_config']['responsables'],
+                    index=st.session_state.admin_config['listes_config']['responsables'].index(safe_get(projet, 'responsable', 'Alix'))
+                )
+
+            with col2:
+                statut = st.selectbox(
+                    "Statut",
+                    st.session_state.admin_config['listes_config']['statuts_projet'],
+                    index=st.session_state.admin_config['listes_config']['statuts_projet'].index(projet['statut'])
+                )
+
+                echeance = st.date_input("Échéance prévue", value=projet['echeance'])
+                budget_mensuel = st.number_input("Budget alloué/mois (FCFA)", value=int(projet['budget_alloue_mensuel']), step=10000)
+                cash_flow_mensuel = st.number_input("Cash flow mensuel estimé (FCFA)", value=int(projet['cash_flow_mensuel']), step=10000)
+
+                sources_list = get_sources_financement()
+                current_source = safe_get(projet, 'source_financement', sources_list)
+                source_index = sources_list.index(current_source) if current_source in sources_list else 0
+                source_financement = st.selectbox(
+                    "Source de financement",
+                    sources_list,
+                    index=source_index
+                )
+
+            description = st.text_area("Description détaillée", value=projet['description'])
+
+            # ✅ CORRECTION: Boutons submit dans le formulaire
+            col1, col2 = st.columns(2)
+            with col1:
+                submitted = st.form_submit_button("💾 Sauvegarder", type="primary")
+            with col2:
+                cancelled = st.form_submit_button("❌ Annuler")
+
+            # ✅ CORRECTION: Traitement des actions après soumission
+            if submitted:
+                # Mettre à jour le projet
+                modifier_projet(project_id, {
+                    'nom': nom,
+                    'type': type_projet,
+                    'montant_total': montant_total,
+                    'budget_alloue_mensuel': budget_mensuel,
+                    'cash_flow_mensuel': cash_flow_mensuel,
+                    'statut': statut,
+                    'echeance': echeance,
+                    'roi_attendu': roi_attendu,
+                    'priorite': priorite,
+                    'description': description,
+                    'source_financement': source_financement,
+                    'responsable': responsable,
+                    'date_modification': datetime.now()
+                })
+                st.session_state.edit_project_id = None
+                st.success("Projet modifié!")
+                st.rerun()
+                
+            elif cancelled:
+                st.session_state.edit_project_id = None
+                st.rerun()
@@ -0,0 +1,255 @@
+# Plan Financier Familial - Page Revenus Variables
+
+from datetime import datetime, date
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from app_core import (
+    safe_get, filter_data_by_period, format_currency, get_revenu_id, ajouter_revenu,
+    modifier_revenu, supprimer_revenu, figure_memoisee, prevision_revenus,
+)
+
+def show_revenue_management():
+    """Page Gestion des Revenus Variables avec filtrage et dates"""
+    st.title("💰 Gestion des Revenus Variables")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période:** Toutes les données")
+    else:
+        periode_str = ""
+        if st.session_state.filter_month != "Tout":
+            periode_str += datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        if st.session_state.filter_year != "Tout":
+            if periode_str:
+                periode_str += f" {st.session_state.filter_year}"
+            else:
+                periode_str = f"Année {st.session_state.filter_year}"
+        st.markdown(f"**📅 Période:** {periode_str}")
+
+    st.markdown("""
+    Cette section permet de gérer les revenus qui fluctuent chaque mois 
+    (salaires supplémentaires, revenus business IIBA, loyers, etc.)
+    """)
+
+    # Actions principales
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        if st.button("➕ Ajouter Revenu", type="primary"):
+            st.session_state.show_add_revenue_form = True
+
+    # Formulaire d'ajout
+    if st.session_state.get('show_add_revenue_form', False):
+        show_add_revenue_form()
+
+    # Formulaire de modification
+    if st.session_state.get('edit_revenue_id'):
+        show_edit_revenue_form()
+
+    # Affichage revenus actuels avec filtrage
+    st.subheader("💼 Revenus Mensuels Actuels")
+
+    revenus_filtered = filter_data_by_period(st.session_state.revenus_variables, 'date_creation')
+
+    if revenus_filtered:
+        for revenu in revenus_filtered:
+            show_revenue_card(revenu)
+
+        # Total
+        total_revenus = sum(r['montant_mensuel'] for r in revenus_filtered)
+        st.markdown(f"### **Total Revenus: {format_currency(total_revenus)}**")
+
+    else:
+        st.info("Aucun revenu variable pour la période sélectionnée.")
+
+    # Graphique évolution filtré par période
+    st.subheader("📈 Évolution des Revenus")
+
+    if revenus_filtered:
+        # 12 mois de la période: historique enregistré, sinon prévision lissée
+        if st.session_state.filter_year != "Tout":
+            end_date = date(st.session_state.filter_year, 12, 1)
+        else:
+            end_date = date.today().replace(day=1)
+
+        prevision = prevision_revenus(end_date)
+
+        def figure_revenus():
+            df_revenus = pd.DataFrame(
+                dict(zip(prevision['sources'], prevision['montants'])),
+                index=prevision['mois'].astype('datetime64[ns]')
+            )
+            fig = px.line(df_revenus, title="Évolution des Revenus par Source")
+            fig.update_layout(height=400)
+            return fig
+
+        st.plotly_chart(figure_memoisee(('revenus_evolution', end_date), figure_revenus), use_container_width=True)
+        if not prevision['observes'].all():
+            st.caption(
+                "Mois sans historique enregistré: montant mensuel pour les revenus réguliers, "
+                "niveau lissé x saisonnalité de l'historique pour les revenus variables."
+            )
+
+def show_revenue_card(revenu):
+    """Affiche une carte de revenu avec possibilité de modification et informations de gestion"""
+    with st.container():
+        col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
+
+        with col1:
+            st.write(f"**{revenu['nom']}**")
+            st.caption(f"👤 {safe_get(revenu, 'responsable', 'Non défini')}")
+
+        with col2:
+            st.write(revenu['type'])
+
+        with col3:
+            st.write(format_currency(revenu['montant_mensuel']))
+
+        with col4:
+            st.write("🔄 Régulier" if revenu['regulier'] else "📊 Variable")
+
+        with col5:
+            col_edit, col_delete = st.columns(2)
+
+            # Utilisation sécurisée de l'ID
+            revenu_id = get_revenu_id(revenu)
+
+            with col_edit:
+                if st.button("✏️", key=f"edit_rev_{revenu_id}"):
+                    st.session_state.edit_revenue_id = revenu_id
+                    st.rerun()
+
+            with col_delete:
+                if st.button("🗑️", key=f"del_rev_{revenu_id}"):
+                    if st.session_state.get(f"confirm_delete_rev_{revenu_id}", False):
+                        # Suppression confirmée
+                        supprimer_revenu(revenu_id)
+                        st.success(f"Revenu '{revenu['nom']}' supprimé.")
+                        if f"confirm_delete_rev_{revenu_id}" in st.session_state:
+                            del st.session_state[f"confirm_delete_rev_{revenu_id}"]
+                        st.rerun()
+                    else:
+                        # Demande de confirmation
+                        st.session_state[f"confirm_delete_rev_{revenu_id}"] = True
+                        st.warning("Cliquez à nouveau pour confirmer.")
+
+        # Affichage dates de gestion
+        col1, col2 = st.columns(2)
+        with col1:
+            date_creation = safe_get(revenu, 'date_creation', datetime.now())
+            if isinstance(date_creation, str):
+                date_creation = datetime.strptime(date_creation, '%Y-%m-%d %H:%M:%S')
+            st.caption(f"📅 Créé: {date_creation.strftime('%d/%m/%Y %H:%M')}")
+
+        with col2:
+            date_modification = safe_get(revenu, 'date_modification', datetime.now())
+            if isinstance(date_modification, str):
+                date_modification = datetime.strptime(date_modification, '%Y-%m-%d %H:%M:%S')
+            st.caption(f"🔄 Modifié: {date_modification.strftime('%d/%m/%Y %H:%M')}")
+
+    st.markdown("---")
+
+def show_add_revenue_form():
+    """Formulaire d'ajout de revenu avec responsable et dates"""
+    with st.expander("➕ Ajouter un Revenu Variable", expanded=True):
+        with st.form("add_revenue_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                nom_revenu = st.text_input("Nom du revenu*", placeholder="ex: Bonus William")
+                type_revenu = st.selectbox("Type", st.session_state.admin_config['listes_config']['types_revenu'])
+                responsable = st.selectbox("Responsable*", st.session_state.admin_config['listes_config']['responsables'])
+
+            with col2:
+                montant_mensuel = st.number_input("Montant ce mois (FCFA)*", min_value=0, step=10000)
+                regulier = st.checkbox("Revenu régulier ?", help="Cocher si le montant est prévisible chaque mois")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.form_submit_button("✅ Ajouter Revenu", type="primary"):
+                    if nom_revenu and montant_mensuel > 0 and responsable:
+                        # Créer ID unique
+                        existing_ids = [safe_get(r, 'id', 0) for r in st.session_state.revenus_variables]
+                        numeric_ids = [id for id in existing_ids if isinstance(id, int)]
+                        new_id = max(numeric_ids) + 1 if numeric_ids else 1
+
+                        nouveau_revenu = {
+                            'id': new_id,
+                            'nom': nom_revenu,
+                            'montant_mensuel': montant_mensuel,
+                            'type': type_revenu,
+                            'regulier': regulier,
+                            'responsable': responsable,
+                            'date_creation': datetime.now(),
+                            'date_modification': datetime.now()
+                        }
+                        ajouter_revenu(nouveau_revenu)
+                        st.session_state.show_add_revenue_form = False
+                        st.success(f"Revenu '{nom_revenu}' ajouté !")
+                        st.rerun()
+                    else:
+                        st.error("Veuillez remplir tous les champs obligatoires.")
+
+            with col2:
+                if st.form_submit_button("❌ Annuler"):
+                    st.session_state.show_add_revenue_form = False
+                    st.rerun()
+
+def show_edit_revenue_form():
+    """Formulaire de modification de revenu avec dates"""
+    revenue_id = st.session_state.edit_revenue_id
+
+    # Trouver le revenu avec gestion sécurisée des IDs
+    revenu = next((r for r in st.session_state.revenus_variables if get_revenu_id(r) == revenue_id), None)
+
+    if not revenu:
+        st.error("Revenu introuvable")
+        st.session_state.edit_revenue_id = None
+        return
+
+    with st.expander(f"✏️ Modifier: {revenu['nom']}", expanded=True):
+        with st.form("edit_revenue_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                nom_revenu = st.text_input("Nom du revenu*", value=revenu['nom'])
+                type_revenu = st.selectbox(
+                    "Type", 
+                    st.session_state.admin_config['listes_config']['types_revenu'],
+                    index=st.session_state.admin_config['listes_config']['types_revenu'].index(revenu['type'])
+                )
+                responsable = st.selectbox(
+                    "Responsable*", 
+                    st.session_state.admin_config['listes_config']['responsables'],
+                    index=st.session_state.admin_config['listes_config']['responsables'].index(safe_get(revenu, 'responsable', 'Alix'))
+                )
+
+            with col2:
+                montant_mensuel = st.number_input("Montant ce mois (FCFA)*", value=revenu['montant_mensuel'], step=10000)
+                regulier = st.checkbox("Revenu régulier ?", value=revenu['regulier'])
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.form_submit_button("💾 Sauvegarder", type="primary"):
+                    # Mettre à jour le revenu
+                    modifier_revenu(revenue_id, {
+                        'nom': nom_revenu,
+                        'montant_mensuel': montant_mensuel,
+                        'type': type_revenu,
+                        'regulier': regulier,
+                        'responsable': responsable,
+                        'date_modification': datetime.now()
+                    })
+
+                    st.session_state.edit_revenue_id = None
+                    st.success("Revenu modifié!")
+                    st.rerun()
+
+            with col2:
+                if st.form_submit_button("❌ Annuler"):
+                    st.session_state.edit_revenue_id = None
+                    st.rerun()
@@ -0,0 +1,124 @@
+# Plan Financier Familial - Page Scénarios What-If
+# Variantes du plan (décalage, budget, cash flow, revenu) comparées côte à côte:
+# KPIs de la période et soldes projetés jusqu'en 2030.
+
+from datetime import datetime
+import time
+
+import streamlit as st
+import pandas as pd
+
+from app_core import base_scenarios, evaluer_scenarios, format_currency
+from finance_core.scenarios import ACTIONS, LIMITE_BALAYAGE, balayage, libelle_modification, modification, variante
+
+PLAN_ACTUEL = "📌 Plan actuel"
+
+def noms_cibles(type_cible):
+    """Noms distincts des projets ou des revenus, triés"""
+    enregistrements = st.session_state.projets if type_cible == 'projet' else st.session_state.revenus_variables
+    return sorted({e['nom'] for e in enregistrements})
+
+def ajouter_modification(nom, modif):
+    """Ajoute la modification à la variante de ce nom (créée si besoin)"""
+    variantes = st.session_state.variantes_scenarios
+    existante = next((v for v in variantes if v['nom'] == nom), None)
+    if existante is None:
+        variantes.append(variante(nom, modif))
+    else:
+        existante['modifications'].append(modif)
+
+def tableau_resultats(resultats, annees):
+    """DataFrame de comparaison: KPIs, écart au plan actuel et soldes projetés par année"""
+    reference = resultats[0]['kpis']['cash_flow_mensuel']
+    lignes = []
+    for resultat in resultats:
+        kpis = resultat['kpis']
+        ligne = {
+            'Variante': resultat['nom'],
+            'Cash Flow Mensuel': kpis['cash_flow_mensuel'],
+            'Écart Cash Flow': kpis['cash_flow_mensuel'] - reference,
+            'Revenus Passifs %': round(kpis['revenus_passifs_pct'], 1),
+            'Ratio Actifs %': round(kpis['ratio_actifs_passifs'], 1),
+            'Phase': kpis['phase_actuelle'],
+        }
+        for annee, solde in zip(annees, resultat['soldes_annuels']):
+            ligne[f'Solde fin {annee}'] = solde
+        ligne['Premier Déficit'] = str(resultat['premier_deficit']) if resultat['premier_deficit'] is not None else "—"
+        lignes.append(ligne)
+    return pd.DataFrame(lignes)
+
+def show_scenarios():
+    """Page Scénarios What-If: variantes du plan évaluées et comparées"""
+    st.title("🧪 Scénarios What-If")
+    st.session_state.setdefault('variantes_scenarios', [])
+
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        st.markdown("**📅 Période des KPIs:** Toutes les données")
+    elif st.session_state.filter_month != "Tout" and st.session_state.filter_year != "Tout":
+        mois_nom = datetime(2025, st.session_state.filter_month, 1).strftime('%B')
+        st.markdown(f"**📅 Période des KPIs:** {mois_nom} {st.session_state.filter_year}")
+    else:
+        st.markdown("**📅 Période des KPIs:** Filtre partiel")
+
+    # Définition d'une variante
+    st.markdown("### ➕ Définir une Variante")
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    with col1:
+        action = st.selectbox("Modification", list(ACTIONS), format_func=lambda a: ACTIONS[a][1],
+                              key="scenario_action")
+    with col2:
+        cible = st.selectbox("Cible", noms_cibles(ACTIONS[action][0]), key="scenario_cible")
+    with col3:
+        if action == 'decaler':
+            valeur = st.number_input("Décalage (mois)", min_value=-60, max_value=120, value=6, step=1,
+                                     key="scenario_mois")
+        else:
+            variation = st.number_input("Variation (%)", min_value=-100.0, max_value=1000.0, value=-10.0,
+                                        step=5.0, key="scenario_variation")
+            valeur = 1 + variation / 100
+    with col4:
+        nom_variante = st.text_input("Variante", placeholder="Nom (optionnel)", key="scenario_nom")
+
+    if st.button("➕ Ajouter à la variante", type="primary", disabled=cible is None):
+        modif = modification(action, cible, valeur)
+        ajouter_modification(nom_variante.strip() or libelle_modification(modif), modif)
+        st.rerun()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(f"🔁 Générer un balayage ({LIMITE_BALAYAGE} variantes max)"):
+            st.session_state.variantes_scenarios = balayage(noms_cibles('projet'))
+            st.rerun()
+    with col2:
+        if st.button("🗑️ Vider les variantes", disabled=not st.session_state.variantes_scenarios):
+            st.session_state.variantes_scenarios = []
+            st.rerun()
+
+    variantes = st.session_state.variantes_scenarios
+    if not variantes:
+        st.info("Ajoutez une variante ou générez un balayage pour comparer les scénarios au plan actuel.")
+        return
+
+    # Évaluation (plan actuel en première ligne, variante sans modification)
+    debut = time.perf_counter()
+    resultats = evaluer_scenarios([variante(PLAN_ACTUEL)] + variantes)
+    duree_ms = (time.perf_counter() - debut) * 1000
+
+    st.markdown("### 📊 Comparaison des Scénarios")
+    meilleur = max(resultats[1:], key=lambda r: r['solde_final'])
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Variantes Évaluées", len(variantes), delta=f"{duree_ms:.0f} ms", delta_color="off")
+    col2.metric("Solde Projeté (plan actuel)", format_currency(resultats[0]['solde_final']))
+    col3.metric("Meilleure Variante", format_currency(meilleur['solde_final']),
+                delta=format_currency(meilleur['solde_final'] - resultats[0]['solde_final']))
+    st.caption(f"Meilleure variante: {meilleur['nom']}")
+
+    st.dataframe(tableau_resultats(resultats, base_scenarios()['annees']), use_container_width=True, hide_index=True)
+    st.caption(
+        "KPIs de la période filtrée (même calcul que le tableau de bord); soldes cumulés projetés sur tout le "
+        "plan, revenus irréguliers à leur moyenne historique."
+    )
+
+    with st.expander("📝 Détail des variantes"):
+        for v in variantes:
+            st.markdown(f"**{v['nom']}**: " + ", ".join(libelle_modification(m) for m in v['modifications']))
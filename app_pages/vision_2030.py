@@ -0,0 +1,198 @@
+# Plan Financier Familial - Page Vision 2030
+
+from datetime import date
+
+import numpy as np
+import streamlit as st
+
+from app_core import calculer_kpis, format_currency, objectif_2030
+from finance_core.objectif_2030 import (
+    COUT_ENFANTS_CHF, COUT_FAMILLE_CHF, TAUX_CHF_FCFA, effort_minimal, revenus_passifs_requis,
+)
+
+# Décalages de début (en mois) présentés dans le tableau du solveur
+DEBUTS_PRESENTES = (0, 6, 12, 24, 36)
+
+def _libelle_mois(decalage):
+    """Mois calendaire à ``decalage`` mois du mois courant, 'Jamais' si infini"""
+    if not np.isfinite(decalage):
+        return "Jamais"
+    aujourd_hui = date.today()
+    annee, mois = divmod(aujourd_hui.month - 1 + int(decalage), 12)
+    return date(aujourd_hui.year + annee, mois + 1, 1).strftime('%m/%Y')
+
+def afficher_solveur_objectif():
+    """Faisabilité de l'objectif: efforts mensuels x rendements x dates de début"""
+    st.markdown("### 🧮 Faisabilité de l'Objectif")
+    grille = objectif_2030()
+    manque = grille['cible'] - grille['revenus_passifs']
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Revenus Passifs Actuels", format_currency(grille['revenus_passifs']))
+    col2.metric("Manque à Combler", format_currency(max(manque, 0)))
+    col3.metric("Excédent Mensuel Investissable", format_currency(grille['excedent']))
+
+    if manque <= 0:
+        st.success("🎉 Les revenus passifs actuels couvrent déjà l'objectif 2030")
+        return
+
+    rendements = grille['rendements']
+    rendement = st.select_slider(
+        "Rendement annuel des nouveaux actifs (ROI attendus des actifs générateurs)",
+        options=rendements.tolist(), value=float(rendements[len(rendements) // 2]),
+        format_func=lambda r: f"{r:g}%", key="vision_rendement"
+    )
+    j = int(np.searchsorted(rendements, rendement))
+    minimaux = effort_minimal(grille)[j]
+
+    # Ligne de la grille correspondant à l'excédent actuel (ajouté à la grille s'il est positif)
+    avec_excedent = grille['excedent'] > 0
+    i = int(np.searchsorted(grille['contributions'], grille['excedent']))
+    if avec_excedent:
+        st.info(f"💡 En investissant l'excédent actuel dès ce mois-ci, objectif atteint: "
+                f"**{_libelle_mois(grille['mois_atteinte'][i, j, 0])}**")
+    else:
+        st.warning("⚠️ Aucun excédent mensuel à investir: l'objectif suppose un effort d'épargne supplémentaire")
+
+    lignes = [
+        "| Début des versements | Effort minimal pour janvier 2030 | Atteinte avec l'excédent actuel |",
+        "|---|---|---|",
+    ]
+    for debut in DEBUTS_PRESENTES:
+        if debut >= len(grille['debuts']):
+            break
+        effort = "Hors d'atteinte" if np.isinf(minimaux[debut]) else f"{format_currency(minimaux[debut])}/mois"
+        atteinte = _libelle_mois(grille['mois_atteinte'][i, j, debut]) if avec_excedent else "Jamais"
+        lignes.append(f"| {_libelle_mois(debut)} | {effort} | {atteinte} |")
+    st.markdown("\n".join(lignes))
+
+    nb_scenarios = grille['mois_atteinte'].size
+    st.caption(
+        f"{nb_scenarios:,} scénarios évalués (efforts x rendements x dates de début). ".replace(",", " ")
+        + "Les revenus des nouveaux actifs sont réinvestis jusqu'à l'atteinte de l'objectif."
+    )
+
+def show_vision_2030():
+    """Page Vision Familiale 2030 avec calculs basés sur période actuelle"""
+    st.title("🔮 Vision Familiale 2030")
+
+    # Affichage période
+    if st.session_state.filter_month == "Tout" and st.session_state.filter_year == "Tout":
+        current_date = date.today()
+        st.markdown(f"**📅 Période actuelle:** {current_date.strftime('%B %Y')}")
+    else:
+        if st.session_state.filter_year != "Tout" and st.session_state.filter_month != "Tout":
+            current_date = date(st.session_state.filter_year, st.session_state.filter_month, 1)
+            st.markdown(f"**📅 Période actuelle:** {current_date.strftime('%B %Y')}")
+        else:
+            current_date = date.today()
+            st.markdown("**📅 Période actuelle:** Date actuelle (filtre partiel)")
+
+    st.subheader("🇨🇭 Objectif: Toute la famille en Suisse avec indépendance financière")
+
+    # Progression vers 2030 basée sur la période actuelle
+    target_date = date(2030, 1, 1)
+    jours_restants = (target_date - current_date).days
+    mois_restants = jours_restants // 30
+
+    st.metric("⏰ Temps Restant", f"{mois_restants} mois", delta=f"{jours_restants} jours")
+
+    # Milestones avec dates précises
+    st.markdown("### 📅 Roadmap Stratégique vers 2030")
+
+    milestones = [
+        {'annee': 2025, 'titre': 'Stabilisation', 'description': 'Finaliser actifs Cameroun + cash flow positif', 'statut': 'en-cours'},
+        {'annee': 2026, 'titre': 'Transition', 'description': 'Développement revenus passifs 15%+', 'statut': 'planifie'},
+        {'annee': 2027, 'titre': 'Expansion', 'description': 'Multiplication actifs générateurs', 'statut': 'futur'},
+        {'annee': 2028, 'titre': 'Préparation', 'description': 'Déménagement famille - visa/scolarité', 'statut': 'futur'},
+        {'annee': 2029, 'titre': 'Installation', 'description': 'Installation progressive en Suisse', 'statut': 'futur'},
+        {'annee': 2030, 'titre': 'Indépendance', 'description': 'Indépendance financière complète', 'statut': 'objectif'}
+    ]
+
+    annee_reference = st.session_state.filter_year if st.session_state.filter_year != "Tout" else current_date.year
+
+    for milestone in milestones:
+        annee = milestone['annee']
+        progress = max(0, min(100, ((annee - 2025) / 5) * 100))
+
+        if annee <= annee_reference:
+            if milestone['statut'] == 'en-cours':
+                st.success(f"🔄 **{annee} - EN COURS:** {milestone['titre']} - {milestone['description']}")
+            else:
+                st.success(f"✅ **{annee} - RÉALISÉ:** {milestone['titre']} - {milestone['description']}")
+        elif annee == annee_reference + 1:
+            st.warning(f"🎯 **{annee} - PROCHAINE ÉTAPE:** {milestone['titre']} - {milestone['description']}")
+        else:
+            st.info(f"⏳ **{annee} - FUTUR:** {milestone['titre']} - {milestone['description']}")
+
+        st.progress(progress / 100)
+
+    # Calculs financiers actualisés
+    st.markdown("### 💰 Exigences Financières Actualisées")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 📊 Situation Actuelle")
+        kpis = calculer_kpis()
+
+        st.metric("Cash Flow Mensuel", format_currency(kpis['cash_flow_mensuel']))
+        st.metric("Revenus Passifs", f"{kpis['revenus_passifs_pct']:.1f}%")
+        st.metric("Actifs Générateurs", f"{kpis['nombre_actifs']} projets")
+
+    with col2:
+        st.markdown("#### 🎯 Objectifs 2030")
+
+        # Calculs pour 2030
+        cout_total_chf = COUT_ENFANTS_CHF + COUT_FAMILLE_CHF  # Scolarité enfants + logement et vie
+        cout_total_fcfa = cout_total_chf * TAUX_CHF_FCFA  # Taux approximatif
+
+        st.metric("Coût Total Suisse", f"{cout_total_chf:,} CHF/an")
+        st.metric("Équivalent FCFA", f"{cout_total_fcfa:,.0f} FCFA/an")
+
+        st.metric("Revenus Passifs Requis", f"{revenus_passifs_requis():,.0f} FCFA/mois")
+
+    afficher_solveur_objectif()
+
+    # Progression mensuelle vers objectif
+    st.markdown("### 📈 Progression Mensuelle vers Objectif")
+
+    # Calculer progression basée sur période actuelle
+    mois_ecoules = (annee_reference - 2025) * 12
+    if st.session_state.filter_month != "Tout":
+        mois_ecoules += st.session_state.filter_month
+    else:
+        mois_ecoules += current_date.month
+
+    progression_actuelle = min(mois_ecoules / 60 * 100, 100)  # 60 mois jusqu'à 2030
+
+    st.progress(progression_actuelle / 100)
+    st.markdown(f"**Progression générale:** {progression_actuelle:.1f}% vers objectif 2030")
+
+    # Actions prioritaires pour la période actuelle
+    st.markdown(f"### 🎯 Actions Prioritaires")
+
+    if annee_reference == 2025:
+        actions = [
+            "✅ Finaliser titre foncier Mejeuh",
+            "📈 Développer IIBA pour 500k FCFA/mois",
+            "💰 Atteindre cash flow mensuel positif",
+            "🏦 Constituer fonds d urgence 6 mois"
+        ]
+    elif annee_reference == 2026:
+        actions = [
+            "🏠 Acquérir 2ème propriété locative",
+            "💼 William: développer side-business",
+            "📊 Atteindre 20% revenus passifs",
+            "🎓 Formation investissement Alix"
+        ]
+    else:
+        actions = [
+            "🌍 Préparer dossiers immigration Suisse",
+            "🏫 Rechercher écoles enfants Suisse",
+            "💰 Optimiser transferts Cameroun-Suisse",
+            "🎯 Diversifier revenus passifs"
+        ]
+
+    for action in actions:
+        st.write(f"• {action}")
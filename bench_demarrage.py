@@ -0,0 +1,93 @@
+# Plan Financier Familial - Harnais de démarrage à froid
+# Usage: python bench_demarrage.py [repetitions]
+# Chaque mesure tourne dans un processus Python neuf: import du socle (app_core),
+# import de chaque page seule, premier rendu complet, et pour comparaison les
+# imports anticipés de l'ancien app.py monolithique. Code retour 1 si le socle ou
+# une page légère charge une bibliothèque lourde.
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RACINE = os.path.dirname(os.path.abspath(__file__))
+# streamlit importe déjà plotly.graph_objects lui-même: seuls les modules en plus comptent
+LOURDES = ('plotly.express', 'pandas', 'xlsxwriter', 'openpyxl')
+
+# Pages sans graphique ni DataFrame: aucune bibliothèque lourde attendue
+PAGES_LEGERES = ('kanban', 'mentors', 'education', 'vision_2030')
+
+# Imports en tête de l'ancien app.py (avant le registre de pages)
+IMPORTS_MONOLITHE = (
+    'import plotly.express, pandas, xlsxwriter, openpyxl',
+    'import app_core',
+)
+
+MESURE = '''
+import json, sys, time
+sys.path.insert(0, {racine!r})
+debut = time.perf_counter()
+{code}
+duree = time.perf_counter() - debut
+print(json.dumps({{'duree': duree, 'lourdes': sorted(m for m in {lourdes!r} if m in sys.modules)}}))
+'''
+
+RENDU = '''
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+assert not at.exception, at.exception
+'''
+
+
+def mesurer(code, repetitions):
+    """Durée médiane (processus neufs) et bibliothèques lourdes chargées"""
+    script = MESURE.format(racine=RACINE, code=code, lourdes=LOURDES)
+    durees, lourdes = [], []
+    for _ in range(repetitions):
+        sortie = subprocess.run([sys.executable, '-c', script], cwd=RACINE, capture_output=True, text=True, check=True)
+        resultat = json.loads(sortie.stdout.strip().splitlines()[-1])
+        durees.append(resultat['duree'])
+        lourdes = resultat['lourdes']
+    return statistics.median(durees), lourdes
+
+
+def afficher(libelle, duree, lourdes):
+    print(f"{libelle:<36} {duree * 1000:8.0f} ms   {', '.join(lourdes) or '-'}")
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    from app_pages import PAGES
+    echecs = []
+
+    print(f"{'mesure':<36} {'médiane':>11}   bibliothèques lourdes chargées")
+    duree, lourdes = mesurer('import streamlit', repetitions)
+    afficher("streamlit seul", duree, lourdes)
+
+    duree, lourdes = mesurer('\n'.join(IMPORTS_MONOLITHE), repetitions)
+    afficher("avant: imports de l'ancien app.py", duree, lourdes)
+
+    duree, lourdes = mesurer('import app_core', repetitions)
+    afficher("après: socle app_core", duree, lourdes)
+    if lourdes:
+        echecs.append(f"app_core charge {', '.join(lourdes)}")
+
+    for libelle, (module, _) in PAGES.items():
+        duree, lourdes = mesurer(f'import app_core\nimport app_pages.{module}', repetitions)
+        afficher(f"  + page {module}", duree, lourdes)
+        if module in PAGES_LEGERES and lourdes:
+            echecs.append(f"page {module} charge {', '.join(lourdes)}")
+
+    duree, lourdes = mesurer(RENDU.format(app=os.path.join(RACINE, 'app.py')), repetitions)
+    afficher("premier rendu complet (Dashboard)", duree, lourdes)
+
+    if echecs:
+        print("\nÉCHEC: " + "; ".join(echecs))
+        sys.exit(1)
+    print("\nOK: socle et pages légères sans bibliothèque lourde")
+
+
+if __name__ == '__main__':
+    main()
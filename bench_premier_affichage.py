@@ -0,0 +1,115 @@
+# Plan Financier Familial - Benchmark démarrage / premier affichage
+# Usage: python bench_premier_affichage.py [delai_reseau_s]
+# Mesure le démarrage du serveur, le premier rendu et les reruns, les octets de CSS
+# envoyés par rerun et la feuille servie en statique (polices système); compare à
+# l'ancienne feuille inline avec @import Google Fonts (bloquante sur un déploiement hors ligne).
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from streamlit.testing.v1 import AppTest
+
+RACINE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(RACINE, 'app.py')
+FEUILLE = os.path.join(RACINE, 'static', 'style.css')
+URL_GOOGLE_FONTS = 'https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap'
+RERUNS = 5
+
+
+def port_libre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def lire_url(url, delai):
+    """(statut, octets, durée); statut = code HTTP ou nom de l'erreur réseau"""
+    debut = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=delai) as reponse:
+            return reponse.status, len(reponse.read()), time.perf_counter() - debut
+    except urllib.error.HTTPError as erreur:
+        return erreur.code, 0, time.perf_counter() - debut
+    except (urllib.error.URLError, OSError) as erreur:
+        raison = getattr(erreur, 'reason', erreur)
+        return type(raison).__name__, 0, time.perf_counter() - debut
+
+
+def mesurer_serveur(delai):
+    """Démarrage de ``streamlit run`` jusqu'au health check, puis ressources du premier affichage"""
+    port = port_libre()
+    base = f'http://127.0.0.1:{port}'
+    debut = time.perf_counter()
+    serveur = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP, '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        cwd=RACINE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while lire_url(f'{base}/_stcore/health', 1)[0] != 200:
+            if serveur.poll() is not None or time.perf_counter() - debut > 60:
+                print("Serveur non démarré")
+                return
+            time.sleep(0.05)
+        print(f"{'démarrage serveur (health)':<34} {time.perf_counter() - debut:8.3f} s")
+        for libelle, chemin in (('page index', '/'), ('feuille de style', '/app/static/style.css')):
+            statut, octets, duree = lire_url(base + chemin, delai)
+            print(f"{libelle:<34} {duree * 1000:8.1f} ms   {octets / 1024:7.1f} Ko   statut {statut}")
+    finally:
+        serveur.terminate()
+        serveur.wait()
+
+
+def octets_css(at):
+    """Octets de CSS (balises <style> / <link>) envoyés dans un rendu"""
+    return sum(
+        len(m.value.encode('utf-8')) for m in at.markdown
+        if '<style' in m.value or 'rel="stylesheet"' in m.value
+    )
+
+
+def mesurer_rendu():
+    at = AppTest.from_file(APP, default_timeout=120)
+    debut = time.perf_counter()
+    at.run()
+    premier = time.perf_counter() - debut
+    assert not at.exception, at.exception
+    css_premier = octets_css(at)
+
+    durees = []
+    for _ in range(RERUNS):
+        debut = time.perf_counter()
+        at.run()
+        durees.append(time.perf_counter() - debut)
+    print(f"{'premier rendu (script complet)':<34} {premier:8.3f} s")
+    print(f"{'rerun (moyenne)':<34} {sum(durees) / len(durees):8.3f} s")
+    print(f"{'CSS envoyé par rerun':<34} {css_premier:8d} octets (actuel)")
+    return css_premier
+
+
+def main():
+    delai = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    print(f"Délai réseau simulé côté navigateur: {delai:.0f} s\n")
+
+    print("== Après: feuille servie en statique, polices système ==")
+    mesurer_serveur(delai)
+    css_actuel = mesurer_rendu()
+
+    print("\n== Avant: feuille inline + @import Google Fonts ==")
+    with open(FEUILLE, encoding='utf-8') as fichier:
+        ancien = f"<style>@import url('{URL_GOOGLE_FONTS}');\n{fichier.read()}</style>"
+    octets_ancien = len(ancien.encode('utf-8'))
+    print(f"{'CSS envoyé par rerun':<34} {octets_ancien:8d} octets "
+          f"({octets_ancien / max(css_actuel, 1):.0f}x, {octets_ancien * (RERUNS + 1)} sur {RERUNS + 1} rendus)")
+    statut, _, duree = lire_url(URL_GOOGLE_FONTS, delai)
+    print(f"{'@import Google Fonts':<34} {duree * 1000:8.1f} ms   statut {statut} "
+          "(premier affichage retardé jusqu'à la réponse ou l'expiration)")
+
+
+if __name__ == '__main__':
+    main()
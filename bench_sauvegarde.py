@@ -0,0 +1,105 @@
+# Plan Financier Familial - Benchmark sauvegarde / restauration JSON
+# Usage: python bench_sauvegarde.py [nombre_entrees_suivi]
+# Compare l'ancienne méthode (copie + json.dumps indent=2) à l'écriture en flux.
+
+from datetime import date, datetime, timedelta
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from json_backup import ecrire_sauvegarde, lire_sauvegarde
+
+MOIS_PAR_PROJET = 24
+
+
+def generer_projets(entrees_suivi):
+    """Projets synthétiques totalisant ``entrees_suivi`` entrées de suivi mensuel"""
+    rng = random.Random(42)
+    projets = []
+    for i in range(max(1, entrees_suivi // MOIS_PAR_PROJET)):
+        creation = datetime(2024, 1, 1) + timedelta(days=rng.randrange(700))
+        projets.append({
+            'id': i + 1,
+            'nom': f"Projet {i + 1}",
+            'type': rng.choice(['Actif générateur', 'Passif', 'Investissement formation']),
+            'montant_total': rng.randrange(100_000, 10_000_000),
+            'budget_alloue_mensuel': rng.randrange(10_000, 500_000),
+            'montant_utilise_reel': 0,
+            'cash_flow_mensuel': rng.randrange(-500_000, 500_000),
+            'statut': rng.choice(['Planifié', 'En cours', 'Réalisé']),
+            'echeance': date(2026, 1, 1) + timedelta(days=rng.randrange(1500)),
+            'roi_attendu': rng.randrange(0, 30),
+            'priorite': rng.choice(['Critique', 'Haute', 'Moyenne', 'Faible']),
+            'description': "Projet synthétique",
+            'source_financement': 'Salaire William',
+            'responsable': rng.choice(['Alix', 'William']),
+            'date_creation': creation,
+            'date_modification': creation,
+            'suivi_mensuel': [
+                {'mois': f"{2024 + m // 12}-{m % 12 + 1:02d}", 'prevu': 100_000, 'reel': rng.randrange(200_000)}
+                for m in range(MOIS_PAR_PROJET)
+            ],
+        })
+    return projets
+
+
+def ancienne_sauvegarde(projets, revenus, admin_config):
+    """Méthode historique (copie profonde pour ne pas altérer les données du benchmark)"""
+    backup_data = {
+        'projets': copy.deepcopy(projets),
+        'revenus_variables': copy.deepcopy(revenus),
+        'admin_config': admin_config,
+        'timestamp': datetime.now().isoformat()
+    }
+    for projet in backup_data['projets']:
+        for champ in ('echeance', 'date_creation', 'date_modification'):
+            projet[champ] = projet[champ].isoformat()
+    for revenu in backup_data['revenus_variables']:
+        for champ in ('date_creation', 'date_modification'):
+            revenu[champ] = revenu[champ].isoformat()
+    return json.dumps(backup_data, indent=2, ensure_ascii=False)
+
+
+def mesurer(libelle, fonction):
+    tracemalloc.start()
+    debut = time.perf_counter()
+    resultat = fonction()
+    duree = time.perf_counter() - debut
+    pic = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{libelle:<32} {duree:8.3f} s   pic {pic / 1024 / 1024:8.1f} Mo")
+    return resultat
+
+
+def main():
+    entrees_suivi = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    projets = generer_projets(entrees_suivi)
+    revenus = [{
+        'id': 1, 'nom': 'Salaire William', 'montant_mensuel': 800_000, 'type': 'Salaire', 'regulier': True,
+        'responsable': 'William', 'date_creation': datetime(2024, 12, 1), 'date_modification': datetime(2025, 1, 1)
+    }]
+    admin_config = {'kpis_config': {'objectif_cash_flow': 500_000}}
+    print(f"{len(projets)} projets, {sum(len(p['suivi_mensuel']) for p in projets)} entrées de suivi\n")
+
+    mesurer("ancienne (dumps indent=2)", lambda: ancienne_sauvegarde(projets, revenus, admin_config))
+
+    with tempfile.TemporaryDirectory() as dossier:
+        for libelle, compact, compresser, nom in (
+            ("flux lisible", False, False, 'lisible.json'),
+            ("flux compact", True, False, 'compact.json'),
+            ("flux compact + gzip", True, True, 'compact.json.gz'),
+        ):
+            chemin = os.path.join(dossier, nom)
+            mesurer(libelle, lambda: ecrire_sauvegarde(chemin, projets, revenus, admin_config, compact, compresser))
+            taille = os.path.getsize(chemin) / 1024 / 1024
+            restaure = mesurer(f"  restauration ({taille:.1f} Mo)", lambda: lire_sauvegarde(chemin))
+            assert restaure['projets'] == projets and restaure['revenus'] == revenus
+
+
+if __name__ == '__main__':
+    main()
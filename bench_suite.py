@@ -0,0 +1,180 @@
+# Plan Financier Familial - Suite de benchmarks (sans serveur Streamlit)
+# Usage: python bench_suite.py [--tailles 1000,10000,100000] [--repetitions 3]
+#                              [--sortie bench_resultats.json] [--reference ancien.json]
+# Génère des plans synthétiques (synthetic_data), les charge dans une session
+# Streamlit en mode bare et chronomètre les fonctions métier. Les résultats sont
+# écrits en JSON; --reference compare à un fichier précédent (code retour 1 si
+# une opération régresse au-delà du seuil).
+
+from datetime import datetime
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Mesures en mémoire uniquement: pas de persistance SQLite ni de journal
+os.environ.pop('PLAN_FINANCIER_DB', None)
+os.environ.pop('PLAN_FINANCIER_JOURNAL', None)
+
+import numpy as np
+import streamlit as st
+
+import app_core
+from finance_core import categorize_project
+from synthetic_data import generer_plan
+
+FORMAT_RESULTATS = 'plan_financier_bench'
+VERSION_FORMAT = 1
+TAILLES_DEFAUT = (1_000, 10_000, 100_000)
+# Une opération plus longue que ce budget n'est mesurée qu'une fois
+DUREE_MAX_REPETITIONS = 10.0
+SEUIL_REGRESSION = 1.25
+# En dessous, le bruit de mesure domine: pas de verdict de régression
+DUREE_MIN_COMPARAISON = 0.005
+
+
+def charger_session(projets, revenus):
+    """Session bare remplie avec le plan synthétique, filtre sur une année"""
+    app_core.initialize_session_state()
+    app_core.remplacer_donnees(projets=projets, revenus=revenus)
+    st.session_state.filter_year = 2025
+    st.session_state.filter_month = "Tout"
+
+
+def operations(dossier):
+    session = st.session_state
+
+    def kpis_a_froid():
+        app_core.get_plan().cache_aggregats.vider()
+        return app_core.calculer_kpis()
+
+    return {
+        'filter_data_by_period': lambda: app_core.filter_data_by_period(session.projets, 'date_creation'),
+        'calculer_kpis': kpis_a_froid,
+        'calculer_kpis_complet': app_core.calculer_kpis_complet,
+        'categorize_project': lambda: [categorize_project(p) for p in session.projets],
+        'filter_projects': lambda: app_core.filter_projects(session.projets, "Passif", "En cours", "Toutes", "Échéance"),
+        'export_to_excel': lambda: app_core.export_to_excel(os.path.join(dossier, 'export.xlsx')),
+        'sauvegarde_json': lambda: app_core.sauvegarder_json(
+            os.path.join(dossier, 'sauvegarde.json.gz'), compact=True, compresser=True
+        ),
+    }
+
+
+def mesurer(fonction, repetitions):
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+        if durees[-1] > DUREE_MAX_REPETITIONS:
+            break
+    return durees
+
+
+def environnement():
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'streamlit': st.__version__,
+        'plateforme': platform.platform(),
+        'processeurs': os.cpu_count(),
+    }
+
+
+def comparer(resultats, reference, seuil):
+    """Affiche les ratios médiane actuelle / référence; retourne les régressions"""
+    anciens = {(r['taille'], r['operation']): r['median_s'] for r in reference['resultats']}
+    regressions = []
+    print(f"\nComparaison avec {reference.get('environnement', {}).get('commit') or 'la référence'}:")
+    for r in resultats:
+        ancien = anciens.get((r['taille'], r['operation']))
+        if ancien is None:
+            continue
+        ratio = r['median_s'] / ancien if ancien > 0 else float('inf')
+        regression = ratio > seuil and max(r['median_s'], ancien) >= DUREE_MIN_COMPARAISON
+        if regression:
+            regressions.append(r)
+        print(f"  {r['taille']:>7} {r['operation']:<24} {ancien:9.4f} s -> {r['median_s']:9.4f} s  "
+              f"x{ratio:5.2f}{'  RÉGRESSION' if regression else ''}")
+    return regressions
+
+
+def main():
+    parseur = argparse.ArgumentParser(description=(
+        "Suite de benchmarks du Plan Financier Familial (sans serveur Streamlit): chronomètre les "
+        "fonctions métier sur des plans synthétiques, écrit les résultats en JSON et, avec --reference, "
+        "les compare à un fichier précédent (code retour 1 en cas de régression)."
+    ))
+    parseur.add_argument('--tailles', default=','.join(map(str, TAILLES_DEFAUT)),
+                         help="Nombres de projets des plans générés, séparés par des virgules")
+    parseur.add_argument('--repetitions', type=int, default=3, help="Mesures par opération")
+    parseur.add_argument('--operations', help="Sous-ensemble d'opérations, séparées par des virgules")
+    parseur.add_argument('--sortie', default='bench_resultats.json', help="Fichier JSON des résultats")
+    parseur.add_argument('--reference', help="Résultats précédents à comparer")
+    parseur.add_argument('--seuil', type=float, default=SEUIL_REGRESSION,
+                         help="Ratio de durée au-delà duquel une opération régresse")
+    args = parseur.parse_args()
+
+    resultats = []
+    with tempfile.TemporaryDirectory() as dossier:
+        catalogue = operations(dossier)
+        selection = args.operations.split(',') if args.operations else list(catalogue)
+        for taille in map(int, args.tailles.split(',')):
+            debut = time.perf_counter()
+            projets, revenus = generer_plan(taille)
+            generation = time.perf_counter() - debut
+            entrees_suivi = sum(len(p['suivi_mensuel']) for p in projets)
+            charger_session(projets, revenus)
+            del projets
+            print(f"\n{taille} projets, {len(revenus)} revenus, {entrees_suivi} entrées de suivi "
+                  f"(génération {generation:.1f} s)")
+
+            for operation in selection:
+                durees = mesurer(catalogue[operation], args.repetitions)
+                resultat = {
+                    'taille': taille,
+                    'operation': operation,
+                    'median_s': statistics.median(durees),
+                    'min_s': min(durees),
+                    'repetitions': len(durees),
+                    'revenus': len(revenus),
+                    'entrees_suivi': entrees_suivi,
+                }
+                resultats.append(resultat)
+                print(f"  {operation:<24} {resultat['median_s']:9.4f} s  (min {resultat['min_s']:.4f}, "
+                      f"{resultat['repetitions']} mesures)")
+
+    sortie = {
+        'format': FORMAT_RESULTATS,
+        'version': VERSION_FORMAT,
+        'horodatage': datetime.now().isoformat(timespec='seconds'),
+        'environnement': environnement(),
+        'resultats': resultats,
+    }
+    with open(args.sortie, 'w', encoding='utf-8') as fichier:
+        json.dump(sortie, fichier, ensure_ascii=False, indent=2)
+    print(f"\nRésultats: {args.sortie}")
+
+    if args.reference:
+        with open(args.reference, encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        if comparer(resultats, reference, args.seuil):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Plan Financier Familial - Export Excel en flux
+# Les lignes sont écrites directement depuis les stores avec xlsxwriter en mode
+# constant_memory (une seule ligne en mémoire par feuille), vers un fichier.
+
+from datetime import date, datetime
+import numbers
+
+import xlsxwriter
+
+COLONNES_PROJETS = (
+    'id', 'nom', 'type', 'montant_total', 'budget_alloue_mensuel', 'montant_utilise_reel',
+    'cash_flow_mensuel', 'statut', 'echeance', 'roi_attendu', 'priorite', 'description',
+    'source_financement', 'responsable', 'date_creation', 'date_modification'
+)
+
+COLONNES_REVENUS = (
+    'id', 'nom', 'montant_mensuel', 'type', 'regulier', 'responsable',
+    'date_creation', 'date_modification', 'historique_mensuel'
+)
+
+COLONNES_SUIVI = ('projet_id', 'projet_nom', 'mois', 'prevu', 'reel', 'ecart')
+
+FORMAT_DATE = 'yyyy-mm-dd'
+FORMAT_DATE_HEURE = 'yyyy-mm-dd hh:mm'
+
+
+class _Feuille:
+    """Écriture ligne à ligne d'une feuille (ordre strict imposé par constant_memory)"""
+
+    def __init__(self, classeur, nom, colonnes, formats):
+        self._feuille = classeur.add_worksheet(nom)
+        self._formats = formats
+        self._ligne = 1
+        self._feuille.write_row(0, 0, colonnes, formats['entete'])
+
+    def ecrire(self, valeurs):
+        for col, valeur in enumerate(valeurs):
+            self._ecrire_cellule(col, valeur)
+        self._ligne += 1
+
+    def _ecrire_cellule(self, col, valeur):
+        feuille, ligne = self._feuille, self._ligne
+        if valeur is None:
+            return
+        if isinstance(valeur, datetime):
+            feuille.write_datetime(ligne, col, valeur, self._formats['date_heure'])
+        elif isinstance(valeur, date):
+            feuille.write_datetime(ligne, col, valeur, self._formats['date'])
+        elif isinstance(valeur, bool):
+            feuille.write_boolean(ligne, col, valeur)
+        elif isinstance(valeur, numbers.Real):
+            feuille.write_number(ligne, col, valeur)
+        else:
+            # Textes et structures (suivi, historique, configuration) sous forme repr
+            feuille.write_string(ligne, col, str(valeur))
+
+
+def ecrire_classeur(chemin, projets, revenus, kpis, admin_config):
+    """Écrit le classeur (Projets, Revenus, KPIs, Configuration, Suivi_Mensuel) dans ``chemin``"""
+    classeur = xlsxwriter.Workbook(chemin, {'constant_memory': True})
+    try:
+        formats = {
+            'entete': classeur.add_format({'bold': True}),
+            'date': classeur.add_format({'num_format': FORMAT_DATE}),
+            'date_heure': classeur.add_format({'num_format': FORMAT_DATE_HEURE}),
+        }
+
+        # Onglet Projets
+        feuille = _Feuille(classeur, 'Projets', COLONNES_PROJETS, formats)
+        for projet in projets:
+            feuille.ecrire(projet.get(c) for c in COLONNES_PROJETS)
+
+        # Onglet Revenus
+        feuille = _Feuille(classeur, 'Revenus', COLONNES_REVENUS, formats)
+        for revenu in revenus:
+            feuille.ecrire(revenu.get(c) for c in COLONNES_REVENUS)
+
+        # Onglet KPIs
+        feuille = _Feuille(classeur, 'KPIs', list(kpis), formats)
+        feuille.ecrire(kpis.values())
+
+        # Onglet Configuration (une colonne par section)
+        feuille = _Feuille(classeur, 'Configuration', list(admin_config), formats)
+        feuille.ecrire(admin_config.values())
+
+        # Onglet Suivi détaillé
+        feuille = _Feuille(classeur, 'Suivi_Mensuel', COLONNES_SUIVI, formats)
+        for projet in projets:
+            for suivi in projet.get('suivi_mensuel') or []:
+                feuille.ecrire((
+                    projet['id'], projet['nom'], suivi['mois'],
+                    suivi['prevu'], suivi['reel'], suivi['reel'] - suivi['prevu']
+                ))
+    finally:
+        classeur.close()
+    return chemin
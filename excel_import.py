@@ -0,0 +1,179 @@
+# Plan Financier Familial - Import du classeur Excel produit par export_to_excel
+# Lecture en flux (openpyxl read_only, une ligne à la fois), conversion de types
+# vectorisée par colonne puis reconstruction des projets, revenus et configuration.
+
+import ast
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+FEUILLES = ('Projets', 'Revenus', 'Configuration', 'Suivi_Mensuel')
+
+COLONNES_NUMERIQUES_PROJET = (
+    'montant_total', 'budget_alloue_mensuel', 'montant_utilise_reel', 'cash_flow_mensuel', 'roi_attendu'
+)
+COLONNES_TEXTE_PROJET = (
+    'nom', 'type', 'statut', 'priorite', 'description', 'source_financement', 'responsable'
+)
+COLONNES_TEXTE_REVENU = ('nom', 'type', 'responsable')
+
+
+def _lire_feuille(classeur, nom):
+    """DataFrame d'une feuille (première ligne = en-têtes), None si absente"""
+    if nom not in classeur.sheetnames:
+        return None
+    lignes = classeur[nom].iter_rows(values_only=True)
+    entetes = next(lignes, None)
+    if entetes is None:
+        return pd.DataFrame()
+    # Colonnes sans en-tête ignorées
+    indices = [i for i, entete in enumerate(entetes) if entete is not None]
+    colonnes = [str(entetes[i]) for i in indices]
+    donnees = [
+        [ligne[i] if i < len(ligne) else None for i in indices]
+        for ligne in lignes
+        if any(v is not None for v in ligne)
+    ]
+    return pd.DataFrame(donnees, columns=colonnes, dtype=object)
+
+
+def _nombres(colonne):
+    """Colonne numérique: entiers conservés si toutes les valeurs sont entières"""
+    valeurs = pd.to_numeric(colonne, errors='coerce').fillna(0).to_numpy(dtype=float)
+    if np.all(np.mod(valeurs, 1) == 0):
+        return valeurs.astype(np.int64).tolist()
+    return valeurs.tolist()
+
+
+def _dates_heures(colonne):
+    """Textes 'YYYY-MM-DD HH:MM' ou dates Excel -> datetime (None si vide)"""
+    valeurs = pd.to_datetime(colonne, errors='coerce', format='mixed')
+    return [None if pd.isna(v) else v.to_pydatetime() for v in valeurs]
+
+
+def _dates(colonne):
+    valeurs = pd.to_datetime(colonne, errors='coerce', format='mixed')
+    return [None if pd.isna(v) else v.date() for v in valeurs]
+
+
+def _textes(colonne):
+    return [None if v is None or (isinstance(v, float) and np.isnan(v)) else str(v) for v in colonne]
+
+
+def _booleens(colonne):
+    return [v.strip().lower() in ('true', 'vrai', '1', 'oui') if isinstance(v, str) else bool(v) for v in colonne]
+
+
+def _litteral(valeur, defaut):
+    """Structure Python sérialisée par pandas (repr) -> objet"""
+    if isinstance(valeur, str) and valeur:
+        try:
+            return ast.literal_eval(valeur)
+        except (ValueError, SyntaxError):
+            return defaut
+    return defaut
+
+
+def _suivis_par_projet(df_suivi):
+    """Feuille Suivi_Mensuel -> {projet_id: [{mois, prevu, reel}, ...]} (tri stable par projet)"""
+    if df_suivi is None or df_suivi.empty:
+        return {}
+    ids = pd.to_numeric(df_suivi['projet_id'], errors='coerce')
+    valides = ids.notna().to_numpy()
+    ids = ids.to_numpy()[valides].astype(np.int64)
+    mois = np.asarray(_textes(df_suivi['mois']), dtype=object)[valides]
+    prevus = np.asarray(_nombres(df_suivi['prevu']), dtype=object)[valides]
+    reels = np.asarray(_nombres(df_suivi['reel']), dtype=object)[valides]
+
+    ordre = np.argsort(ids, kind='stable')
+    ids = ids[ordre]
+    entrees = [
+        {'mois': m, 'prevu': p, 'reel': r}
+        for m, p, r in zip(mois[ordre], prevus[ordre], reels[ordre])
+    ]
+    uniques, debuts = np.unique(ids, return_index=True)
+    fins = np.append(debuts[1:], len(ids))
+    return {int(i): entrees[d:f] for i, d, f in zip(uniques, debuts, fins)}
+
+
+def _projets(df, suivis):
+    if df is None or df.empty:
+        return []
+    n = len(df)
+    colonnes = {'id': _nombres(df['id'])}
+    for champ in COLONNES_NUMERIQUES_PROJET:
+        colonnes[champ] = _nombres(df[champ]) if champ in df else [0] * n
+    for champ in COLONNES_TEXTE_PROJET:
+        colonnes[champ] = _textes(df[champ]) if champ in df else [None] * n
+    colonnes['echeance'] = _dates(df['echeance']) if 'echeance' in df else [None] * n
+    for champ in ('date_creation', 'date_modification'):
+        colonnes[champ] = _dates_heures(df[champ]) if champ in df else [None] * n
+
+    projets = [dict(zip(colonnes, valeurs)) for valeurs in zip(*colonnes.values())]
+
+    # Suivi: la feuille dédiée fait foi, sinon la colonne sérialisée des projets
+    anciens_suivis = df['suivi_mensuel'].tolist() if 'suivi_mensuel' in df else [None] * n
+    for projet, ancien in zip(projets, anciens_suivis):
+        if suivis:
+            projet['suivi_mensuel'] = suivis.get(projet['id'], [])
+        else:
+            projet['suivi_mensuel'] = _litteral(ancien, [])
+    return projets
+
+
+def _revenus(df):
+    if df is None or df.empty:
+        return []
+    n = len(df)
+    colonnes = {
+        'id': _nombres(df['id']),
+        'montant_mensuel': _nombres(df['montant_mensuel']) if 'montant_mensuel' in df else [0] * n,
+        'regulier': _booleens(df['regulier']) if 'regulier' in df else [False] * n,
+    }
+    for champ in COLONNES_TEXTE_REVENU:
+        colonnes[champ] = _textes(df[champ]) if champ in df else [None] * n
+    for champ in ('date_creation', 'date_modification'):
+        colonnes[champ] = _dates_heures(df[champ]) if champ in df else [None] * n
+
+    revenus = [dict(zip(colonnes, valeurs)) for valeurs in zip(*colonnes.values())]
+    if 'historique_mensuel' in df:
+        for revenu, historique in zip(revenus, df['historique_mensuel'].tolist()):
+            historique = _litteral(historique, None)
+            if historique:
+                revenu['historique_mensuel'] = historique
+    return revenus
+
+
+def _configuration(df):
+    """Une ligne, une colonne par section (kpis_config, listes_config, mentors_conseils)"""
+    if df is None or df.empty:
+        return None
+    ligne = df.iloc[0]
+    config = {}
+    for section in df.columns:
+        valeur = _litteral(ligne[section], None)
+        if isinstance(valeur, dict):
+            config[section] = valeur
+    return config or None
+
+
+def lire_classeur(source):
+    """Lit un classeur exporté (chemin ou fichier) et retourne projets, revenus et configuration"""
+    classeur = load_workbook(source, read_only=True, data_only=True)
+    try:
+        feuilles = {nom: _lire_feuille(classeur, nom) for nom in FEUILLES}
+    finally:
+        classeur.close()
+
+    if feuilles['Projets'] is None and feuilles['Revenus'] is None:
+        raise ValueError("Le classeur ne contient ni feuille 'Projets' ni feuille 'Revenus'")
+
+    # Feuille absente: None (les données de session correspondantes sont conservées)
+    suivis = _suivis_par_projet(feuilles['Suivi_Mensuel'])
+    return {
+        'projets': None if feuilles['Projets'] is None else _projets(feuilles['Projets'], suivis),
+        'revenus': None if feuilles['Revenus'] is None else _revenus(feuilles['Revenus']),
+        'admin_config': _configuration(feuilles['Configuration']),
+        'entrees_suivi': sum(len(s) for s in suivis.values()),
+    }
@@ -0,0 +1,16 @@
+# Plan Financier Familial - Cœur financier (fonctions pures, sans Streamlit)
+# Toutes les fonctions reçoivent explicitement données et filtre (année, mois) et
+# retournent leur résultat: utilisables depuis les pages, un job batch, un
+# benchmark ou un pool de threads / processus. Aucun import de streamlit ici.
+
+from finance_core.periodes import filter_data_by_period
+from finance_core.kpis import calculer_kpis, construire_kpis, totaux_kpis
+from finance_core.projets import (
+    CATEGORIES_KANBAN, categorize_project, categoriser_projets, filter_projects, get_sources_financement,
+)
+from finance_core.revenus import matrice_historique, prevision_revenus, statistiques_revenus
+from finance_core.monte_carlo import projection_cash_flow, simuler_cash_flow
+from finance_core.objectif_2030 import effort_minimal, grille_objectif_2030, revenus_passifs_requis, resoudre_objectif
+from finance_core.scenarios import balayage, creer_pool, evaluer_scenarios, modification, preparer_base, variante
+from finance_core.allocation import optimiser_allocations, verifier_allocations
+from finance_core.exports import export_to_excel
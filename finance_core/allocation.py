@@ -0,0 +1,155 @@
+# Plan Financier Familial - Répartition mensuelle des revenus entre projets
+# Chaque source de revenus a une capacité mensuelle (montant moyen attendu);
+# chaque projet actif a un reste à financer, une source et une échéance.
+# Heuristique gloutonne priorité / échéance (EDF), sans solveur externe:
+#   1. par priorité puis échéance, chaque projet prélève sa source au plus tard
+#      avant l'échéance (les premiers mois restent libres pour les suivants);
+#   2. le reste est pris sur la capacité restante mutualisée de toutes les
+#      sources, toujours avant l'échéance; un projet qui ne peut pas être financé
+#      à temps rend ce qu'il avait prélevé;
+#   3. les projets en retard sont financés au plus tôt sur ce qui reste.
+# Chaque projet coûte quelques opérations sur des vecteurs de l'horizon.
+
+from datetime import date
+
+import numpy as np
+
+from finance_core.projets import en_store
+from finance_core.revenus import statistiques_revenus
+
+NB_MOIS_HORIZON = 60
+PRIORITES = ('Critique', 'Haute', 'Moyenne', 'Faible')
+STATUTS_INACTIFS = ('Réalisé', 'Suspendu')
+
+
+def _prelever(disponible, besoin, au_plus_tard):
+    """Prise sur un vecteur de disponibilités, par la fin (au plus tard) ou par le début"""
+    ordre = disponible[::-1] if au_plus_tard else disponible
+    deja = np.cumsum(ordre) - ordre
+    prise = np.clip(besoin - deja, 0, ordre)
+    return prise[::-1] if au_plus_tard else prise
+
+
+def capacites_sources(revenus):
+    """(noms des sources, capacité mensuelle attendue) agrégées par nom de revenu"""
+    moyennes, _, _ = statistiques_revenus(revenus)
+    capacites = {}
+    for revenu, moyenne in zip(revenus, moyennes):
+        capacites[revenu['nom']] = capacites.get(revenu['nom'], 0.0) + max(float(moyenne), 0.0)
+    return list(capacites), np.array(list(capacites.values()))
+
+
+def verifier_allocations(projets, revenus):
+    """Budgets alloués des projets actifs comparés à la capacité de chaque source
+
+    Liste de dicts (source, capacité, engagé, écart); un projet dont la source n'est
+    pas un revenu (Crédit...) est compté sur une source de capacité nulle.
+    """
+    sources, capacites = capacites_sources(revenus)
+    engages = dict.fromkeys(sources, 0.0)
+    for projet in projets:
+        if projet.get('statut') not in STATUTS_INACTIFS:
+            source = projet.get('source_financement')
+            engages[source] = engages.get(source, 0.0) + float(projet.get('budget_alloue_mensuel') or 0)
+    capacite = dict(zip(sources, capacites))
+    return [
+        {'source': source, 'capacite': float(capacite.get(source, 0.0)), 'engage': engage,
+         'ecart': float(capacite.get(source, 0.0)) - engage}
+        for source, engage in engages.items()
+    ]
+
+
+def optimiser_allocations(projets, revenus, debut=None, nb_mois=NB_MOIS_HORIZON, priorites=PRIORITES):
+    """Versements mensuels par projet et utilisation des sources sur l'horizon
+
+    Retourne les lignes des projets actifs (reste à financer > 0), leurs versements
+    (projets x mois), dont la part de leur propre source, le mois de fin (-1 si non
+    financé sur l'horizon), l'indicateur 'à temps', et capacités / utilisation par
+    source (sources x mois). La part mutualisée est imputée aux sources au prorata
+    de leur capacité restante.
+    """
+    store = en_store(projets)
+    premier = np.datetime64(debut or date.today(), 'M')
+    mois = np.arange(premier, premier + nb_mois, dtype='datetime64[M]')
+    sources, capacite_mensuelle = capacites_sources(revenus)
+    capacites = np.repeat(capacite_mensuelle[:, None], nb_mois, axis=1)
+
+    # Projets actifs avec un reste à financer
+    besoins = np.maximum(store.colonne('montant_total') - store.colonne('montant_utilise_reel'), 0)
+    inactifs = np.isin(store.colonne('statut'), [store.code('statut', s) for s in STATUTS_INACTIFS])
+    lignes = np.flatnonzero((besoins > 0) & ~inactifs)
+    besoins = besoins[lignes]
+    echeances = (store.colonne('echeance')[lignes].astype('datetime64[M]') - premier).astype(np.int64)
+    echeances = np.where(np.isnat(store.colonne('echeance')[lignes]), nb_mois - 1, echeances)
+    echeances = np.minimum(echeances, nb_mois - 1)
+
+    # Rang de priorité (inconnue: après les priorités connues) puis échéance puis besoin
+    rang_code = np.full(store.nb_categories('priorite') + 1, len(priorites))
+    for rang, priorite in enumerate(priorites):
+        code = store.code('priorite', priorite)
+        if code >= 0:
+            rang_code[code] = rang
+    rangs = rang_code[store.colonne('priorite')[lignes]]
+    ordre = np.lexsort((besoins, echeances, rangs))
+
+    index_sources = {nom: i for i, nom in enumerate(sources)}
+    projets_sources = [index_sources.get(store[int(l)].get('source_financement'), -1) for l in lignes]
+
+    n = len(lignes)
+    propres = np.zeros((n, nb_mois))
+    mutualises = np.zeros((n, nb_mois))
+
+    # 1. Source propre, au plus tard avant l'échéance
+    for p in ordre:
+        s, d = projets_sources[p], echeances[p]
+        if s >= 0 and d >= 0:
+            propres[p, :d + 1] = _prelever(capacites[s, :d + 1], besoins[p], au_plus_tard=True)
+            capacites[s, :d + 1] -= propres[p, :d + 1]
+
+    # 2. Capacité restante mutualisée; un projet qui ne peut être à temps rend sa prise
+    restantes = capacites.copy()
+    pool = capacites.sum(axis=0)
+    a_temps = np.zeros(n, dtype=bool)
+    en_retard = []
+    for p in ordre:
+        d = echeances[p]
+        reste = besoins[p] - propres[p].sum()
+        if d >= 0 and reste <= pool[:d + 1].sum() * (1 + 1e-12):
+            mutualises[p, :d + 1] = _prelever(pool[:d + 1], reste, au_plus_tard=True)
+            pool[:d + 1] -= mutualises[p, :d + 1]
+            a_temps[p] = True
+        else:
+            s = projets_sources[p]
+            if s >= 0:
+                restantes[s] += propres[p]
+            pool += propres[p]
+            propres[p] = 0
+            en_retard.append(p)
+
+    # 3. Projets en retard: au plus tôt sur ce qui reste, toutes sources confondues
+    for p in en_retard:
+        mutualises[p] = _prelever(pool, besoins[p], au_plus_tard=False)
+        pool -= mutualises[p]
+
+    versements = propres + mutualises
+    finances = np.cumsum(versements, axis=1) >= besoins[:, None] * (1 - 1e-9)
+    fins = np.where(finances.any(axis=1), np.argmax(finances, axis=1), -1)
+
+    # Part mutualisée imputée au prorata des capacités restantes après l'étape 1 (et restitutions)
+    total_restant = restantes.sum(axis=0)
+    parts = np.divide(restantes, total_restant, out=np.zeros_like(restantes), where=total_restant > 0)
+    utilisation = (np.repeat(capacite_mensuelle[:, None], nb_mois, axis=1) - restantes) + parts * mutualises.sum(axis=0)
+
+    return {
+        'mois': mois,
+        'lignes': lignes,
+        'besoins': besoins,
+        'echeances': echeances,
+        'versements': versements,
+        'versements_source_propre': propres,
+        'fins': fins,
+        'a_temps': a_temps,
+        'sources': sources,
+        'capacites': capacite_mensuelle,
+        'utilisation': utilisation,
+    }
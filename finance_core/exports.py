@@ -0,0 +1,11 @@
+# Plan Financier Familial - Exports (xlsxwriter importé seulement à l'export)
+
+from finance_core.kpis import calculer_kpis
+
+
+def export_to_excel(chemin, projets, revenus, admin_config, kpis=None, annee="Tout", mois="Tout"):
+    """Écrit le classeur complet dans ``chemin`` (KPIs de la période recalculés si non fournis)"""
+    from excel_export import ecrire_classeur
+    if kpis is None:
+        kpis = calculer_kpis(projets, revenus, annee, mois)
+    return ecrire_classeur(chemin, projets, revenus, kpis, admin_config)
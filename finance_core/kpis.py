@@ -0,0 +1,82 @@
+# Plan Financier Familial - KPIs
+# Dérivation des indicateurs à partir des totaux (partagée avec le moteur
+# incrémental kpi_engine) et recalcul complet vectorisé sur les colonnes du store.
+
+import numpy as np
+
+from finance_core.periodes import filter_data_by_period
+from finance_core.projets import en_store
+
+
+def construire_kpis(totaux):
+    """Dérive ratios, phase et indicateurs à partir des totaux agrégés"""
+    revenus_mensuels = totaux['revenus_mensuels']
+    cash_flow_mensuel = totaux['cash_flow_mensuel']
+    total_actifs = totaux['total_actifs']
+    total_global = total_actifs + totaux['total_passifs'] + totaux['total_formation']
+
+    # Ratios
+    ratio_actifs_passifs = (total_actifs / total_global * 100) if total_global > 0 else 0
+
+    # Revenus passifs
+    revenus_passifs_pct = (totaux['revenus_passifs'] / revenus_mensuels * 100) if revenus_mensuels > 0 else 0
+
+    # Phase financière
+    if cash_flow_mensuel < 0 or revenus_passifs_pct < 10:
+        phase_actuelle = 'Stabilisation'
+    elif cash_flow_mensuel >= 0 and 10 <= revenus_passifs_pct < 30:
+        phase_actuelle = 'Transition'  
+    else:
+        phase_actuelle = 'Expansion'
+
+    return {
+        'revenus_mensuels': revenus_mensuels,
+        'cash_flow_mensuel': cash_flow_mensuel,
+        'ratio_actifs_passifs': ratio_actifs_passifs,
+        'revenus_passifs_pct': revenus_passifs_pct,
+        'nombre_actifs': totaux['nombre_actifs'],
+        'phase_actuelle': phase_actuelle,
+        'fonds_urgence_mois': 0,
+        'baby_step_actuel': 1,
+        'depenses_mensuelles': totaux['depenses_mensuelles'],
+        'total_actifs': total_actifs,
+        'total_passifs': totaux['total_passifs'],
+        'total_formation': totaux['total_formation']
+    }
+
+
+def totaux_kpis(projets, revenus, annee="Tout", mois="Tout"):
+    """Totaux agrégés de la période (entrée de construire_kpis), en une passe vectorisée"""
+    store = en_store(projets)
+    revenus = filter_data_by_period(revenus, 'date_creation', annee, mois)
+
+    # Sélection vectorisée des projets de la période
+    masque = store.masque_periode('date_creation', annee, mois)
+    types = store.colonne('type')[masque]
+    montants = store.colonne('montant_total')[masque]
+    cash_flows = store.colonne('cash_flow_mensuel')[masque]
+
+    # Totaux par type en une seule passe
+    totaux_types = np.bincount(types, weights=montants, minlength=store.nb_categories('type'))
+
+    def total_type(nom_type):
+        code = store.code('type', nom_type)
+        return float(totaux_types[code]) if code >= 0 else 0.0
+
+    est_actif = types == store.code('type', 'Actif générateur')
+
+    return {
+        'revenus_mensuels': sum(r['montant_mensuel'] for r in revenus),
+        'cash_flow_mensuel': float(cash_flows.sum()),
+        'total_actifs': total_type('Actif générateur'),
+        'total_passifs': total_type('Passif'),
+        'total_formation': total_type('Investissement formation'),
+        'revenus_passifs': float(cash_flows[est_actif & (cash_flows > 0)].sum()),
+        'depenses_mensuelles': float(-cash_flows[cash_flows < 0].sum()),
+        'nombre_actifs': int(np.count_nonzero(est_actif))
+    }
+
+
+def calculer_kpis(projets, revenus, annee="Tout", mois="Tout"):
+    """Recalcul complet (vectorisé) des KPIs de la période"""
+    return construire_kpis(totaux_kpis(projets, revenus, annee, mois))
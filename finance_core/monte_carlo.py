@@ -0,0 +1,76 @@
+# Plan Financier Familial - Projection Monte Carlo du cash flow jusqu'en 2030
+# Cash flow net mensuel = revenus variables (fixes si réguliers, tirés au hasard
+# sinon) + cash flow des projets (dépenses jusqu'à l'échéance, revenus d'actifs
+# sur tout l'horizon). Toutes les trajectoires sont tirées en un seul tableau
+# (trajectoires x mois) par un générateur à graine fixe: même plan, même éventail.
+
+from datetime import date
+
+import numpy as np
+
+from finance_core.projets import en_store
+from finance_core.revenus import statistiques_revenus
+
+FIN_PROJECTION = date(2030, 12, 1)
+NB_TRAJECTOIRES = 10_000
+GRAINE = 2030
+QUANTILES = (10, 50, 90)
+
+
+def mois_projection(debut=None, fin=FIN_PROJECTION):
+    """Mois (datetime64[M]) de ``debut`` (mois courant par défaut) à ``fin`` inclus, au moins un"""
+    debut = np.datetime64(debut or date.today(), 'M')
+    return np.arange(debut, max(np.datetime64(fin, 'M'), debut) + 1, dtype='datetime64[M]')
+
+
+def flux_colonnes(cash_flows, echeances, mois):
+    """Cash flow mensuel sur ces mois de projets donnés en colonnes (échéances en datetime64)
+
+    Dépenses (cash flow négatif) jusqu'au mois d'échéance inclus, revenus d'actifs
+    (cash flow positif) sur tout l'horizon. Une passe bincount + somme cumulée.
+    """
+    depenses = cash_flows < 0
+    # Dernier mois actif de chaque dépense, en indice de l'horizon
+    derniers = (echeances[depenses].astype('datetime64[M]') - mois[0]).astype(np.int64)
+    actives = derniers >= 0
+    par_dernier_mois = np.bincount(
+        np.minimum(derniers[actives], len(mois) - 1), weights=cash_flows[depenses][actives], minlength=len(mois)
+    )
+    return par_dernier_mois[::-1].cumsum()[::-1] + cash_flows[cash_flows > 0].sum()
+
+
+def flux_projets(projets, mois):
+    """Cash flow mensuel déterministe des projets sur ces mois"""
+    store = en_store(projets)
+    return flux_colonnes(store.colonne('cash_flow_mensuel'), store.colonne('echeance'), mois)
+
+
+def simuler_cash_flow(projets, revenus, mois, nb_trajectoires=NB_TRAJECTOIRES, graine=GRAINE):
+    """Cash flow net mensuel simulé, tableau (nb_trajectoires, nb_mois)
+
+    Les sources irrégulières sont indépendantes: leur somme mensuelle suit une loi
+    normale de moyenne et variance sommées, tronquée à zéro.
+    """
+    moyennes, ecarts, reguliers = statistiques_revenus(revenus)
+    fixes = moyennes[reguliers].sum()
+    moyenne_irreguliers = moyennes[~reguliers].sum()
+    ecart_irreguliers = np.sqrt((ecarts[~reguliers] ** 2).sum())
+
+    rng = np.random.default_rng(graine)
+    flux = rng.normal(moyenne_irreguliers, ecart_irreguliers, (nb_trajectoires, len(mois)))
+    np.maximum(flux, 0, out=flux)
+    flux += fixes + flux_projets(projets, mois)
+    return flux
+
+
+def projection_cash_flow(projets, revenus, debut=None, fin=FIN_PROJECTION, nb_trajectoires=NB_TRAJECTOIRES,
+                         graine=GRAINE, quantiles=QUANTILES):
+    """Éventail du cash flow cumulé: quantiles par mois et probabilité de finir en déficit"""
+    mois = mois_projection(debut, fin)
+    cumuls = simuler_cash_flow(projets, revenus, mois, nb_trajectoires, graine).cumsum(axis=1)
+    return {
+        'mois': mois,
+        'quantiles': dict(zip(quantiles, np.percentile(cumuls, quantiles, axis=0))),
+        'probabilite_deficit': float(np.mean(cumuls[:, -1] < 0)),
+        'nb_trajectoires': nb_trajectoires,
+    }
@@ -0,0 +1,106 @@
+# Plan Financier Familial - Solveur de l'objectif Vision 2030
+# Pour chaque combinaison (effort mensuel, rendement des actifs, mois de début),
+# premier mois où les revenus passifs couvrent l'objectif: les versements sont
+# placés au rendement annuel ``roi_attendu`` et leurs revenus réinvestis. Toute
+# la grille est évaluée en une expression NumPy (forme fermée, sans boucle).
+
+from datetime import date
+
+import numpy as np
+
+from finance_core.projets import en_store
+
+# Coût annuel de la vie en Suisse (CHF) et conversion
+COUT_ENFANTS_CHF = 280000
+COUT_FAMILLE_CHF = 150000
+TAUX_CHF_FCFA = 665
+MARGE_SECURITE = 1.3
+ECHEANCE_2030 = date(2030, 1, 1)
+# Rendements (%) utilisés si aucun actif générateur n'a de ROI renseigné
+RENDEMENTS_DEFAUT = (5, 8, 12)
+NB_NIVEAUX_EFFORT = 48
+
+
+def revenus_passifs_requis(cout_chf=COUT_ENFANTS_CHF + COUT_FAMILLE_CHF, taux=TAUX_CHF_FCFA, marge=MARGE_SECURITE):
+    """Revenus passifs mensuels (FCFA) couvrant le coût annuel suisse avec la marge de sécurité"""
+    return cout_chf * taux * marge / 12
+
+
+def mois_depuis(debut, jour):
+    """Nombre de mois calendaires de ``debut`` à ``jour``"""
+    return (jour.year - debut.year) * 12 + jour.month - debut.month
+
+
+def situation_actuelle(projets, revenus):
+    """(revenus passifs des actifs générateurs, excédent mensuel investissable) sur tout le plan"""
+    store = en_store(projets)
+    cash_flows = store.colonne('cash_flow_mensuel')
+    actifs = store.colonne('type') == store.code('type', 'Actif générateur')
+    revenus_passifs = float(cash_flows[actifs & (cash_flows > 0)].sum())
+    excedent = sum(r['montant_mensuel'] for r in revenus) + float(cash_flows.sum())
+    return revenus_passifs, max(excedent, 0.0)
+
+
+def resoudre_objectif(cible, revenus_passifs, contributions, rendements_pct, debuts):
+    """Mois d'atteinte (compté depuis le mois courant) pour toute la grille, forme (efforts, rendements, débuts)
+
+    Après n mois de versements C au taux mensuel r, le capital rapporte
+    r * K_n = C * ((1 + r)^n - 1): l'objectif est atteint au premier n tel que
+    (1 + r)^n >= 1 + manque / C. inf si jamais (effort ou rendement nul).
+    """
+    manque = max(cible - revenus_passifs, 0.0)
+    efforts = np.asarray(contributions, dtype=float)[:, None, None]
+    taux = np.asarray(rendements_pct, dtype=float)[None, :, None] / 1200
+    debuts = np.asarray(debuts, dtype=float)[None, None, :]
+
+    if manque == 0:
+        return np.zeros(np.broadcast_shapes(efforts.shape, taux.shape, debuts.shape))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duree = np.ceil(np.log1p(manque / efforts) / np.log1p(taux))
+    duree = np.where((efforts > 0) & (taux > 0), duree, np.inf)
+    return debuts + duree
+
+
+def grille_objectif_2030(projets, revenus, aujourd_hui=None, cible=None):
+    """Solveur sur la grille par défaut: efforts, ROI des actifs générateurs, débuts jusqu'à 2030"""
+    aujourd_hui = aujourd_hui or date.today()
+    cible = revenus_passifs_requis() if cible is None else cible
+    revenus_passifs, excedent = situation_actuelle(projets, revenus)
+
+    store = en_store(projets)
+    roi = store.colonne('roi_attendu')[store.colonne('type') == store.code('type', 'Actif générateur')]
+    rendements = np.unique(roi[roi > 0])
+    if not len(rendements):
+        rendements = np.array(RENDEMENTS_DEFAUT, dtype=float)
+
+    # Efforts de 0,5 % à 200 % de l'objectif (échelle log), plus l'excédent actuel
+    contributions = np.geomspace(cible / 200, cible * 2, NB_NIVEAUX_EFFORT)
+    if excedent > 0:
+        contributions = np.unique(np.append(contributions, excedent))
+    debuts = np.arange(max(mois_depuis(aujourd_hui, ECHEANCE_2030), 0) + 1)
+
+    return {
+        'cible': cible,
+        'revenus_passifs': revenus_passifs,
+        'excedent': excedent,
+        'contributions': contributions,
+        'rendements': rendements,
+        'debuts': debuts,
+        'mois_atteinte': resoudre_objectif(cible, revenus_passifs, contributions, rendements, debuts),
+        'echeance': mois_depuis(aujourd_hui, ECHEANCE_2030),
+    }
+
+
+def effort_minimal(grille, echeance=None):
+    """Effort mensuel minimal atteignant l'objectif à l'échéance, forme (rendements, débuts)
+
+    Inverse exact de la forme fermée: C = manque / ((1 + r)^n - 1), n mois de
+    versements entre le début et l'échéance. inf si aucun mois n'est disponible.
+    """
+    echeance = grille['echeance'] if echeance is None else echeance
+    manque = max(grille['cible'] - grille['revenus_passifs'], 0.0)
+    taux = np.asarray(grille['rendements'], dtype=float)[:, None] / 1200
+    duree = echeance - np.asarray(grille['debuts'], dtype=float)[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efforts = manque / np.expm1(duree * np.log1p(taux))
+    return np.where(manque == 0, 0.0, np.where((duree > 0) & (taux > 0), efforts, np.inf))
@@ -0,0 +1,29 @@
+# Plan Financier Familial - Filtrage par période (année / mois, "Tout" = pas de filtre)
+
+from project_store import ProjectStore, RevenueStore, periode_de
+
+
+def filter_data_by_period(data_list, date_field, annee="Tout", mois="Tout"):
+    """Éléments dont ``date_field`` tombe dans la période"""
+    if mois == "Tout" and annee == "Tout":
+        return data_list
+
+    # Index (année, mois) maintenu à l'écriture par les stores
+    if isinstance(data_list, (ProjectStore, RevenueStore)) and date_field == 'date_creation':
+        return data_list.selection_periode(annee, mois)
+
+    filtered_data = []
+    for item in data_list:
+        item_annee, item_mois = periode_de(item.get(date_field))
+
+        # Filtrage par année
+        if annee != "Tout" and item_annee != annee:
+            continue
+
+        # Filtrage par mois
+        if mois != "Tout" and item_mois != mois:
+            continue
+
+        filtered_data.append(item)
+
+    return filtered_data
@@ -0,0 +1,94 @@
+# Plan Financier Familial - Projets: catégorisation Kanban, filtres et tri, sources
+
+from datetime import datetime, date
+
+import numpy as np
+
+from project_store import ProjectStore
+
+CATEGORIES_KANBAN = ('en-retard', 'a-risque', 'en-cours', 'en-avance', 'bloque')
+
+
+def en_store(projets):
+    """Le store tel quel, ou un ProjectStore construit sur une copie des projets"""
+    return projets if isinstance(projets, ProjectStore) else ProjectStore(projets)
+
+
+def categorize_project(projet, aujourd_hui=None):
+    """Catégorise un projet selon son état (à la date ``aujourd_hui``, aujourd'hui par défaut)"""
+    aujourd_hui = aujourd_hui or date.today()
+    echeance = projet['echeance']
+
+    # Calcul progression
+    progression = (projet['montant_utilise_reel'] / projet['montant_total']) * 100 if projet['montant_total'] > 0 else 0
+
+    # Jours jusqu'à échéance
+    jours_restants = (echeance - aujourd_hui).days
+
+    # Logique de catégorisation
+    if echeance < aujourd_hui:
+        return 'en-retard', 'En Retard', '#ff4444'
+    elif jours_restants <= 30 and progression < 70:
+        return 'a-risque', 'À Risque', '#ff8800'
+    elif progression > 90:
+        return 'en-avance', 'En Avance', '#00aa00'
+    elif projet['montant_utilise_reel'] >= projet['montant_total']:
+        return 'bloque', 'Budget Épuisé', '#666666'
+    else:
+        return 'en-cours', 'En Cours', '#007bff'
+
+
+def categoriser_projets(projets, annee="Tout", mois="Tout", aujourd_hui=None):
+    """Lignes par catégorie Kanban pour la période (même logique que categorize_project, vectorisée)"""
+    store = en_store(projets)
+    lignes = np.flatnonzero(store.masque_periode('date_creation', annee, mois))
+    aujourd_hui = np.datetime64(aujourd_hui or date.today(), 'D')
+    echeances = store.colonne('echeance')[lignes]
+    utilise = store.colonne('montant_utilise_reel')[lignes]
+    total = store.colonne('montant_total')[lignes]
+
+    progression = np.divide(utilise * 100, total, out=np.zeros(len(lignes)), where=total > 0)
+    jours_restants = (echeances - aujourd_hui).astype(np.int64)
+
+    codes = np.select(
+        [echeances < aujourd_hui, (jours_restants <= 30) & (progression < 70), progression > 90, utilise >= total],
+        [CATEGORIES_KANBAN.index(c) for c in ('en-retard', 'a-risque', 'en-avance', 'bloque')],
+        default=CATEGORIES_KANBAN.index('en-cours')
+    )
+    return {cat: lignes[codes == i] for i, cat in enumerate(CATEGORIES_KANBAN)}
+
+
+def filter_projects(projets, filter_type, filter_status, filter_priority, sort_by):
+    """Filtre et trie les projets"""
+    projets = list(projets)
+
+    # Filtrage
+    if filter_type != "Tous":
+        projets = [p for p in projets if p['type'] == filter_type]
+
+    if filter_status != "Tous":
+        projets = [p for p in projets if p['statut'] == filter_status]
+
+    if filter_priority != "Toutes":
+        projets = [p for p in projets if p.get('priorite', 'Moyenne') == filter_priority]
+
+    # Tri
+    if sort_by == "Nom":
+        projets.sort(key=lambda x: x['nom'])
+    elif sort_by == "Montant":
+        projets.sort(key=lambda x: x['montant_total'], reverse=True)
+    elif sort_by == "Échéance":
+        projets.sort(key=lambda x: x['echeance'])
+    elif sort_by == "ROI":
+        projets.sort(key=lambda x: x['roi_attendu'], reverse=True)
+    elif sort_by == "Type":
+        projets.sort(key=lambda x: x['type'])
+    elif sort_by == "Date création":
+        projets.sort(key=lambda x: x.get('date_creation', datetime.now()), reverse=True)
+
+    return projets
+
+
+def get_sources_financement(revenus):
+    """Sources de financement disponibles: revenus plus épargne et crédit"""
+    return [r['nom'] for r in revenus] + ['Épargne', 'Crédit']
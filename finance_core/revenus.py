@@ -0,0 +1,141 @@
+# Plan Financier Familial - Revenus variables: historique mensuel et prévision
+# L'historique de toutes les sources est rangé dans une matrice sources x mois
+# (NaN hors de la période couverte par chaque source); statistiques et prévision
+# sont calculées sur cette matrice en une passe vectorisée.
+
+import numpy as np
+
+# Écart-type relatif supposé pour une source irrégulière sans historique exploitable
+DISPERSION_IRREGULIER_DEFAUT = 0.35
+# Poids du dernier mois dans le niveau lissé (lissage exponentiel)
+LISSAGE_NIVEAU = 0.3
+# Nombre de mois "fictifs" à coefficient 1 qui tempèrent chaque coefficient saisonnier
+FORCE_SAISON = 2.0
+
+
+def _nombre(valeur):
+    try:
+        return float(valeur)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _mois_absolu(mois):
+    """'AAAA-MM' -> entier de datetime64[M] (mois depuis janvier 1970)"""
+    annee, numero = mois.split('-')[:2]
+    return (int(annee) - 1970) * 12 + int(numero) - 1
+
+
+def matrice_historique(revenus):
+    """(premier mois, matrice sources x mois) de l'historique enregistré
+
+    Entre le premier et le dernier mois enregistrés d'une source, les mois sans
+    versement valent zéro; hors de cette période, NaN. Premier mois None et matrice
+    sans colonne si aucune source n'a d'historique.
+    """
+    sources, mois, montants = [], [], []
+    for i, revenu in enumerate(revenus):
+        for entree in revenu.get('historique_mensuel') or ():
+            sources.append(i)
+            mois.append(_mois_absolu(entree['mois']))
+            montants.append(_nombre(entree.get('montant')))
+    if not mois:
+        return None, np.full((len(revenus), 0), np.nan)
+
+    sources = np.array(sources)
+    mois = np.array(mois)
+    premier = int(mois.min())
+    colonnes = mois - premier
+    largeur = int(colonnes.max()) + 1
+
+    matrice = np.zeros((len(revenus), largeur))
+    np.add.at(matrice, (sources, colonnes), montants)
+    debuts = np.full(len(revenus), largeur)
+    fins = np.full(len(revenus), -1)
+    np.minimum.at(debuts, sources, colonnes)
+    np.maximum.at(fins, sources, colonnes)
+    indices = np.arange(largeur)
+    matrice[(indices < debuts[:, None]) | (indices > fins[:, None])] = np.nan
+    return premier, matrice
+
+
+def statistiques_revenus(revenus):
+    """(moyennes, écarts-types, réguliers) mensuels par source, en tableaux NumPy
+
+    Source régulière: montant mensuel fixe. Source irrégulière: moyenne et écart-type
+    de l'historique; sans historique (moins de deux mois), montant mensuel et
+    dispersion par défaut.
+    """
+    moyennes = np.array([_nombre(r.get('montant_mensuel')) for r in revenus])
+    reguliers = np.array([bool(r.get('regulier')) for r in revenus], dtype=bool)
+    ecarts = DISPERSION_IRREGULIER_DEFAUT * moyennes
+    ecarts[reguliers] = 0.0
+
+    _, matrice = matrice_historique(revenus)
+    nb_mois = np.count_nonzero(~np.isnan(matrice), axis=1)
+    avec_historique = ~reguliers & (nb_mois >= 2)
+    if avec_historique.any():
+        historique = matrice[avec_historique]
+        moyennes[avec_historique] = np.nanmean(historique, axis=1)
+        ecarts[avec_historique] = np.nanstd(historique, axis=1)
+    return moyennes, ecarts, reguliers
+
+
+def prevision_revenus(revenus, mois, lissage=LISSAGE_NIVEAU, force_saison=FORCE_SAISON):
+    """Matrice sources x mois: historique enregistré, sinon prévision déterministe
+
+    Sources régulières: montant mensuel. Sources irrégulières avec historique:
+    niveau lissé (moyenne exponentielle des mois enregistrés) x coefficient
+    saisonnier du mois calendaire, tempéré vers 1 quand il repose sur peu de mois.
+    ``mois``: tableau datetime64[M]. Retourne montants et masque des mois observés.
+    """
+    mois_entiers = np.asarray(mois, dtype='datetime64[M]').astype(np.int64)
+    n = len(revenus)
+    montants_mensuels = np.array([_nombre(r.get('montant_mensuel')) for r in revenus])
+    reguliers = np.array([bool(r.get('regulier')) for r in revenus], dtype=bool)
+
+    niveaux = montants_mensuels.copy()
+    saisons = np.ones((n, 12))
+    observes = np.zeros((n, len(mois_entiers)), dtype=bool)
+    valeurs_observees = np.zeros((n, len(mois_entiers)))
+
+    premier, matrice = matrice_historique(revenus)
+    if premier is not None:
+        valide = ~np.isnan(matrice)
+        historique = np.where(valide, matrice, 0.0)
+        colonnes_historique = np.arange(matrice.shape[1])
+
+        # Niveau: poids lissage * (1 - lissage)^âge, âge compté depuis le dernier mois de la source
+        derniers = np.where(valide.any(axis=1), matrice.shape[1] - 1 - np.argmax(valide[:, ::-1], axis=1), 0)
+        ages = np.clip(derniers[:, None] - colonnes_historique, 0, None)
+        poids = np.where(valide, lissage * (1 - lissage) ** ages, 0.0)
+        somme_poids = poids.sum(axis=1)
+        lissables = ~reguliers & (valide.sum(axis=1) >= 2)
+        niveaux[lissables] = (poids * historique).sum(axis=1)[lissables] / somme_poids[lissables]
+
+        # Coefficients saisonniers: moyenne du mois calendaire / moyenne globale, tempérés
+        calendrier = np.eye(12)[(premier + colonnes_historique) % 12]
+        sommes = historique @ calendrier
+        comptes = valide.astype(float) @ calendrier
+        moyennes = historique.sum(axis=1) / np.maximum(valide.sum(axis=1), 1)
+        ratios = np.divide(
+            sommes, comptes * moyennes[:, None],
+            out=np.ones((n, 12)), where=(comptes > 0) & (moyennes[:, None] > 0)
+        )
+        saisons[lissables] = ((comptes * ratios + force_saison) / (comptes + force_saison))[lissables]
+
+        # Mois demandés couverts par l'historique enregistré
+        colonnes = mois_entiers - premier
+        dans_matrice = (colonnes >= 0) & (colonnes < matrice.shape[1])
+        extraits = np.full((n, len(mois_entiers)), np.nan)
+        extraits[:, dans_matrice] = matrice[:, colonnes[dans_matrice]]
+        observes = ~np.isnan(extraits)
+        valeurs_observees = np.where(observes, extraits, 0.0)
+
+    previsions = niveaux[:, None] * saisons[:, mois_entiers % 12]
+    return {
+        'mois': np.asarray(mois, dtype='datetime64[M]'),
+        'sources': [r['nom'] for r in revenus],
+        'montants': np.where(observes, valeurs_observees, previsions),
+        'observes': observes,
+    }
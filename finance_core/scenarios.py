@@ -0,0 +1,231 @@
+# Plan Financier Familial - Scénarios "et si" évalués en parallèle
+# Une variante est une liste de modifications du plan (décaler l'échéance d'un
+# projet, ajuster son budget ou son cash flow, ajuster un revenu). Elle ne touche
+# que quelques lignes: ses KPIs (même logique que calculer_kpis) et sa projection
+# pluriannuelle (même logique que flux_projets) sont ceux du plan de base
+# corrigés de l'écart de ces lignes. Les balayages sont répartis par lots sur un
+# pool de processus longue durée (un lot par processus) au-delà du seuil de rentabilité.
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import multiprocessing
+import os
+
+import numpy as np
+
+from finance_core.kpis import construire_kpis, totaux_kpis
+from finance_core.monte_carlo import FIN_PROJECTION, flux_colonnes, mois_projection
+from finance_core.periodes import filter_data_by_period
+from finance_core.projets import en_store
+from finance_core.revenus import statistiques_revenus
+
+# Action -> (cible, libellé); valeur: nombre de mois pour 'decaler', facteur multiplicatif sinon
+ACTIONS = {
+    'decaler': ('projet', "Décaler l'échéance (mois)"),
+    'budget': ('projet', "Ajuster le budget (facteur)"),
+    'cash_flow': ('projet', "Ajuster le cash flow (facteur)"),
+    'revenu': ('revenu', "Ajuster le revenu (facteur)"),
+}
+# Seuil de rentabilité mesuré (pool déjà démarré, 100k projets): ~13 ms de transfert
+# par balayage contre ~0,26 ms par variante, soit ~100 variantes sur 2 processus
+SEUIL_PARALLELE = 128
+LIMITE_BALAYAGE = 500
+
+
+def modification(action, cible, valeur):
+    """Modification élémentaire: action de ACTIONS appliquée aux projets / revenus nommés ``cible``"""
+    if action not in ACTIONS:
+        raise ValueError(f"Action inconnue: {action}")
+    return {'action': action, 'cible': cible, 'valeur': valeur}
+
+
+def variante(nom, *modifications):
+    return {'nom': nom, 'modifications': list(modifications)}
+
+
+def libelle_modification(modif):
+    """Libellé court, ex. 'Voyage enfants Suisse +6 mois' ou 'Scolarité enfants budget -10%'"""
+    action, cible, valeur = modif['action'], modif['cible'], modif['valeur']
+    if action == 'decaler':
+        return f"{cible} {valeur:+g} mois"
+    return f"{cible} {action.replace('_', ' ')} {(valeur - 1) * 100:+.0f}%"
+
+
+def balayage(noms_projets, decalages=(3, 6, 12), facteurs_budget=(0.8, 0.9, 1.1),
+             facteurs_cash_flow=(0.5, 2.0), limite=LIMITE_BALAYAGE):
+    """Variantes à une modification par projet, puis paires de modifications sur deux projets distincts"""
+    simples = [modification('decaler', nom, d) for nom in noms_projets for d in decalages]
+    simples += [modification('budget', nom, f) for nom in noms_projets for f in facteurs_budget]
+    simples += [modification('cash_flow', nom, f) for nom in noms_projets for f in facteurs_cash_flow]
+
+    variantes = [variante(libelle_modification(m), m) for m in simples[:limite]]
+    for a, b in combinations(simples, 2):
+        if len(variantes) >= limite:
+            break
+        if a['cible'] != b['cible']:
+            variantes.append(variante(f"{libelle_modification(a)} & {libelle_modification(b)}", a, b))
+    return variantes
+
+
+def _index_noms(enregistrements):
+    """Nom -> numéros de ligne (plusieurs enregistrements peuvent porter le même nom)"""
+    index = {}
+    for ligne, enregistrement in enumerate(enregistrements):
+        index.setdefault(enregistrement.get('nom'), []).append(ligne)
+    return index
+
+
+def preparer_base(projets, revenus, annee="Tout", mois="Tout", debut=None, fin=FIN_PROJECTION):
+    """Plan de base en colonnes: totaux KPI de la période, flux projeté et index des noms
+
+    Les KPIs suivent le filtre de période; la projection porte sur tout le plan
+    (comme projection_cash_flow), revenus irréguliers à leur moyenne historique.
+    """
+    store = en_store(projets)
+    horizon = mois_projection(debut, fin)
+    revenus_periode = {id(r) for r in filter_data_by_period(revenus, 'date_creation', annee, mois)}
+    moyennes, _, _ = statistiques_revenus(revenus)
+    annees = horizon.astype('datetime64[Y]')
+
+    return {
+        'mois': horizon,
+        'annees': np.unique(annees).astype(int) + 1970,
+        # Dernier mois de chaque année de l'horizon
+        'fins_annee': np.flatnonzero(np.append(annees[1:] != annees[:-1], True)),
+        'totaux': totaux_kpis(store, revenus, annee, mois),
+        'flux': flux_colonnes(store.colonne('cash_flow_mensuel'), store.colonne('echeance'), horizon)
+        + moyennes.sum(),
+        'codes': {nom_type: store.code('type', nom_type)
+                  for nom_type in ('Actif générateur', 'Passif', 'Investissement formation')},
+        'projets': {
+            'type': store.colonne('type'),
+            'montant_total': store.colonne('montant_total'),
+            'cash_flow_mensuel': store.colonne('cash_flow_mensuel'),
+            'echeance': store.colonne('echeance'),
+            'periode': store.masque_periode('date_creation', annee, mois),
+        },
+        'revenus': {
+            'montant_mensuel': np.array([float(r['montant_mensuel']) for r in revenus]),
+            'moyenne': moyennes,
+            'periode': np.array([id(r) in revenus_periode for r in revenus], dtype=bool),
+        },
+        'index_projets': _index_noms(store),
+        'index_revenus': _index_noms(revenus),
+    }
+
+
+def compiler(base, variante_):
+    """(nom, [(action, lignes, valeur)]): cibles résolues en numéros de ligne; cible inconnue ignorée"""
+    compilees = []
+    for modif in variante_['modifications']:
+        index = base['index_revenus'] if ACTIONS[modif['action']][0] == 'revenu' else base['index_projets']
+        lignes = index.get(modif['cible'])
+        if lignes is not None:
+            compilees.append((modif['action'], np.array(lignes, dtype=np.int64), modif['valeur']))
+    return variante_['nom'], compilees
+
+
+def _contributions(base, types, montants, cash_flows):
+    """Part des lignes données dans les totaux KPI (mêmes formules que totaux_kpis)"""
+    codes = base['codes']
+    est_actif = types == codes['Actif générateur']
+    return {
+        'total_actifs': montants[est_actif].sum(),
+        'total_passifs': montants[types == codes['Passif']].sum(),
+        'total_formation': montants[types == codes['Investissement formation']].sum(),
+        'cash_flow_mensuel': cash_flows.sum(),
+        'revenus_passifs': cash_flows[est_actif & (cash_flows > 0)].sum(),
+        'depenses_mensuelles': -cash_flows[cash_flows < 0].sum(),
+    }
+
+
+def evaluer_variante(base, variante_compilee):
+    """KPIs et projection (soldes cumulés de fin d'année) d'une variante compilée"""
+    nom, modifications = variante_compilee
+    totaux = dict(base['totaux'])
+    flux = base['flux'].copy()
+
+    projets = base['projets']
+    lignes = np.unique(np.concatenate(
+        [l for action, l, _ in modifications if ACTIONS[action][0] == 'projet'] or [np.empty(0, np.int64)]
+    ))
+    if lignes.size:
+        types = projets['type'][lignes]
+        montants = projets['montant_total'][lignes].copy()
+        cash_flows = projets['cash_flow_mensuel'][lignes].copy()
+        echeances = projets['echeance'][lignes].astype('datetime64[M]')
+        anciens = (montants.copy(), cash_flows.copy(), echeances.copy())
+
+        for action, cibles, valeur in modifications:
+            if ACTIONS[action][0] != 'projet':
+                continue
+            k = np.searchsorted(lignes, cibles)
+            if action == 'decaler':
+                echeances[k] += int(valeur)
+            elif action == 'budget':
+                montants[k] *= valeur
+                cash_flows[k] = np.where(cash_flows[k] < 0, cash_flows[k] * valeur, cash_flows[k])
+            elif action == 'cash_flow':
+                cash_flows[k] *= valeur
+
+        # Écart des lignes modifiées: KPIs sur celles de la période, projection sur toutes
+        periode = projets['periode'][lignes]
+        avant = _contributions(base, types[periode], anciens[0][periode], anciens[1][periode])
+        apres = _contributions(base, types[periode], montants[periode], cash_flows[periode])
+        for cle in avant:
+            totaux[cle] += float(apres[cle] - avant[cle])
+        flux += flux_colonnes(cash_flows, echeances, base['mois']) - flux_colonnes(anciens[1], anciens[2], base['mois'])
+
+    revenus = base['revenus']
+    for action, cibles, valeur in modifications:
+        if action == 'revenu':
+            dans_periode = cibles[revenus['periode'][cibles]]
+            totaux['revenus_mensuels'] += float(revenus['montant_mensuel'][dans_periode].sum() * (valeur - 1))
+            flux += revenus['moyenne'][cibles].sum() * (valeur - 1)
+
+    cumul = flux.cumsum()
+    deficits = np.flatnonzero(cumul < 0)
+    return {
+        'nom': nom,
+        'kpis': construire_kpis(totaux),
+        'soldes_annuels': cumul[base['fins_annee']],
+        'solde_final': float(cumul[-1]),
+        'premier_deficit': base['mois'][deficits[0]] if deficits.size else None,
+    }
+
+
+def creer_pool(nb_processus=None):
+    """Pool de processus longue durée, à créer une fois et réutiliser
+
+    forkserver (spawn à défaut): les processus de travail ne sont jamais obtenus
+    par fork du serveur multithreadé et de ses verrous.
+    """
+    methodes = multiprocessing.get_all_start_methods()
+    contexte = multiprocessing.get_context('forkserver' if 'forkserver' in methodes else 'spawn')
+    return ProcessPoolExecutor(nb_processus or os.cpu_count() or 1, mp_context=contexte)
+
+
+def _evaluer_lot(colonnes, lot):
+    return [evaluer_variante(colonnes, v) for v in lot]
+
+
+def evaluer_scenarios(base, variantes, obtenir_pool=None, nb_processus=None):
+    """Résultats des variantes (dans leur ordre), en lots sur un pool de processus si le balayage le justifie
+
+    ``obtenir_pool``: fonction renvoyant un pool longue durée (creer_pool), appelée
+    seulement si le balayage dépasse SEUIL_PARALLELE et que plusieurs processeurs
+    sont disponibles. Un lot par processus; les index de noms restent dans le
+    processus appelant, les lots ne transportent que les colonnes et les variantes
+    compilées.
+    """
+    compilees = [compiler(base, v) for v in variantes]
+    colonnes = {cle: valeur for cle, valeur in base.items() if not cle.startswith('index_')}
+
+    nb_processus = nb_processus or os.cpu_count() or 1
+    if obtenir_pool is None or nb_processus <= 1 or len(compilees) < SEUIL_PARALLELE:
+        return [evaluer_variante(colonnes, v) for v in compilees]
+
+    taille = -(-len(compilees) // nb_processus)
+    pool = obtenir_pool()
+    lots = [pool.submit(_evaluer_lot, colonnes, compilees[i:i + taille]) for i in range(0, len(compilees), taille)]
+    return [resultat for lot in lots for resultat in lot.result()]
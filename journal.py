@@ -0,0 +1,330 @@
+# Plan Financier Familial - Journal des mutations (append-only) + snapshots
+# Chaque mutation (projet, revenu, suivi, configuration) est ajoutée à un segment
+# JSON Lines. Les écritures sont regroupées (group commit: un fsync par lot) par
+# un thread dédié. Un snapshot compact est écrit périodiquement; au démarrage on
+# charge le dernier snapshot puis on rejoue seulement la fin du journal.
+
+import copy
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+from json_backup import EncodeurSauvegarde, convertir_dates, ecrire_sauvegarde, lire_sauvegarde
+from project_store import copier_enregistrement
+
+DELAI_COMMIT_DEFAUT = 0.05
+EVENEMENTS_PAR_SNAPSHOT_DEFAUT = 1000
+# Pause du thread d'écriture après une erreur (disque plein...) avant de réessayer
+PAUSE_APRES_ERREUR = 1.0
+
+journal_log = logging.getLogger(__name__)
+
+# Types d'événements
+PROJET = 'projet'
+PROJET_SUPPRIME = 'projet_supprime'
+REVENU = 'revenu'
+REVENU_SUPPRIME = 'revenu_supprime'
+CONFIG = 'config'
+REMPLACEMENT = 'remplacement'
+
+
+class Journal:
+    """Journal append-only partagé par les sessions, avec état matérialisé pour les snapshots"""
+
+    def __init__(self, dossier, delai_commit=DELAI_COMMIT_DEFAUT,
+                 evenements_par_snapshot=EVENEMENTS_PAR_SNAPSHOT_DEFAUT, cle_revenu=None):
+        self.dossier = dossier
+        self._cle_revenu = cle_revenu or (lambda r: r.get('id'))
+        self.delai_commit = delai_commit
+        self.evenements_par_snapshot = evenements_par_snapshot
+        os.makedirs(dossier, exist_ok=True)
+
+        self._encodeur = EncodeurSauvegarde(ensure_ascii=False, separators=(',', ':'))
+        self._verrou = threading.Lock()
+        self._condition = threading.Condition(self._verrou)
+        self._en_attente = []
+        self._seq = 0
+        self._seq_ecrite = 0
+        self._seq_snapshot = 0
+        # Snapshot en cours d'écriture (seq), et verrou qui sérialise les écritures de snapshot
+        self._seq_snapshot_en_cours = 0
+        self._verrou_snapshot = threading.Lock()
+        # Accès au segment courant (écriture, fsync, rotation), hors du verrou de l'état:
+        # enregistrer() n'attend jamais un fsync. Ordre: snapshot, fichier, état
+        self._verrou_fichier = threading.Lock()
+        self._ferme = False
+        self.derniere_erreur = None
+
+        # État matérialisé (id -> enregistrement)
+        self._projets = {}
+        self._revenus = {}
+        self._admin_config = None
+        self.evenements_rejoues = 0
+        self._charger()
+
+        self._segment = self._ouvrir_segment(self._seq + 1)
+        self._thread = threading.Thread(target=self._boucle_ecriture, name='journal-commit', daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Fichiers
+    # ------------------------------------------------------------------
+
+    def _chemin_segment(self, premiere_seq):
+        return os.path.join(self.dossier, f"journal_{premiere_seq:012d}.jsonl")
+
+    def _chemin_snapshot(self, seq):
+        return os.path.join(self.dossier, f"snapshot_{seq:012d}.json.gz")
+
+    def _ouvrir_segment(self, premiere_seq):
+        chemin = self._chemin_segment(premiere_seq)
+        segment = open(chemin, 'a', encoding='utf-8')
+        # Segment existant terminé par une ligne tronquée: repartir sur une ligne neuve
+        if segment.tell() > 0:
+            with open(chemin, 'rb') as fichier:
+                fichier.seek(-1, os.SEEK_END)
+                if fichier.read(1) != b'\n':
+                    segment.write('\n')
+        return segment
+
+    def _snapshots(self):
+        return sorted(glob.glob(os.path.join(self.dossier, "snapshot_*.json.gz")))
+
+    def _segments(self):
+        return sorted(glob.glob(os.path.join(self.dossier, "journal_*.jsonl")))
+
+    # ------------------------------------------------------------------
+    # Chargement (snapshot + rejeu de la fin du journal)
+    # ------------------------------------------------------------------
+
+    def _charger(self):
+        for chemin in reversed(self._snapshots()):
+            try:
+                snapshot = lire_sauvegarde(chemin)
+            except (OSError, ValueError, EOFError):
+                continue
+            self._seq_snapshot = self._seq = int(snapshot['meta'].get('seq', 0))
+            self._projets = {p['id']: p for p in snapshot['projets'] or []}
+            self._revenus = {self._cle_revenu(r): r for r in snapshot['revenus'] or []}
+            self._admin_config = snapshot['admin_config']
+            break
+
+        for chemin in self._segments():
+            with open(chemin, encoding='utf-8') as fichier:
+                for ligne in fichier:
+                    try:
+                        evenement = json.loads(ligne)
+                    except json.JSONDecodeError:
+                        # Dernière ligne tronquée (arrêt pendant une écriture)
+                        break
+                    if evenement['seq'] <= self._seq_snapshot:
+                        continue
+                    self._appliquer(evenement['type'], self._decoder(evenement['type'], evenement['donnees']))
+                    self._seq = evenement['seq']
+                    self.evenements_rejoues += 1
+        self._seq_ecrite = self._seq
+
+    @staticmethod
+    def _decoder(type_evenement, donnees):
+        if type_evenement in (PROJET, REVENU):
+            return convertir_dates([donnees])[0]
+        if type_evenement == REMPLACEMENT:
+            for cle in ('projets', 'revenus'):
+                if donnees.get(cle) is not None:
+                    convertir_dates(donnees[cle])
+        return donnees
+
+    def _appliquer(self, type_evenement, donnees):
+        if type_evenement == PROJET:
+            self._projets[donnees['id']] = donnees
+        elif type_evenement == PROJET_SUPPRIME:
+            self._projets.pop(donnees, None)
+        elif type_evenement == REVENU:
+            self._revenus[self._cle_revenu(donnees)] = donnees
+        elif type_evenement == REVENU_SUPPRIME:
+            self._revenus.pop(donnees, None)
+        elif type_evenement == CONFIG:
+            self._admin_config = donnees
+        elif type_evenement == REMPLACEMENT:
+            if donnees.get('projets') is not None:
+                self._projets = {p['id']: p for p in donnees['projets']}
+            if donnees.get('revenus') is not None:
+                self._revenus = {self._cle_revenu(r): r for r in donnees['revenus']}
+            if donnees.get('admin_config') is not None:
+                self._admin_config = donnees['admin_config']
+
+    def est_vide(self):
+        return self._seq == 0
+
+    def etat(self):
+        """Copies indépendantes de l'état (projets, revenus, admin_config) pour une nouvelle session"""
+        with self._verrou:
+            return (
+                [copier_enregistrement(p) for p in self._projets.values()],
+                [copier_enregistrement(r) for r in self._revenus.values()],
+                copy.deepcopy(self._admin_config),
+            )
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def enregistrer(self, type_evenement, donnees):
+        """Ajoute un événement; il est écrit par le prochain lot (group commit)"""
+        if type_evenement in (PROJET, REVENU):
+            donnees = copier_enregistrement(donnees)
+        elif type_evenement == CONFIG:
+            donnees = copy.deepcopy(donnees)
+        elif type_evenement == REMPLACEMENT:
+            donnees = {
+                'projets': None if donnees.get('projets') is None else [copier_enregistrement(p) for p in donnees['projets']],
+                'revenus': None if donnees.get('revenus') is None else [copier_enregistrement(r) for r in donnees['revenus']],
+                'admin_config': copy.deepcopy(donnees.get('admin_config')),
+            }
+        with self._condition:
+            self._seq += 1
+            self._appliquer(type_evenement, donnees)
+            self._en_attente.append(
+                self._encodeur.encode({'seq': self._seq, 'type': type_evenement, 'donnees': donnees})
+            )
+            self._condition.notify()
+            return self._seq
+
+    def _ecrire_lot(self):
+        """Écrit les lignes en attente et les synchronise sur disque (verrou de l'état non tenu)"""
+        with self._verrou_fichier:
+            with self._condition:
+                lignes, self._en_attente = self._en_attente, []
+                seq = self._seq
+            self._ecrire_lignes(lignes, seq)
+
+    def _ecrire_lignes(self, lignes, seq):
+        """Ajoute les lignes au segment courant puis fsync (verrou du fichier tenu)"""
+        if not lignes:
+            return
+        try:
+            self._segment.write('\n'.join(lignes) + '\n')
+            self._segment.flush()
+            os.fsync(self._segment.fileno())
+        except BaseException:
+            # Lot remis en attente (une ligne réécrite après un échec partiel est rejouée à l'identique)
+            with self._condition:
+                self._en_attente = lignes + self._en_attente
+            raise
+        with self._condition:
+            self._seq_ecrite = max(self._seq_ecrite, seq)
+
+    def _boucle_ecriture(self):
+        while True:
+            try:
+                if self._commit():
+                    return
+            except Exception as erreur:
+                # Le thread ne doit jamais s'arrêter en silence: erreur journalisée, nouvel essai
+                self.derniere_erreur = repr(erreur)
+                journal_log.exception("Échec d'écriture du journal, nouvel essai dans %.1f s", PAUSE_APRES_ERREUR)
+                with self._condition:
+                    if not self._ferme:
+                        self._condition.wait(PAUSE_APRES_ERREUR)
+
+    def _commit(self):
+        """Un lot: attente, fenêtre de regroupement, écriture, snapshot si dû. True à la fermeture"""
+        with self._condition:
+            while not self._en_attente and not self._ferme:
+                self._condition.wait()
+            if self._ferme and not self._en_attente:
+                return True
+            # Fenêtre de regroupement: les soumissions rapprochées partagent un fsync
+            echeance = time.monotonic() + self.delai_commit
+            while not self._ferme and (restant := echeance - time.monotonic()) > 0:
+                self._condition.wait(restant)
+        self._ecrire_lot()
+        with self._condition:
+            dernier_snapshot = max(self._seq_snapshot, self._seq_snapshot_en_cours)
+            snapshot_du = self._seq - dernier_snapshot >= self.evenements_par_snapshot
+        if snapshot_du:
+            self.ecrire_snapshot()
+        return False
+
+    def vider(self):
+        """Force l'écriture des événements en attente"""
+        self._ecrire_lot()
+
+    def ecrire_snapshot(self):
+        """Écrit un snapshot de l'état courant, ouvre un nouveau segment et purge les anciens fichiers
+
+        Thread d'écriture et bouton d'administration peuvent demander un snapshot en
+        même temps: les écritures sont sérialisées par un verrou dédié (le second
+        appel trouve le snapshot à jour ou écrit le suivant).
+        """
+        with self._verrou_snapshot:
+            with self._verrou_fichier:
+                # Lignes en attente et état capturés ensemble: les lignes vont dans l'ancien
+                # segment, tout événement ultérieur dans le nouveau
+                with self._condition:
+                    lignes, self._en_attente = self._en_attente, []
+                    seq = self._seq
+                    if not lignes and seq == self._seq_snapshot and self._snapshots():
+                        return seq
+                    projets = list(self._projets.values())
+                    revenus = list(self._revenus.values())
+                    admin_config = self._admin_config
+                    self._seq_snapshot_en_cours = seq
+                try:
+                    self._ecrire_lignes(lignes, seq)
+                    anciens_segments = self._segments()
+                    self._segment.close()
+                    self._segment = self._ouvrir_segment(seq + 1)
+                except BaseException:
+                    with self._condition:
+                        self._seq_snapshot_en_cours = 0
+                    raise
+
+            try:
+                # Les enregistrements de l'état ne sont jamais modifiés en place: écriture hors verrou
+                chemin = self._chemin_snapshot(seq)
+                temporaire = chemin + '.tmp'
+                ecrire_sauvegarde(temporaire, projets, revenus, admin_config, compact=True, compresser=True,
+                                  meta={'seq': seq})
+                os.replace(temporaire, chemin)
+            finally:
+                with self._condition:
+                    self._seq_snapshot_en_cours = 0
+
+            with self._condition:
+                self._seq_snapshot = max(self._seq_snapshot, seq)
+            for ancien in self._snapshots():
+                if ancien != chemin and ancien < chemin:
+                    os.remove(ancien)
+            for segment in anciens_segments:
+                if segment != self._chemin_segment(seq + 1):
+                    os.remove(segment)
+            return seq
+
+    def fermer(self):
+        with self._condition:
+            self._ferme = True
+            self._condition.notify()
+        self._thread.join()
+        self._ecrire_lot()
+        with self._verrou_fichier:
+            self._segment.close()
+
+    # ------------------------------------------------------------------
+    # Statistiques
+    # ------------------------------------------------------------------
+
+    def statistiques(self):
+        with self._verrou:
+            return {
+                'seq': self._seq,
+                'seq_ecrite': self._seq_ecrite,
+                'seq_snapshot': self._seq_snapshot,
+                'en_attente': len(self._en_attente),
+                'segments': len(self._segments()),
+                'evenements_rejoues': self.evenements_rejoues,
+                'derniere_erreur': self.derniere_erreur,
+            }
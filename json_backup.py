@@ -0,0 +1,123 @@
+# Plan Financier Familial - Sauvegarde / restauration JSON
+# Écriture en flux, enregistrement par enregistrement, avec un encodeur dédié:
+# les données de session ne sont ni copiées ni modifiées. Option compacte / gzip.
+
+from datetime import date, datetime
+import gzip
+import io
+import json
+
+import numpy as np
+
+FORMAT_SAUVEGARDE = 'plan_financier_sauvegarde'
+VERSION_FORMAT = 1
+
+CHAMPS_DATE = ('echeance',)
+CHAMPS_DATE_HEURE = ('date_creation', 'date_modification')
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class EncodeurSauvegarde(json.JSONEncoder):
+    """Sérialise dates et scalaires NumPy sans toucher aux objets d'origine"""
+
+    def default(self, o):
+        if isinstance(o, (datetime, date)):
+            return o.isoformat()
+        if isinstance(o, np.integer):
+            return int(o)
+        if isinstance(o, np.floating):
+            return float(o)
+        if isinstance(o, np.bool_):
+            return bool(o)
+        return super().default(o)
+
+
+def _ouvrir_ecriture(chemin, compresser):
+    if compresser:
+        return io.TextIOWrapper(gzip.open(chemin, 'wb', compresslevel=5), encoding='utf-8')
+    return open(chemin, 'w', encoding='utf-8', buffering=1024 * 1024)
+
+
+def _ecrire_liste(fichier, encodeur, cle, enregistrements, compact):
+    """Écrit ``"cle": [...]`` un enregistrement à la fois (une ligne par enregistrement en mode lisible)"""
+    separateur = ',' if compact else ',\n  '
+    fichier.write(f'"{cle}":[' if compact else f'"{cle}": [\n  ')
+    premier = True
+    for enregistrement in enregistrements:
+        if not premier:
+            fichier.write(separateur)
+        fichier.write(encodeur.encode(enregistrement))
+        premier = False
+    fichier.write(']' if compact else '\n]')
+
+
+def ecrire_sauvegarde(chemin, projets, revenus, admin_config, compact=False, compresser=False, meta=None):
+    """Écrit la sauvegarde dans ``chemin`` (gzip si ``compresser``) et retourne le chemin"""
+    if compact:
+        encodeur = EncodeurSauvegarde(ensure_ascii=False, separators=(',', ':'))
+    else:
+        encodeur = EncodeurSauvegarde(ensure_ascii=False)
+    entete = {
+        'format': FORMAT_SAUVEGARDE,
+        'version': VERSION_FORMAT,
+        'timestamp': datetime.now(),
+        'admin_config': admin_config,
+    }
+    if meta:
+        entete.update(meta)
+
+    with _ouvrir_ecriture(chemin, compresser) as fichier:
+        # En-tête: petit objet encodé d'un bloc, sans l'accolade fermante
+        fichier.write(encodeur.encode(entete)[:-1])
+        fichier.write(',' if compact else ',\n')
+        _ecrire_liste(fichier, encodeur, 'projets', projets, compact)
+        fichier.write(',' if compact else ',\n')
+        _ecrire_liste(fichier, encodeur, 'revenus_variables', revenus, compact)
+        fichier.write('}' if compact else '\n}\n')
+    return chemin
+
+
+def _date_iso(valeur):
+    return date.fromisoformat(valeur[:10])
+
+
+def convertir_dates(enregistrements):
+    """Textes ISO -> date / datetime, champ par champ (en place sur les objets relus)"""
+    conversions = [(c, _date_iso) for c in CHAMPS_DATE] + [(c, datetime.fromisoformat) for c in CHAMPS_DATE_HEURE]
+    for champ, conversion in conversions:
+        for enregistrement in enregistrements:
+            valeur = enregistrement.get(champ)
+            if isinstance(valeur, str) and valeur:
+                try:
+                    enregistrement[champ] = conversion(valeur)
+                except ValueError:
+                    pass
+    return enregistrements
+
+
+def lire_sauvegarde(source):
+    """Relit une sauvegarde (chemin, bytes ou fichier; gzip détecté automatiquement)"""
+    if isinstance(source, (bytes, bytearray)):
+        donnees = bytes(source)
+    elif hasattr(source, 'read'):
+        donnees = source.read()
+    else:
+        with open(source, 'rb') as fichier:
+            donnees = fichier.read()
+    if donnees[:2] == GZIP_MAGIC:
+        donnees = gzip.decompress(donnees)
+
+    sauvegarde = json.loads(donnees)
+    if not isinstance(sauvegarde, dict) or ('projets' not in sauvegarde and 'revenus_variables' not in sauvegarde):
+        raise ValueError("Fichier de sauvegarde invalide: ni 'projets' ni 'revenus_variables'")
+
+    projets = sauvegarde.get('projets')
+    revenus = sauvegarde.get('revenus_variables')
+    return {
+        'projets': convertir_dates(projets) if projets is not None else None,
+        'revenus': convertir_dates(revenus) if revenus is not None else None,
+        'admin_config': sauvegarde.get('admin_config'),
+        'timestamp': sauvegarde.get('timestamp'),
+        'meta': {k: v for k, v in sauvegarde.items() if k not in ('projets', 'revenus_variables', 'admin_config')},
+    }
@@ -0,0 +1,145 @@
+# Plan Financier Familial - Moteur KPI incrémental
+# Les totaux sont mis à jour à chaque mutation (projet, revenu, suivi) au lieu
+# d'être recalculés à chaque rerun. La lecture pour un filtre donné est O(1).
+
+import numpy as np
+
+from project_store import periode_de
+
+# Composantes agrégées (une ligne de vecteur par champ)
+CHAMPS = (
+    'revenus_mensuels',
+    'cash_flow_mensuel',
+    'total_actifs',
+    'total_passifs',
+    'total_formation',
+    'revenus_passifs',
+    'depenses_mensuelles',
+    'nombre_actifs',
+    'nombre_projets',
+    'entrees_suivi',
+)
+INDEX = {champ: i for i, champ in enumerate(CHAMPS)}
+
+TYPES_TOTAUX = {
+    'Actif générateur': 'total_actifs',
+    'Passif': 'total_passifs',
+    'Investissement formation': 'total_formation',
+}
+
+
+def _nombre(valeur):
+    try:
+        return float(valeur)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def contribution_projet(projet):
+    """Vecteur de contribution d'un projet aux KPIs"""
+    vecteur = np.zeros(len(CHAMPS))
+    montant = _nombre(projet.get('montant_total'))
+    cash_flow = _nombre(projet.get('cash_flow_mensuel'))
+    type_projet = projet.get('type')
+
+    vecteur[INDEX['cash_flow_mensuel']] = cash_flow
+    vecteur[INDEX['nombre_projets']] = 1
+    vecteur[INDEX['entrees_suivi']] = len(projet.get('suivi_mensuel') or [])
+    if cash_flow < 0:
+        vecteur[INDEX['depenses_mensuelles']] = -cash_flow
+    if type_projet in TYPES_TOTAUX:
+        vecteur[INDEX[TYPES_TOTAUX[type_projet]]] = montant
+    if type_projet == 'Actif générateur':
+        vecteur[INDEX['nombre_actifs']] = 1
+        if cash_flow > 0:
+            vecteur[INDEX['revenus_passifs']] = cash_flow
+    return vecteur
+
+
+def contribution_revenu(revenu):
+    """Vecteur de contribution d'un revenu variable aux KPIs"""
+    vecteur = np.zeros(len(CHAMPS))
+    vecteur[INDEX['revenus_mensuels']] = _nombre(revenu.get('montant_mensuel'))
+    return vecteur
+
+
+class KpiAggregator:
+    """Agrégats KPI maintenus par (année, mois) de création, avec marges pré-calculées"""
+
+    def __init__(self, projets=(), revenus=(), cle_revenu=None):
+        self._cle_revenu = cle_revenu or (lambda r: r.get('id'))
+        self._contributions = {}
+        self._global = np.zeros(len(CHAMPS))
+        self._par_bucket = {}
+        self._par_annee = {}
+        self._par_mois = {}
+        for projet in projets:
+            self.maj_projet(projet)
+        for revenu in revenus:
+            self.maj_revenu(revenu)
+
+    def copie(self):
+        """Copie indépendante (les contributions, jamais modifiées en place, sont partagées)"""
+        copie = object.__new__(type(self))
+        copie._cle_revenu = self._cle_revenu
+        copie._contributions = dict(self._contributions)
+        copie._global = self._global.copy()
+        copie._par_bucket = {cle: v.copy() for cle, v in self._par_bucket.items()}
+        copie._par_annee = {cle: v.copy() for cle, v in self._par_annee.items()}
+        copie._par_mois = {cle: v.copy() for cle, v in self._par_mois.items()}
+        return copie
+
+    def _appliquer(self, periode, vecteur, signe):
+        annee, mois = periode
+        for table, cle in ((self._par_bucket, periode), (self._par_annee, annee), (self._par_mois, mois)):
+            if cle not in table:
+                table[cle] = np.zeros(len(CHAMPS))
+            table[cle] += signe * vecteur
+        self._global += signe * vecteur
+
+    def _remplacer(self, cle, periode, vecteur):
+        ancienne = self._contributions.pop(cle, None)
+        if ancienne is not None:
+            self._appliquer(ancienne[0], ancienne[1], -1)
+        if vecteur is not None:
+            self._appliquer(periode, vecteur, 1)
+            self._contributions[cle] = (periode, vecteur)
+
+    # ------------------------------------------------------------------
+    # Événements CRUD
+    # ------------------------------------------------------------------
+
+    def maj_projet(self, projet):
+        """Projet ajouté, modifié ou suivi mensuel mis à jour"""
+        self._remplacer(('projet', projet.get('id')), periode_de(projet.get('date_creation')), contribution_projet(projet))
+
+    def retirer_projet(self, projet_id):
+        self._remplacer(('projet', projet_id), None, None)
+
+    def maj_revenu(self, revenu):
+        """Revenu ajouté ou modifié"""
+        self._remplacer(('revenu', self._cle_revenu(revenu)), periode_de(revenu.get('date_creation')), contribution_revenu(revenu))
+
+    def retirer_revenu(self, revenu_id):
+        self._remplacer(('revenu', revenu_id), None, None)
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def totaux(self, annee="Tout", mois="Tout"):
+        """Totaux bruts pour la période (dict champ -> valeur)"""
+        if annee == "Tout" and mois == "Tout":
+            vecteur = self._global
+        elif annee == "Tout":
+            vecteur = self._par_mois.get(mois)
+        elif mois == "Tout":
+            vecteur = self._par_annee.get(annee)
+        else:
+            vecteur = self._par_bucket.get((annee, mois))
+        if vecteur is None:
+            vecteur = np.zeros(len(CHAMPS))
+        totaux = {champ: float(vecteur[i]) for i, champ in enumerate(CHAMPS)}
+        for champ in ('nombre_actifs', 'nombre_projets', 'entrees_suivi'):
+            totaux[champ] = int(round(totaux[champ]))
+        return totaux
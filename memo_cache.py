@@ -0,0 +1,142 @@
+# Plan Financier Familial - Cache versionné des agrégats
+# Mémoïse KPIs et agrégats de pages par (nom, version des données, filtre),
+# avec éviction LRU et budget mémoire borné. Partagé entre les sessions: le
+# verrou ne protège que la lecture et l'insertion, les calculs tournent hors
+# verrou (une session lente ne bloque pas les hits des autres) et un calcul en
+# cours pour une clé est attendu plutôt que refait.
+
+from collections import OrderedDict
+import sys
+import threading
+
+import numpy as np
+
+BUDGET_OCTETS_DEFAUT = 32 * 1024 * 1024
+ENTREES_MAX_DEFAUT = 256
+
+
+def estimer_taille(valeur, _vus=None):
+    """Estimation (en octets) de l'empreinte mémoire d'une valeur cachée"""
+    if _vus is None:
+        _vus = set()
+    if id(valeur) in _vus:
+        return 0
+    _vus.add(id(valeur))
+
+    # pandas n'est pas importé ici: s'il n'est pas chargé, la valeur n'est pas un DataFrame
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(valeur, pd.DataFrame):
+        return int(valeur.memory_usage(index=True, deep=True).sum())
+    if pd is not None and isinstance(valeur, pd.Series):
+        return int(valeur.memory_usage(index=True, deep=True))
+    if isinstance(valeur, np.ndarray):
+        return int(valeur.nbytes)
+    taille = sys.getsizeof(valeur)
+    if isinstance(valeur, dict):
+        taille += sum(estimer_taille(k, _vus) + estimer_taille(v, _vus) for k, v in valeur.items())
+    elif isinstance(valeur, (list, tuple, set, frozenset)):
+        taille += sum(estimer_taille(v, _vus) for v in valeur)
+    return taille
+
+
+class _CalculEnCours:
+    """Calcul d'une clé par un thread; les autres demandeurs attendent son résultat"""
+
+    __slots__ = ('thread', 'termine', 'valeur', 'reussi')
+
+    def __init__(self):
+        self.thread = threading.get_ident()
+        self.termine = threading.Event()
+        self.valeur = None
+        self.reussi = False
+
+
+class VersionedCache:
+    """Cache LRU borné en mémoire, invalidé par numéro de version des données"""
+
+    def __init__(self, budget_octets=BUDGET_OCTETS_DEFAUT, entrees_max=ENTREES_MAX_DEFAUT):
+        self.budget_octets = budget_octets
+        self.entrees_max = entrees_max
+        self._entrees = OrderedDict()
+        self._octets = 0
+        self._derniere_version = None
+        self._verrou = threading.Lock()
+        self._en_cours = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entrees)
+
+    @property
+    def octets(self):
+        return self._octets
+
+    def _retirer(self, cle):
+        _, taille = self._entrees.pop(cle)
+        self._octets -= taille
+
+    def _purger_versions(self, version):
+        """Les versions ne font qu'augmenter: les entrées plus anciennes sont mortes"""
+        if version == self._derniere_version:
+            return
+        for cle in [c for c in self._entrees if c[1] != version]:
+            self._retirer(cle)
+        self._derniere_version = version
+
+    def obtenir(self, nom, version, filtre, calcul, mesurer=estimer_taille):
+        """Retourne la valeur cachée pour (nom, version, filtre) ou la calcule (hors verrou)"""
+        cle = (nom, version, filtre)
+        while True:
+            with self._verrou:
+                if cle in self._entrees:
+                    self._entrees.move_to_end(cle)
+                    self.hits += 1
+                    return self._entrees[cle][0]
+
+                en_cours = self._en_cours.get(cle)
+                # Session encore sur une version dépassée, ou le thread redemande la clé
+                # qu'il est en train de calculer: calcul direct, sans mise en cache
+                if (self._derniere_version is not None and version < self._derniere_version) or (
+                        en_cours is not None and en_cours.thread == threading.get_ident()):
+                    self.misses += 1
+                    calculateur = None
+                    break
+                if en_cours is None:
+                    self.misses += 1
+                    self._purger_versions(version)
+                    calculateur = self._en_cours[cle] = _CalculEnCours()
+                    break
+
+            # Calcul de la même clé par une autre session: attendre son résultat
+            en_cours.termine.wait()
+            if en_cours.reussi:
+                with self._verrou:
+                    self.hits += 1
+                return en_cours.valeur
+            # Calcul attendu en échec: nouvelle tentative, ce thread peut devenir le calculateur
+
+        if calculateur is None:
+            return calcul()
+
+        try:
+            valeur = calcul()
+            taille = mesurer(valeur)
+            calculateur.valeur, calculateur.reussi = valeur, True
+        finally:
+            with self._verrou:
+                del self._en_cours[cle]
+                # Insertion seulement si les données n'ont pas changé pendant le calcul
+                if calculateur.reussi and taille <= self.budget_octets and version == self._derniere_version:
+                    self._entrees[cle] = (valeur, taille)
+                    self._octets += taille
+                    while self._octets > self.budget_octets or len(self._entrees) > self.entrees_max:
+                        self._retirer(next(iter(self._entrees)))
+            calculateur.termine.set()
+        return valeur
+
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+            self._octets = 0
+            self._derniere_version = None
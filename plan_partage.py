@@ -0,0 +1,192 @@
+# Plan Financier Familial - Instantané partagé du plan et surcouches de session
+# Toutes les sessions du processus lisent le même instantané figé (projets,
+# revenus, configuration, moteur KPI) et partagent les caches d'agrégats et de
+# figures. Les modifications d'une session vont dans une petite surcouche
+# (copie à l'écriture, enregistrement par enregistrement) publiée comme un
+# nouvel instantané: les enregistrements inchangés ne sont jamais dupliqués.
+
+import copy
+import itertools
+import threading
+import time
+
+from kpi_engine import KpiAggregator
+from memo_cache import VersionedCache
+from project_store import ProjectStore, RevenueStore, copier_enregistrement
+
+BUDGET_FIGURES_OCTETS = 16 * 1024 * 1024
+ENTREES_FIGURES_MAX = 64
+
+
+def _cle_id(enregistrement):
+    return enregistrement.get('id')
+
+
+def _trouver(store, cle, valeur):
+    """Enregistrement du store dont la clé vaut valeur (index par id, sinon parcours)"""
+    enregistrement = store.get_by_id(valeur)
+    if enregistrement is None and store.get_by_id(None) is not None:
+        # Anciennes données sans identifiant (revenus repérés par leur nom)
+        enregistrement = next((e for e in store if cle(e) == valeur), None)
+    return enregistrement
+
+
+def _deriver(store, cle, modifies, supprimes):
+    """Nouveau store figé: enregistrements modifiés remplacés ou ajoutés, supprimés retirés"""
+    copie = store.copie()
+    if supprimes:
+        copie.retirer_plusieurs([e for e in (_trouver(copie, cle, v) for v in supprimes) if e is not None])
+    for valeur, enregistrement in modifies.items():
+        existant = _trouver(copie, cle, valeur)
+        if existant is None:
+            copie.append(enregistrement)
+        else:
+            copie[int(copie.lignes_de([existant])[0])] = enregistrement
+    return copie.figer()
+
+
+class Instantane:
+    """État du plan figé à une génération donnée (jamais modifié après publication)"""
+
+    __slots__ = ('generation', 'projets', 'revenus', 'admin_config', 'kpis', 'horodatage')
+
+    def __init__(self, generation, projets, revenus, admin_config, kpis):
+        self.generation = generation
+        self.projets = projets
+        self.revenus = revenus
+        self.admin_config = admin_config
+        self.kpis = kpis
+        self.horodatage = time.time()
+
+
+class Surcouche:
+    """Modifications non publiées d'une session, copiées à la première écriture"""
+
+    def __init__(self, base, cle_revenu=None):
+        self.base = base
+        self._cle_revenu = cle_revenu or _cle_id
+        self.projets = {}
+        self.projets_supprimes = set()
+        self.revenus = {}
+        self.revenus_supprimes = set()
+        self.admin_config = None
+
+    def est_vide(self):
+        return not (self.projets or self.projets_supprimes or self.revenus
+                    or self.revenus_supprimes or self.admin_config is not None)
+
+    def projet(self, projet_id):
+        """Copie privée (modifiable) du projet, None s'il n'existe pas"""
+        if projet_id in self.projets_supprimes:
+            return None
+        if projet_id not in self.projets:
+            projet = self.base.projets.get_by_id(projet_id)
+            if projet is None:
+                return None
+            self.projets[projet_id] = copier_enregistrement(projet)
+        return self.projets[projet_id]
+
+    def ajouter_projet(self, projet):
+        self.projets_supprimes.discard(projet['id'])
+        self.projets[projet['id']] = projet
+
+    def supprimer_projet(self, projet_id):
+        self.projets.pop(projet_id, None)
+        self.projets_supprimes.add(projet_id)
+
+    def revenu(self, id_revenu):
+        """Copie privée (modifiable) du revenu, None s'il n'existe pas"""
+        if id_revenu in self.revenus_supprimes:
+            return None
+        if id_revenu not in self.revenus:
+            revenu = _trouver(self.base.revenus, self._cle_revenu, id_revenu)
+            if revenu is None:
+                return None
+            self.revenus[id_revenu] = copier_enregistrement(revenu)
+        return self.revenus[id_revenu]
+
+    def ajouter_revenu(self, revenu):
+        id_revenu = self._cle_revenu(revenu)
+        self.revenus_supprimes.discard(id_revenu)
+        self.revenus[id_revenu] = revenu
+
+    def supprimer_revenu(self, id_revenu):
+        self.revenus.pop(id_revenu, None)
+        self.revenus_supprimes.add(id_revenu)
+
+
+class PlanPartage:
+    """Instantané courant du plan et caches dérivés, communs à toutes les sessions du processus"""
+
+    def __init__(self, projets, revenus, admin_config, cle_revenu=None):
+        self._cle_revenu = cle_revenu or _cle_id
+        self._verrou = threading.Lock()
+        self._generations = itertools.count(1)
+        # Clés: version des stores + filtre, donc partagées par les sessions au même filtre
+        self.cache_aggregats = VersionedCache()
+        self.cache_figures = VersionedCache(budget_octets=BUDGET_FIGURES_OCTETS, entrees_max=ENTREES_FIGURES_MAX)
+        self._instantane = self._construire(projets, revenus, admin_config)
+
+    def _construire(self, projets, revenus, admin_config):
+        if not (isinstance(projets, ProjectStore) and projets.fige):
+            projets = ProjectStore(projets).figer()
+        if not (isinstance(revenus, RevenueStore) and revenus.fige):
+            revenus = RevenueStore(revenus).figer()
+        kpis = KpiAggregator(projets, revenus, cle_revenu=self._cle_revenu)
+        return Instantane(next(self._generations), projets, revenus, copy.deepcopy(admin_config), kpis)
+
+    def instantane(self):
+        """Instantané courant (à relire à chaque rerun)"""
+        return self._instantane
+
+    def publier(self, surcouche):
+        """Applique la surcouche à l'instantané courant et publie le résultat
+
+        La surcouche peut avoir été construite sur une génération antérieure: ses
+        enregistrements remplacent ceux de l'instantané courant (le dernier écrit
+        gagne, comme dans le stockage persistant).
+        """
+        with self._verrou:
+            courant = self._instantane
+            projets, revenus, admin_config = courant.projets, courant.revenus, courant.admin_config
+            kpis = courant.kpis.copie()
+
+            if surcouche.projets or surcouche.projets_supprimes:
+                projets = _deriver(projets, _cle_id, surcouche.projets, surcouche.projets_supprimes)
+                for projet_id in surcouche.projets_supprimes:
+                    kpis.retirer_projet(projet_id)
+                for projet in surcouche.projets.values():
+                    kpis.maj_projet(projet)
+
+            if surcouche.revenus or surcouche.revenus_supprimes:
+                revenus = _deriver(revenus, self._cle_revenu, surcouche.revenus, surcouche.revenus_supprimes)
+                for id_revenu in surcouche.revenus_supprimes:
+                    kpis.retirer_revenu(id_revenu)
+                for revenu in surcouche.revenus.values():
+                    kpis.maj_revenu(revenu)
+
+            if surcouche.admin_config is not None:
+                admin_config = copy.deepcopy(surcouche.admin_config)
+
+            self._instantane = Instantane(next(self._generations), projets, revenus, admin_config, kpis)
+            return self._instantane
+
+    def remplacer(self, projets=None, revenus=None, admin_config=None):
+        """Remplacement en masse (import, restauration): nouveaux stores et moteur KPI reconstruit"""
+        with self._verrou:
+            courant = self._instantane
+            self._instantane = self._construire(
+                courant.projets if projets is None else projets,
+                courant.revenus if revenus is None else revenus,
+                courant.admin_config if admin_config is None else admin_config
+            )
+            return self._instantane
+
+    def reconstruire_kpis(self):
+        """Mêmes données, moteur KPI recalculé de zéro; les caches dérivés sont vidés"""
+        with self._verrou:
+            courant = self._instantane
+            instantane = self._instantane = self._construire(courant.projets, courant.revenus, courant.admin_config)
+        self.cache_aggregats.vider()
+        self.cache_figures.vider()
+        return instantane
@@ -0,0 +1,481 @@
+# Plan Financier Familial - Stockage colonnaire des projets et revenus
+# Conserve l'API "liste de dicts" utilisée par les pages tout en gardant
+# montants, types, statuts et dates dans des tableaux NumPy, avec un index
+# (année, mois) sur la date de création pour le filtre global.
+
+from bisect import bisect_left, insort
+from collections.abc import MutableSequence
+from datetime import datetime, date
+import heapq
+import itertools
+import weakref
+
+import numpy as np
+
+CAPACITE_INITIALE = 64
+
+# Champ date utilisé par le filtre global mois/année
+CHAMP_PERIODE = 'date_creation'
+
+# Compteur de versions partagé: chaque mutation d'un store reçoit un numéro unique
+_VERSIONS = itertools.count(1)
+
+
+def _to_float(value):
+    """Convertit une valeur en float (0 si absente ou invalide)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def normaliser_jour(value):
+    """Normalise une date (date, datetime ou chaîne ISO) en datetime64[D]"""
+    if isinstance(value, datetime):
+        value = value.date()
+    elif isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value).date()
+        except ValueError:
+            value = date.today()
+    elif not isinstance(value, date):
+        value = date.today()
+    return np.datetime64(value, 'D')
+
+
+def periode_de(value):
+    """(année, mois) d'une date normalisée"""
+    mois_absolu = int(normaliser_jour(value).astype('datetime64[M]').astype(np.int64))
+    return mois_absolu // 12 + 1970, mois_absolu % 12 + 1
+
+
+def copier_enregistrement(enregistrement):
+    """Copie détachée d'un enregistrement (les listes de suivi / historique sont copiées aussi)"""
+    copie = dict(enregistrement)
+    for champ in ('suivi_mensuel', 'historique_mensuel'):
+        if champ in copie and copie[champ] is not None:
+            copie[champ] = [dict(e) for e in copie[champ]]
+    return copie
+
+
+class StoreRecord(dict):
+    """Dict qui notifie son store à chaque modification (immuable une fois figé)"""
+
+    __slots__ = ('_store_ref', '_fige')
+
+    def __init__(self, data, store):
+        super().__init__(data)
+        self._store_ref = weakref.ref(store)
+        self._fige = False
+
+    def _verifier(self):
+        if self._fige:
+            raise TypeError("Enregistrement figé: le modifier via une copie du store")
+
+    def _notify(self, keys):
+        store = self._store_ref()
+        if store is not None:
+            store._record_modifie(self, keys)
+
+    def __setitem__(self, key, value):
+        self._verifier()
+        super().__setitem__(key, value)
+        self._notify((key,))
+
+    def __delitem__(self, key):
+        self._verifier()
+        super().__delitem__(key)
+        self._notify((key,))
+
+    def update(self, *args, **kwargs):
+        data = dict(*args, **kwargs)
+        self._verifier()
+        super().update(data)
+        self._notify(data.keys())
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        self._verifier()
+        value = super().pop(key, *default)
+        self._notify((key,))
+        return value
+
+    def __reduce__(self):
+        # Les copies (pickle, deepcopy) sont des dicts simples détachés du store
+        return (dict, (dict(self),))
+
+
+class RecordStore(MutableSequence):
+    """Liste de dicts adossée à des colonnes NumPy pour les calculs vectorisés"""
+
+    colonnes_numeriques = ()
+    colonnes_categorielles = ()
+    colonnes_dates = (CHAMP_PERIODE,)
+    libelle = "éléments"
+
+    def __init__(self, records=()):
+        self._vocabulaires = {col: {} for col in self.colonnes_categorielles}
+        self._fige = False
+        self._reset(records)
+
+    def _verifier_modifiable(self):
+        if self._fige:
+            raise TypeError(f"{type(self).__name__} figé: utiliser copie() pour le modifier")
+
+    def _modifie(self):
+        """Nouvelle version des données (invalide les caches dépendants)"""
+        self.version = next(_VERSIONS)
+
+    # ------------------------------------------------------------------
+    # Gestion mémoire des colonnes
+    # ------------------------------------------------------------------
+
+    def _allouer(self, capacite):
+        """(Ré)alloue les colonnes avec la capacité demandée"""
+        anciennes = self._colonnes
+        nouvelles = {}
+        for col in self.colonnes_numeriques:
+            nouvelles[col] = np.zeros(capacite, dtype=np.float64)
+        for col in self.colonnes_categorielles:
+            nouvelles[col] = np.zeros(capacite, dtype=np.int32)
+        for col in self.colonnes_dates:
+            nouvelles[col] = np.zeros(capacite, dtype='datetime64[D]')
+            nouvelles[f'{col}_annee'] = np.zeros(capacite, dtype=np.int16)
+            nouvelles[f'{col}_mois'] = np.zeros(capacite, dtype=np.int8)
+        for col, valeurs in anciennes.items():
+            nouvelles[col][:self._n] = valeurs[:self._n]
+        self._colonnes = nouvelles
+        self._capacite = capacite
+
+    def _code(self, col, valeur):
+        """Retourne (et crée si besoin) le code entier d'une catégorie"""
+        vocab = self._vocabulaires[col]
+        if valeur not in vocab:
+            vocab[valeur] = len(vocab)
+        return vocab[valeur]
+
+    def _ecrire_cellule(self, ligne, col, valeur):
+        if col in self.colonnes_numeriques:
+            self._colonnes[col][ligne] = _to_float(valeur)
+        elif col in self.colonnes_categorielles:
+            self._colonnes[col][ligne] = self._code(col, valeur)
+        elif col in self.colonnes_dates:
+            jour = normaliser_jour(valeur)
+            self._colonnes[col][ligne] = jour
+            mois_absolu = jour.astype('datetime64[M]').astype(np.int64)
+            self._colonnes[f'{col}_annee'][ligne] = mois_absolu // 12 + 1970
+            self._colonnes[f'{col}_mois'][ligne] = mois_absolu % 12 + 1
+
+    def _ecrire_ligne(self, ligne, record):
+        for col in self.colonnes_numeriques + self.colonnes_categorielles + self.colonnes_dates:
+            self._ecrire_cellule(ligne, col, record.get(col))
+
+    def _reindexer(self):
+        self._lignes = {id(r): i for i, r in enumerate(self._records)}
+        self._par_id = {r.get('id'): r for r in self._records}
+        self._reconstruire_periodes()
+
+    def _record_modifie(self, record, keys):
+        ligne = self._lignes.get(id(record))
+        if ligne is None:
+            return
+        self._modifie()
+        ancienne_periode = self._periode_ligne(ligne)
+        for key in keys:
+            self._ecrire_cellule(ligne, key, record.get(key))
+        if CHAMP_PERIODE in keys:
+            self._deplacer_periode(ligne, ancienne_periode, self._periode_ligne(ligne))
+        if 'id' in keys:
+            self._reindexer()
+
+    # ------------------------------------------------------------------
+    # Index (année, mois) de la date de création
+    # ------------------------------------------------------------------
+
+    def _periode_ligne(self, ligne):
+        return (
+            int(self._colonnes[f'{CHAMP_PERIODE}_annee'][ligne]),
+            int(self._colonnes[f'{CHAMP_PERIODE}_mois'][ligne])
+        )
+
+    def _indexer_periode(self, ligne, periode):
+        insort(self._buckets.setdefault(periode, []), ligne)
+        self._annees_par_mois.setdefault(periode[1], set()).add(periode[0])
+
+    def _deplacer_periode(self, ligne, ancienne, nouvelle):
+        if ancienne == nouvelle:
+            return
+        bucket = self._buckets[ancienne]
+        del bucket[bisect_left(bucket, ligne)]
+        if not bucket:
+            del self._buckets[ancienne]
+            self._annees_par_mois[ancienne[1]].discard(ancienne[0])
+        self._indexer_periode(ligne, nouvelle)
+
+    def _reconstruire_periodes(self):
+        """Reconstruit l'index des périodes à partir des colonnes (vectorisé)"""
+        self._buckets = {}
+        self._annees_par_mois = {}
+        if not self._n:
+            return
+        annees = self.colonne(f'{CHAMP_PERIODE}_annee').astype(np.int64)
+        mois = self.colonne(f'{CHAMP_PERIODE}_mois').astype(np.int64)
+        cles = annees * 12 + (mois - 1)
+        ordre = np.argsort(cles, kind='stable')
+        uniques, debuts = np.unique(cles[ordre], return_index=True)
+        for cle, lignes in zip(uniques, np.split(ordre, debuts[1:])):
+            periode = (int(cle) // 12, int(cle) % 12 + 1)
+            self._buckets[periode] = lignes.tolist()
+            self._annees_par_mois.setdefault(periode[1], set()).add(periode[0])
+
+    def lignes_periode(self, annee="Tout", mois="Tout"):
+        """Lignes (ordre du store) créées dans la période, via l'index (année, mois)"""
+        if annee != "Tout" and mois != "Tout":
+            return list(self._buckets.get((annee, mois), ()))
+        if annee != "Tout":
+            buckets = [self._buckets[(annee, m)] for m in range(1, 13) if (annee, m) in self._buckets]
+        elif mois != "Tout":
+            buckets = [self._buckets[(a, mois)] for a in self._annees_par_mois.get(mois, ())]
+        else:
+            return list(range(self._n))
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return list(heapq.merge(*buckets))
+
+    def selection_periode(self, annee="Tout", mois="Tout"):
+        """Éléments créés dans la période, en temps proportionnel au résultat"""
+        return [self._records[i] for i in self.lignes_periode(annee, mois)]
+
+    # ------------------------------------------------------------------
+    # API MutableSequence (compatibilité liste de dicts)
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __setitem__(self, index, data):
+        self._verifier_modifiable()
+        if isinstance(index, slice):
+            records = list(self._records)
+            records[index] = data
+            self._reset(records)
+            return
+        if index < 0:
+            index += self._n
+        record = StoreRecord(data, self)
+        ancien = self._records[index]
+        ancienne_periode = self._periode_ligne(index)
+        del self._lignes[id(ancien)]
+        self._par_id.pop(ancien.get('id'), None)
+        self._records[index] = record
+        self._lignes[id(record)] = index
+        self._par_id[record.get('id')] = record
+        self._ecrire_ligne(index, record)
+        self._deplacer_periode(index, ancienne_periode, self._periode_ligne(index))
+        self._modifie()
+
+    def __delitem__(self, index):
+        lignes = range(self._n)[index]
+        if isinstance(lignes, int):
+            lignes = [lignes]
+        self._supprimer_lignes(lignes)
+
+    def _supprimer_lignes(self, lignes):
+        """Retire ces lignes en un seul compactage des colonnes"""
+        self._verifier_modifiable()
+        garder = np.ones(self._n, dtype=bool)
+        garder[list(lignes)] = False
+        for col, valeurs in self._colonnes.items():
+            restantes = valeurs[:self._n][garder]
+            valeurs[:len(restantes)] = restantes
+        self._records = [r for r, g in zip(self._records, garder) if g]
+        self._n = len(self._records)
+        self._reindexer()
+        self._modifie()
+
+    def insert(self, index, data):
+        self._verifier_modifiable()
+        if index >= self._n:
+            self.append(data)
+            return
+        records = list(self._records)
+        records.insert(index, data)
+        self._reset(records)
+
+    def append(self, data):
+        self._verifier_modifiable()
+        if self._n == self._capacite:
+            self._allouer(self._capacite * 2)
+        record = StoreRecord(data, self)
+        ligne = self._n
+        self._records.append(record)
+        self._lignes[id(record)] = ligne
+        self._par_id[record.get('id')] = record
+        self._n += 1
+        self._ecrire_ligne(ligne, record)
+        self._indexer_periode(ligne, self._periode_ligne(ligne))
+        self._modifie()
+
+    def _reset(self, records):
+        self._records = []
+        self._lignes = {}
+        self._par_id = {}
+        self._buckets = {}
+        self._annees_par_mois = {}
+        self._n = 0
+        self._colonnes = {}
+        self._allouer(max(CAPACITE_INITIALE, len(records)))
+        self._modifie()
+        for record in records:
+            self.append(record)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._n} {self.libelle})"
+
+    # ------------------------------------------------------------------
+    # Accès par identifiant et colonnaire
+    # ------------------------------------------------------------------
+
+    def get_by_id(self, record_id):
+        """Retourne l'élément portant cet identifiant (ou None)"""
+        return self._par_id.get(record_id)
+
+    def par_ids(self, ids):
+        """Retourne les éléments correspondant aux identifiants, dans l'ordre donné"""
+        return [self._par_id[i] for i in ids if i in self._par_id]
+
+    def retirer(self, record):
+        """Supprime cet élément (comparaison par identité)"""
+        ligne = self._lignes.get(id(record))
+        if ligne is not None:
+            del self[ligne]
+
+    def remove_by_id(self, record_id):
+        """Supprime l'élément portant cet identifiant"""
+        record = self._par_id.get(record_id)
+        if record is not None:
+            self.retirer(record)
+
+    def retirer_plusieurs(self, records):
+        """Supprime ces éléments (comparaison par identité) en un seul compactage"""
+        lignes = [self._lignes[id(r)] for r in records if id(r) in self._lignes]
+        if lignes:
+            self._supprimer_lignes(lignes)
+
+    # ------------------------------------------------------------------
+    # Instantanés figés et copies
+    # ------------------------------------------------------------------
+
+    @property
+    def fige(self):
+        return self._fige
+
+    def figer(self):
+        """Rend le store et ses enregistrements immuables (partageables entre sessions)"""
+        self._fige = True
+        for record in self._records:
+            record._fige = True
+        return self
+
+    def copie(self):
+        """Copie modifiable: colonnes et index dupliqués, enregistrements partagés
+
+        Les enregistrements d'un store figé ne sont jamais modifiés en place: la copie
+        les remplace (store[ligne] = ...) au lieu de les modifier, ce qui permet de les
+        partager sans les dupliquer.
+        """
+        copie = object.__new__(type(self))
+        copie._fige = False
+        copie._vocabulaires = {col: dict(vocab) for col, vocab in self._vocabulaires.items()}
+        copie._records = list(self._records)
+        copie._lignes = dict(self._lignes)
+        copie._par_id = dict(self._par_id)
+        copie._buckets = {periode: list(lignes) for periode, lignes in self._buckets.items()}
+        copie._annees_par_mois = {mois: set(annees) for mois, annees in self._annees_par_mois.items()}
+        copie._n = self._n
+        copie._capacite = self._capacite
+        copie._colonnes = {col: valeurs.copy() for col, valeurs in self._colonnes.items()}
+        copie._modifie()
+        return copie
+
+    def colonne(self, col):
+        """Vue (lecture seule) d'une colonne sur les lignes occupées"""
+        vue = self._colonnes[col][:self._n]
+        vue.flags.writeable = False
+        return vue
+
+    def lignes_de(self, records):
+        """Numéros de ligne des éléments donnés (dans l'ordre donné)"""
+        return np.fromiter((self._lignes[id(r)] for r in records), dtype=np.int64, count=len(records))
+
+    def libelles(self, col, lignes):
+        """Valeurs d'une colonne catégorielle pour ces lignes (décodage vectorisé)"""
+        vocabulaire = np.empty(len(self._vocabulaires[col]), dtype=object)
+        vocabulaire[:] = list(self._vocabulaires[col])
+        return vocabulaire[self.colonne(col)[lignes]]
+
+    def code(self, col, valeur):
+        """Code entier d'une catégorie, -1 si elle n'existe pas"""
+        return self._vocabulaires[col].get(valeur, -1)
+
+    def nb_categories(self, col):
+        return len(self._vocabulaires[col])
+
+    def masque_periode(self, col, annee="Tout", mois="Tout"):
+        """Masque booléen des lignes dont la date tombe dans la période"""
+        masque = np.ones(self._n, dtype=bool)
+        if annee != "Tout":
+            masque &= self.colonne(f'{col}_annee') == annee
+        if mois != "Tout":
+            masque &= self.colonne(f'{col}_mois') == mois
+        return masque
+
+    def selection(self, masque):
+        """Retourne les dicts correspondant au masque"""
+        return [self._records[i] for i in np.flatnonzero(masque)]
+
+
+class ProjectStore(RecordStore):
+    """Projets: montants, types, statuts et dates en colonnes"""
+
+    colonnes_numeriques = (
+        'montant_total',
+        'budget_alloue_mensuel',
+        'montant_utilise_reel',
+        'cash_flow_mensuel',
+        'roi_attendu',
+    )
+    colonnes_categorielles = (
+        'type',
+        'statut',
+        'priorite',
+        'responsable',
+    )
+    colonnes_dates = (
+        'echeance',
+        'date_creation',
+    )
+    libelle = "projets"
+
+
+class RevenueStore(RecordStore):
+    """Revenus variables: montants, types et dates en colonnes"""
+
+    colonnes_numeriques = (
+        'montant_mensuel',
+    )
+    colonnes_categorielles = (
+        'type',
+        'responsable',
+    )
+    colonnes_dates = (
+        'date_creation',
+    )
+    libelle = "revenus"
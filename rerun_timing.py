@@ -0,0 +1,108 @@
+# Plan Financier Familial - Chronométrage des reruns
+# Chaque rerun complet produit un relevé (page, durée totale, et pour chaque
+# fonction instrumentée: nombre d'appels et durée cumulée), conservé dans un
+# tampon circulaire borné partagé par toutes les sessions du processus.
+
+from collections import deque
+from contextlib import contextmanager
+import functools
+import threading
+import time
+
+import numpy as np
+
+TAILLE_TAMPON_DEFAUT = 2000
+
+
+class ChronoReruns:
+    """Tampon circulaire des derniers reruns; le relevé en cours est propre au thread du script"""
+
+    def __init__(self, taille=TAILLE_TAMPON_DEFAUT):
+        self._releves = deque(maxlen=taille)
+        self._verrou = threading.Lock()
+        self._courant = threading.local()
+
+    @contextmanager
+    def rerun(self):
+        """Encadre un rerun complet; seuls les reruns terminés normalement sont conservés"""
+        releve = {'page': None, 'horodatage': time.time(), 'duree': 0.0, 'fonctions': {}}
+        self._courant.releve = releve
+        debut = time.perf_counter()
+        try:
+            yield releve
+            releve['duree'] = time.perf_counter() - debut
+            with self._verrou:
+                self._releves.append(releve)
+        finally:
+            self._courant.releve = None
+
+    def definir_page(self, page):
+        releve = getattr(self._courant, 'releve', None)
+        if releve is not None:
+            releve['page'] = page
+
+    def enregistrer(self, nom, duree):
+        """Ajoute un appel au relevé courant (ignoré hors rerun: fragments, mode bare)"""
+        releve = getattr(self._courant, 'releve', None)
+        if releve is None:
+            return
+        appels, total = releve['fonctions'].get(nom, (0, 0.0))
+        releve['fonctions'][nom] = (appels + 1, total + duree)
+
+    @contextmanager
+    def mesurer(self, nom):
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.enregistrer(nom, time.perf_counter() - debut)
+
+    def chronometre(self, fonction):
+        """Décorateur: chaque appel est compté dans le relevé du rerun courant"""
+        nom = fonction.__name__
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            debut = time.perf_counter()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                self.enregistrer(nom, time.perf_counter() - debut)
+        return enveloppe
+
+    def releves(self):
+        with self._verrou:
+            return list(self._releves)
+
+    def vider(self):
+        with self._verrou:
+            self._releves.clear()
+
+    def statistiques(self):
+        """p50 / p95 / max (ms) par page (durée du rerun) et par fonction (durée cumulée par rerun)"""
+        releves = self.releves()
+        par_page, par_fonction, appels = {}, {}, {}
+        for releve in releves:
+            par_page.setdefault(releve['page'] or '?', []).append(releve['duree'])
+            for nom, (nombre, total) in releve['fonctions'].items():
+                par_fonction.setdefault(nom, []).append(total)
+                appels[nom] = appels.get(nom, 0) + nombre
+
+        def resume(durees):
+            ms = np.asarray(durees) * 1000
+            p50, p95 = np.percentile(ms, [50, 95])
+            return {'reruns': len(ms), 'p50_ms': float(p50), 'p95_ms': float(p95), 'max_ms': float(ms.max())}
+
+        return {
+            'reruns': len(releves),
+            'pages': {page: resume(durees) for page, durees in par_page.items()},
+            'fonctions': {
+                nom: {**resume(durees), 'appels_par_rerun': appels[nom] / len(durees)}
+                for nom, durees in par_fonction.items()
+            },
+        }
+
+
+# Instance du processus (les modules importés survivent aux reruns)
+CHRONO = ChronoReruns()
+chronometre = CHRONO.chronometre
@@ -0,0 +1,330 @@
+# Plan Financier Familial - Moteur de stockage SQLite (optionnel)
+# Persiste projets, revenus variables et suivi mensuel entre les sessions.
+# Activé via la variable d'environnement PLAN_FINANCIER_DB (chemin du fichier).
+
+from datetime import datetime, date
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projets (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    type TEXT,
+    montant_total NUMERIC DEFAULT 0,
+    budget_alloue_mensuel NUMERIC DEFAULT 0,
+    montant_utilise_reel NUMERIC DEFAULT 0,
+    cash_flow_mensuel NUMERIC DEFAULT 0,
+    statut TEXT,
+    echeance TEXT,
+    roi_attendu NUMERIC DEFAULT 0,
+    priorite TEXT,
+    description TEXT,
+    source_financement TEXT,
+    responsable TEXT,
+    date_creation TEXT,
+    date_modification TEXT,
+    annee_creation INTEGER GENERATED ALWAYS AS (CAST(substr(date_creation, 1, 4) AS INTEGER)) VIRTUAL,
+    mois_creation INTEGER GENERATED ALWAYS AS (CAST(substr(date_creation, 6, 2) AS INTEGER)) VIRTUAL
+);
+
+CREATE TABLE IF NOT EXISTS revenus_variables (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    montant_mensuel NUMERIC DEFAULT 0,
+    type TEXT,
+    regulier INTEGER DEFAULT 0,
+    responsable TEXT,
+    date_creation TEXT,
+    date_modification TEXT,
+    annee_creation INTEGER GENERATED ALWAYS AS (CAST(substr(date_creation, 1, 4) AS INTEGER)) VIRTUAL,
+    mois_creation INTEGER GENERATED ALWAYS AS (CAST(substr(date_creation, 6, 2) AS INTEGER)) VIRTUAL
+);
+
+CREATE TABLE IF NOT EXISTS suivi_mensuel (
+    projet_id INTEGER NOT NULL REFERENCES projets(id) ON DELETE CASCADE,
+    mois TEXT NOT NULL,
+    prevu NUMERIC DEFAULT 0,
+    reel NUMERIC DEFAULT 0,
+    PRIMARY KEY (projet_id, mois)
+);
+
+CREATE TABLE IF NOT EXISTS revenus_historique (
+    revenu_id INTEGER NOT NULL REFERENCES revenus_variables(id) ON DELETE CASCADE,
+    mois TEXT NOT NULL,
+    montant NUMERIC DEFAULT 0,
+    PRIMARY KEY (revenu_id, mois)
+);
+
+CREATE INDEX IF NOT EXISTS idx_projets_date_creation ON projets(date_creation);
+CREATE INDEX IF NOT EXISTS idx_projets_periode ON projets(annee_creation, mois_creation);
+CREATE INDEX IF NOT EXISTS idx_projets_mois ON projets(mois_creation);
+CREATE INDEX IF NOT EXISTS idx_projets_type ON projets(type);
+CREATE INDEX IF NOT EXISTS idx_projets_statut ON projets(statut);
+CREATE INDEX IF NOT EXISTS idx_projets_responsable ON projets(responsable);
+
+CREATE INDEX IF NOT EXISTS idx_revenus_date_creation ON revenus_variables(date_creation);
+CREATE INDEX IF NOT EXISTS idx_revenus_periode ON revenus_variables(annee_creation, mois_creation);
+CREATE INDEX IF NOT EXISTS idx_revenus_mois ON revenus_variables(mois_creation);
+CREATE INDEX IF NOT EXISTS idx_revenus_type ON revenus_variables(type);
+CREATE INDEX IF NOT EXISTS idx_revenus_responsable ON revenus_variables(responsable);
+"""
+
+CHAMPS_PROJET = (
+    'id', 'nom', 'type', 'montant_total', 'budget_alloue_mensuel', 'montant_utilise_reel',
+    'cash_flow_mensuel', 'statut', 'echeance', 'roi_attendu', 'priorite', 'description',
+    'source_financement', 'responsable', 'date_creation', 'date_modification'
+)
+
+CHAMPS_REVENU = (
+    'id', 'nom', 'montant_mensuel', 'type', 'regulier', 'responsable',
+    'date_creation', 'date_modification'
+)
+
+# Tri des projets: libellé de la page -> clause ORDER BY
+TRIS_PROJETS = {
+    "Nom": "nom ASC",
+    "Montant": "montant_total DESC",
+    "Échéance": "echeance ASC",
+    "ROI": "roi_attendu DESC",
+    "Type": "type ASC",
+    "Date création": "date_creation DESC",
+}
+
+
+def _vers_sql(value):
+    """Convertit les dates Python en texte ISO pour SQLite"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _depuis_sql_datetime(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _depuis_sql_date(value):
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return value
+
+
+def _upsert(table, champs):
+    colonnes = ", ".join(champs)
+    valeurs = ", ".join("?" for _ in champs)
+    maj = ", ".join(f"{c} = excluded.{c}" for c in champs if c != 'id')
+    return f"INSERT INTO {table} ({colonnes}) VALUES ({valeurs}) ON CONFLICT(id) DO UPDATE SET {maj}"
+
+
+def _clause_periode(annee, mois):
+    """Conditions WHERE indexées pour le filtre global mois/année"""
+    conditions, params = [], []
+    if annee != "Tout" and mois != "Tout":
+        conditions.append("annee_creation = ? AND mois_creation = ?")
+        params += [annee, mois]
+    elif annee != "Tout":
+        # Plage sur date_creation pour profiter de l'index
+        conditions.append("date_creation >= ? AND date_creation < ?")
+        params += [f"{annee:04d}", f"{annee + 1:04d}"]
+    elif mois != "Tout":
+        conditions.append("mois_creation = ?")
+        params.append(mois)
+    return conditions, params
+
+
+class SQLiteStorage:
+    """Moteur SQLite en mode WAL partagé par toutes les sessions"""
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self._conn = sqlite3.connect(chemin, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def compter(self, table):
+        """Nombre de lignes d'une table ('projets' ou 'revenus_variables')"""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def charger_projets(self):
+        """Charge les projets avec leur suivi mensuel (2 requêtes)"""
+        with self._lock:
+            lignes = self._conn.execute(
+                f"SELECT {', '.join(CHAMPS_PROJET)} FROM projets ORDER BY rowid"
+            ).fetchall()
+            suivis = self._conn.execute(
+                "SELECT projet_id, mois, prevu, reel FROM suivi_mensuel ORDER BY projet_id, mois"
+            ).fetchall()
+
+        suivi_par_projet = {}
+        for s in suivis:
+            suivi_par_projet.setdefault(s['projet_id'], []).append(
+                {'mois': s['mois'], 'prevu': s['prevu'], 'reel': s['reel']}
+            )
+
+        projets = []
+        for ligne in lignes:
+            projet = dict(ligne)
+            projet['echeance'] = _depuis_sql_date(projet['echeance'])
+            projet['date_creation'] = _depuis_sql_datetime(projet['date_creation'])
+            projet['date_modification'] = _depuis_sql_datetime(projet['date_modification'])
+            projet['suivi_mensuel'] = suivi_par_projet.get(projet['id'], [])
+            projets.append(projet)
+        return projets
+
+    def charger_revenus(self):
+        with self._lock:
+            lignes = self._conn.execute(
+                f"SELECT {', '.join(CHAMPS_REVENU)} FROM revenus_variables ORDER BY rowid"
+            ).fetchall()
+            historiques = self._conn.execute(
+                "SELECT revenu_id, mois, montant FROM revenus_historique ORDER BY revenu_id, mois"
+            ).fetchall()
+
+        historique_par_revenu = {}
+        for h in historiques:
+            historique_par_revenu.setdefault(h['revenu_id'], []).append(
+                {'mois': h['mois'], 'montant': h['montant']}
+            )
+
+        revenus = []
+        for ligne in lignes:
+            revenu = dict(ligne)
+            revenu['regulier'] = bool(revenu['regulier'])
+            revenu['date_creation'] = _depuis_sql_datetime(revenu['date_creation'])
+            revenu['date_modification'] = _depuis_sql_datetime(revenu['date_modification'])
+            if revenu['id'] in historique_par_revenu:
+                revenu['historique_mensuel'] = historique_par_revenu[revenu['id']]
+            revenus.append(revenu)
+        return revenus
+
+    def rechercher_projets(self, annee="Tout", mois="Tout", type_projet="Tous",
+                           statut="Tous", priorite="Toutes", tri="Nom"):
+        """Identifiants des projets filtrés et triés comme sur la page Gestion Projets"""
+        conditions, params = _clause_periode(annee, mois)
+        if type_projet != "Tous":
+            conditions.append("type = ?")
+            params.append(type_projet)
+        if statut != "Tous":
+            conditions.append("statut = ?")
+            params.append(statut)
+        if priorite != "Toutes":
+            conditions.append("COALESCE(priorite, 'Moyenne') = ?")
+            params.append(priorite)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = TRIS_PROJETS.get(tri, "rowid")
+        with self._lock:
+            lignes = self._conn.execute(
+                f"SELECT id FROM projets {where} ORDER BY {order}, rowid", params
+            ).fetchall()
+        return [ligne[0] for ligne in lignes]
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def enregistrer_projets(self, projets):
+        """Insère ou met à jour plusieurs projets (une seule transaction)"""
+        with self._lock, self._conn:
+            for projet in projets:
+                self._enregistrer_projet(projet)
+
+    def enregistrer_projet(self, projet):
+        with self._lock, self._conn:
+            self._enregistrer_projet(projet)
+
+    def _enregistrer_projet(self, projet):
+        self._conn.execute(
+            _upsert('projets', CHAMPS_PROJET),
+            [_vers_sql(projet.get(c)) for c in CHAMPS_PROJET]
+        )
+        self._conn.execute("DELETE FROM suivi_mensuel WHERE projet_id = ?", (projet['id'],))
+        self._conn.executemany(
+            "INSERT INTO suivi_mensuel (projet_id, mois, prevu, reel) VALUES (?, ?, ?, ?)",
+            [(projet['id'], s['mois'], s['prevu'], s['reel']) for s in projet.get('suivi_mensuel') or []]
+        )
+
+    def remplacer_projets(self, projets):
+        """Remplace tous les projets et leur suivi (import en masse, une transaction)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM projets")
+            self._conn.executemany(
+                _upsert('projets', CHAMPS_PROJET),
+                [[_vers_sql(p.get(c)) for c in CHAMPS_PROJET] for p in projets]
+            )
+            self._conn.executemany(
+                "INSERT INTO suivi_mensuel (projet_id, mois, prevu, reel) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(projet_id, mois) DO UPDATE SET prevu = excluded.prevu, reel = excluded.reel",
+                [(p['id'], s['mois'], s['prevu'], s['reel']) for p in projets for s in p.get('suivi_mensuel') or []]
+            )
+
+    def supprimer_projet(self, projet_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM projets WHERE id = ?", (projet_id,))
+
+    def enregistrer_suivis(self, projet_id, entrees, montant_utilise_reel, date_modification):
+        """Enregistre des entrées de suivi (mois, prevu, reel) et le montant utilisé du projet"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO suivi_mensuel (projet_id, mois, prevu, reel) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(projet_id, mois) DO UPDATE SET prevu = excluded.prevu, reel = excluded.reel",
+                [(projet_id, mois, prevu, reel) for mois, prevu, reel in entrees]
+            )
+            self._conn.execute(
+                "UPDATE projets SET montant_utilise_reel = ?, date_modification = ? WHERE id = ?",
+                (montant_utilise_reel, _vers_sql(date_modification), projet_id)
+            )
+
+    def enregistrer_revenus(self, revenus):
+        with self._lock, self._conn:
+            self._enregistrer_revenus(revenus)
+
+    def _enregistrer_revenus(self, revenus):
+        revenus = [r for r in revenus if isinstance(r.get('id'), int)]
+        self._conn.executemany(
+            _upsert('revenus_variables', CHAMPS_REVENU),
+            [[_vers_sql(r.get(c)) for c in CHAMPS_REVENU] for r in revenus]
+        )
+        for revenu in revenus:
+            if 'historique_mensuel' not in revenu:
+                continue
+            self._conn.execute("DELETE FROM revenus_historique WHERE revenu_id = ?", (revenu['id'],))
+            self._conn.executemany(
+                "INSERT INTO revenus_historique (revenu_id, mois, montant) VALUES (?, ?, ?)",
+                [(revenu['id'], h['mois'], h['montant']) for h in revenu['historique_mensuel']]
+            )
+
+    def remplacer_revenus(self, revenus):
+        """Remplace tous les revenus variables (import en masse)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM revenus_variables")
+            self._enregistrer_revenus(revenus)
+
+    def enregistrer_revenu(self, revenu):
+        self.enregistrer_revenus([revenu])
+
+    def supprimer_revenu(self, revenu_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM revenus_variables WHERE id = ?", (revenu_id,))
@@ -0,0 +1,158 @@
+# Plan Financier Familial - Générateur de plans synthétiques
+# Distributions dérivées des échantillons du dépôt: projects_sample.csv (budgets,
+# types, priorités, statuts, échéances, ROI) et transactions_sample.csv
+# (sources et montants de revenus). Sert aux benchmarks à grande échelle.
+
+from datetime import date, datetime, timedelta
+import csv
+import os
+
+import numpy as np
+
+RACINE = os.path.dirname(os.path.abspath(__file__))
+PROJETS_CSV = os.path.join(RACINE, 'projects_sample.csv')
+TRANSACTIONS_CSV = os.path.join(RACINE, 'transactions_sample.csv')
+
+# Vocabulaire des échantillons -> vocabulaire de l'application (admin_config)
+TYPES = {'Actif': 'Actif générateur', 'Passif': 'Passif'}
+PRIORITES = {'Vitale': 'Critique', 'Stratégique': 'Haute', 'Importante': 'Moyenne'}
+RESPONSABLES = ('Alix', 'William', 'Famille')
+TYPES_REVENU = {'Salaire': 'Salaire', 'IIBA': 'Business'}
+
+DEBUT_PLAN = date(2023, 1, 1)
+FIN_PLAN = date(2030, 12, 31)
+MOIS_SUIVI_MAX = 36
+# Durée minimale des projets générés (les échantillons couvrent une seule année)
+HORIZON_MIN_JOURS = 3 * 365
+
+
+def _frequences(valeurs):
+    uniques, comptes = np.unique(np.asarray(valeurs, dtype=object), return_counts=True)
+    return list(uniques), comptes / comptes.sum()
+
+
+def profil_echantillons(projets_csv=PROJETS_CSV, transactions_csv=TRANSACTIONS_CSV):
+    """Paramètres de distribution estimés sur les fichiers d'exemple"""
+    with open(projets_csv, encoding='utf-8', newline='') as fichier:
+        projets = list(csv.DictReader(fichier))
+    with open(transactions_csv, encoding='utf-8', newline='') as fichier:
+        transactions = [t for t in csv.DictReader(fichier) if t['Nature'] == 'Revenu']
+
+    budgets = np.array([float(p['Budget_prevu']) for p in projets])
+    reference = min(date.fromisoformat(p['Date_echeance']) for p in projets)
+    horizons = [(date.fromisoformat(p['Date_echeance']) - reference).days for p in projets]
+    roi_actifs = [float(p['ROI_estime_pct']) for p in projets if p['Type'] == 'Actif']
+
+    montants = {}
+    for transaction in transactions:
+        montants.setdefault(transaction['Source'], []).append(float(transaction['Montant']))
+
+    return {
+        'budget_log': (float(np.log(budgets).mean()), float(max(np.log(budgets).std(), 0.5))),
+        'horizon_jours': max(max(horizons), HORIZON_MIN_JOURS),
+        'roi_actifs': (float(np.mean(roi_actifs)), float(max(np.std(roi_actifs), 5.0))) if roi_actifs else (15.0, 5.0),
+        'types': _frequences([TYPES.get(p['Type'], 'Investissement formation') for p in projets]),
+        'priorites': _frequences([PRIORITES.get(p['Priorite'], 'Faible') for p in projets]),
+        'statuts': _frequences([p['Statut'] for p in projets]),
+        'categories': sorted({p['Categorie'] for p in projets}),
+        # Source -> (montant moyen, régulier si plusieurs versements, type de revenu)
+        'sources': {
+            source: (float(np.mean(valeurs)), len(valeurs) > 1, TYPES_REVENU.get(source.split()[0], 'Autre'))
+            for source, valeurs in montants.items()
+        },
+    }
+
+
+def _mois(jour, decalage):
+    indice = jour.year * 12 + jour.month - 1 + decalage
+    return f"{indice // 12}-{indice % 12 + 1:02d}"
+
+
+def generer_plan(nb_projets, graine=42, mois_suivi_max=MOIS_SUIVI_MAX, profil=None, aujourd_hui=None):
+    """(projets, revenus) synthétiques: suivi mensuel pluriannuel, revenus avec historique"""
+    profil = profil or profil_echantillons()
+    aujourd_hui = aujourd_hui or date.today()
+    rng = np.random.default_rng(graine)
+    n = nb_projets
+
+    # Tirages vectorisés, un tableau par champ
+    montants = np.round(rng.lognormal(*profil['budget_log'], n), -3)
+    types = rng.choice(np.array(profil['types'][0], dtype=object), n, p=profil['types'][1])
+    priorites = rng.choice(np.array(profil['priorites'][0], dtype=object), n, p=profil['priorites'][1])
+    statuts = rng.choice(np.array(profil['statuts'][0], dtype=object), n, p=profil['statuts'][1])
+    responsables = rng.choice(np.array(RESPONSABLES, dtype=object), n)
+    categories = rng.choice(np.array(profil['categories'], dtype=object), n)
+    etendue = (FIN_PLAN - DEBUT_PLAN).days
+    creations = rng.integers(0, etendue - 30, n)
+    echeances = np.minimum(creations + rng.integers(30, profil['horizon_jours'] + 30, n), etendue)
+    durees_mois = np.maximum((echeances - creations) // 30, 1)
+    roi = np.where(types == 'Actif générateur',
+                   np.clip(np.round(rng.normal(*profil['roi_actifs'], n)), 0, 60), 0).astype(int)
+    mensuel = np.round(montants / durees_mois, -3)
+    cash_flow = np.where(types == 'Actif générateur', np.round(montants * roi / 1200, -3), -mensuel)
+    ecarts = rng.normal(1.0, 0.25, (n, mois_suivi_max))
+
+    sources = list(profil['sources'])
+    projets = []
+    for i in range(n):
+        creation = DEBUT_PLAN + timedelta(days=int(creations[i]))
+        echeance = DEBUT_PLAN + timedelta(days=int(echeances[i]))
+        # Suivi du mois de création jusqu'à l'échéance ou aujourd'hui (borné)
+        fin_suivi = min(echeance, aujourd_hui)
+        nb_mois = (fin_suivi.year - creation.year) * 12 + fin_suivi.month - creation.month + 1
+        nb_mois = max(0, min(nb_mois, mois_suivi_max))
+        prevu = float(mensuel[i])
+        suivi = [
+            {'mois': _mois(creation, m), 'prevu': prevu, 'reel': float(round(prevu * max(ecarts[i, m], 0), -3))}
+            for m in range(nb_mois)
+        ]
+        projets.append({
+            'id': i + 1,
+            'nom': f"{categories[i]} {i + 1}",
+            'type': types[i],
+            'montant_total': float(montants[i]),
+            'budget_alloue_mensuel': prevu,
+            'montant_utilise_reel': float(sum(e['reel'] for e in suivi)),
+            'cash_flow_mensuel': float(cash_flow[i]),
+            'statut': statuts[i],
+            'echeance': echeance,
+            'roi_attendu': int(roi[i]),
+            'priorite': priorites[i],
+            'description': f"Projet synthétique ({categories[i]})",
+            'source_financement': sources[i % len(sources)],
+            'responsable': responsables[i],
+            'date_creation': datetime.combine(creation, datetime.min.time()),
+            'date_modification': datetime.combine(max(creation, fin_suivi), datetime.min.time()),
+            'suivi_mensuel': suivi,
+        })
+    return projets, generer_revenus(max(len(sources), n // 25), rng, profil, aujourd_hui)
+
+
+def generer_revenus(nb_revenus, rng, profil, aujourd_hui):
+    """Revenus dérivés des sources observées, avec historique mensuel sur plusieurs années"""
+    sources = list(profil['sources'].items())
+    debut = date(aujourd_hui.year - 3, 1, 1)
+    nb_mois = (aujourd_hui.year - debut.year) * 12 + aujourd_hui.month
+    revenus = []
+    for i in range(nb_revenus):
+        source, (moyenne, regulier, type_revenu) = sources[i % len(sources)]
+        nom = source if i < len(sources) else f"{source} {i // len(sources) + 1}"
+        dispersion = 0.02 if regulier else 0.45
+        historique = np.round(np.maximum(rng.normal(moyenne, moyenne * dispersion, nb_mois), 0), -3)
+        if not regulier:
+            # Revenus irréguliers: environ un mois sur deux sans versement
+            historique *= rng.random(nb_mois) < 0.5
+        revenus.append({
+            'id': i + 1,
+            'nom': nom,
+            'montant_mensuel': float(np.round(historique.mean(), -3)),
+            'type': type_revenu,
+            'regulier': regulier,
+            'responsable': RESPONSABLES[i % len(RESPONSABLES)],
+            'date_creation': datetime.combine(debut, datetime.min.time()),
+            'date_modification': datetime.combine(aujourd_hui, datetime.min.time()),
+            'historique_mensuel': [
+                {'mois': _mois(debut, m), 'montant': float(v)} for m, v in enumerate(historique) if v
+            ],
+        })
+    return revenus
@@ -0,0 +1,47 @@
+# Plan Financier Familial - Outil de maintenance facultatif: police Inter auto-hébergée
+# Usage (sur une machine connectée): python telecharger_polices.py
+# L'application n'en dépend pas: elle utilise les polices système. Ce script
+# télécharge Inter (sous-ensemble latin, police variable 400-700) dans static/fonts/;
+# pour l'utiliser, versionner le fichier avec sa licence OFL puis le déclarer dans
+# .streamlit/config.toml:
+#   [[theme.fontFaces]]
+#   family = "Inter"
+#   url = "app/static/fonts/Inter-latin.woff2"
+#   weight = "400 700"
+#   style = "normal"
+# et placer "Inter" en tête de theme.font.
+
+import os
+import re
+import urllib.request
+
+URL_CSS = 'https://fonts.googleapis.com/css2?family=Inter:wght@400..700&display=swap'
+# Google Fonts ne renvoie du woff2 qu'aux navigateurs récents
+AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+DOSSIER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'fonts')
+FICHIER = 'Inter-latin.woff2'
+
+
+def telecharger(url):
+    requete = urllib.request.Request(url, headers={'User-Agent': AGENT})
+    with urllib.request.urlopen(requete, timeout=30) as reponse:
+        return reponse.read()
+
+
+def main():
+    css = telecharger(URL_CSS).decode('utf-8')
+    # Un bloc @font-face par sous-ensemble, précédé d'un commentaire /* latin */
+    bloc = re.search(r'/\* latin \*/\s*@font-face\s*{([^}]*)}', css)
+    if bloc is None:
+        raise SystemExit("Sous-ensemble 'latin' introuvable dans la réponse Google Fonts")
+    url = re.search(r'url\((https://[^)]+\.woff2)\)', bloc.group(1)).group(1)
+
+    os.makedirs(DOSSIER, exist_ok=True)
+    chemin = os.path.join(DOSSIER, FICHIER)
+    with open(chemin, 'wb') as fichier:
+        fichier.write(telecharger(url))
+    print(f"{chemin} ({os.path.getsize(chemin) / 1024:.0f} Ko)")
+
+
+if __name__ == '__main__':
+    main()
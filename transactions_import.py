@@ -0,0 +1,130 @@
+# Plan Financier Familial - Import des transactions bancaires / mobile money
+# Lecture en flux (par blocs, types fixés) d'exports au format transactions_sample.csv
+# et agrégation vectorisée des montants par projet et par mois.
+
+import os
+
+import pandas as pd
+
+COLONNES = ['Date', 'Nature', 'Categorie', 'Montant', 'Source', 'Projet']
+
+DTYPES = {
+    'Date': 'object',
+    'Nature': 'category',
+    'Categorie': 'category',
+    'Montant': 'float64',
+    'Source': 'category',
+    'Projet': 'category',
+}
+
+TAILLE_BLOC_DEFAUT = 250_000
+
+NATURE_DEPENSE = 'Dépense'
+NATURE_REVENU = 'Revenu'
+
+
+def _taille_source(source):
+    """Taille en octets du fichier (chemin ou objet fichier), None si inconnue"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    taille = getattr(source, 'size', None)
+    if taille is None and hasattr(source, 'getbuffer'):
+        taille = source.getbuffer().nbytes
+    return taille
+
+
+def _cumuler(cumul, partiel, cles):
+    """Additionne un agrégat partiel au cumul (taille bornée par le nombre de clés)"""
+    if partiel.empty:
+        return cumul
+    if cumul is None:
+        return partiel
+    return pd.concat([cumul, partiel]).groupby(level=cles, observed=True).sum()
+
+
+def agreger_transactions(source, taille_bloc=TAILLE_BLOC_DEFAUT, progression=None):
+    """Agrège un export de transactions par projet/mois (dépenses) et source/mois (revenus)
+
+    La mémoire reste constante: seul un bloc de lignes et les agrégats
+    (un montant par clé) sont conservés. ``progression(fraction, lignes)``
+    est appelé après chaque bloc.
+    """
+    taille = _taille_source(source)
+    fichier = open(source, 'rb') if isinstance(source, (str, os.PathLike)) else source
+
+    depenses = None
+    revenus = None
+    categories = None
+    lignes = 0
+    lignes_ignorees = 0
+
+    try:
+        lecteur = pd.read_csv(
+            fichier,
+            usecols=COLONNES,
+            dtype=DTYPES,
+            chunksize=taille_bloc,
+            encoding='utf-8'
+        )
+        for bloc in lecteur:
+            lignes += len(bloc)
+
+            mois = bloc['Date'].str.slice(0, 7)
+            valides = mois.str.fullmatch(r'\d{4}-\d{2}').fillna(False) & bloc['Montant'].notna()
+            lignes_ignorees += int((~valides).sum())
+            bloc = bloc[valides].assign(mois=mois[valides])
+
+            # Dépenses rattachées à un projet (montants négatifs dans l'export)
+            est_depense = (bloc['Nature'] == NATURE_DEPENSE) & bloc['Projet'].notna()
+            partiel = (
+                bloc.loc[est_depense, 'Montant'].abs()
+                .groupby([bloc.loc[est_depense, 'Projet'], bloc.loc[est_depense, 'mois']], observed=True)
+                .sum()
+            )
+            depenses = _cumuler(depenses, partiel, [0, 1])
+
+            # Revenus par source
+            est_revenu = (bloc['Nature'] == NATURE_REVENU) & bloc['Source'].notna()
+            lignes_revenus = bloc[est_revenu]
+            partiel = lignes_revenus.groupby(['Source', 'mois'], observed=True)['Montant'].sum()
+            revenus = _cumuler(revenus, partiel, [0, 1])
+            partiel = lignes_revenus.groupby(['Source', 'Categorie'], observed=True)['Montant'].sum()
+            categories = _cumuler(categories, partiel, [0, 1])
+
+            if progression is not None:
+                position = fichier.tell() if hasattr(fichier, 'tell') else None
+                fraction = position / taille if position is not None and taille else 0.0
+                progression(min(fraction, 1.0), lignes)
+    finally:
+        if fichier is not source:
+            fichier.close()
+
+    if progression is not None:
+        progression(1.0, lignes)
+
+    return {
+        'lignes': lignes,
+        'lignes_ignorees': lignes_ignorees,
+        'depenses': _vers_table(depenses, ['projet', 'mois', 'montant']),
+        'revenus': _vers_table(revenus, ['source', 'mois', 'montant']),
+        'categories_revenus': _categorie_principale(categories),
+    }
+
+
+def _vers_table(serie, colonnes):
+    if serie is None:
+        return pd.DataFrame(columns=colonnes)
+    table = serie.reset_index()
+    table.columns = colonnes
+    table[colonnes[0]] = table[colonnes[0]].astype(str)
+    return table.sort_values(colonnes[:2], ignore_index=True)
+
+
+def _categorie_principale(serie):
+    """Catégorie représentant le plus gros montant pour chaque source de revenu"""
+    if serie is None:
+        return {}
+    table = serie.reset_index()
+    table.columns = ['source', 'categorie', 'montant']
+    table = table.sort_values('montant', ascending=False).drop_duplicates('source')
+    return dict(zip(table['source'].astype(str), table['categorie'].astype(str)))